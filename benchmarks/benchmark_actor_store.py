@@ -0,0 +1,60 @@
+from time import perf_counter
+from typing import List
+
+from nodes.actor import Actor
+from nodes.actor_store import ActorStore
+
+# Compares 10k moving actors:
+# - ActorStore, one vectorized move pass.
+# - Plain objects, one update call each.
+# Run from repo root: PYTHONPATH=src python -O benchmarks/<this file>.
+
+ACTORS_LEN: int = 10000
+FRAMES_LEN: int = 300
+DT: int = 16
+
+
+class PlainActor:
+    def __init__(self, x: float, y: float, vx: float, vy: float):
+        self.x: float = x
+        self.y: float = y
+        self.vx: float = vx
+        self.vy: float = vy
+
+    def update(self, dt: int) -> None:
+        seconds: float = dt / 1000
+        self.x += self.vx * seconds
+        self.y += self.vy * seconds
+
+
+def benchmark_store() -> float:
+    store: ActorStore = ActorStore(ACTORS_LEN)
+    for index in range(ACTORS_LEN):
+        actor: Actor = Actor(store, (index % 320, index % 160), (16, 16))
+        actor.set_velocity(30, -30)
+
+    start: float = perf_counter()
+    for _ in range(FRAMES_LEN):
+        store.update(DT)
+    return (perf_counter() - start) / FRAMES_LEN * 1000
+
+
+def benchmark_plain() -> float:
+    actors: List[PlainActor] = [
+        PlainActor(index % 320, index % 160, 30, -30)
+        for index in range(ACTORS_LEN)
+    ]
+
+    start: float = perf_counter()
+    for _ in range(FRAMES_LEN):
+        for actor in actors:
+            actor.update(DT)
+    return (perf_counter() - start) / FRAMES_LEN * 1000
+
+
+store_ms: float = benchmark_store()
+plain_ms: float = benchmark_plain()
+print(f"{ACTORS_LEN} actors, {FRAMES_LEN} frames, ms per frame:")
+print(f"actor store: {store_ms:.3f}")
+print(f"plain update: {plain_ms:.3f}")
+print(f"speedup: {plain_ms / store_ms:.1f}x")
@@ -0,0 +1,128 @@
+from json import dump
+from os.path import join
+from tempfile import mkdtemp
+from time import perf_counter
+from typing import List
+from typing import Tuple
+
+from constants import JSONS_PATHS_DICT
+from constants import pg
+from constants import PNGS_PATHS_DICT
+from nodes.animation_player import AnimationPlayer
+
+# Compares 10k animated actors:
+# - AnimationPlayer, one vectorized update, one Surface.blits.
+# - Plain objects, one update and one blit each, frames copied per actor.
+# Writes a temp sheet and json, registers them in the paths dicts.
+# Run from repo root: PYTHONPATH=src python -O benchmarks/<this file>.
+
+ACTORS_LEN: int = 10000
+FRAMES_LEN: int = 300
+DT: int = 16
+FRAME_SIZE: int = 16
+SHEET_FRAMES_LEN: int = 8
+FRAME_DURATION: int = 100
+
+
+class PlainAnimation:
+    def __init__(self, frames: List[pg.Surface], offset: int):
+        self.frames: List[pg.Surface] = [frame.copy() for frame in frames]
+        self.frame_index: int = offset % len(frames)
+        self.elapsed: int = 0
+
+    def update(self, dt: int) -> None:
+        self.elapsed += dt
+        while self.elapsed >= FRAME_DURATION:
+            self.elapsed -= FRAME_DURATION
+            self.frame_index = (self.frame_index + 1) % len(self.frames)
+
+
+def make_sheet_json() -> None:
+    temp_dir: str = mkdtemp()
+    sheet_surf: pg.Surface = pg.Surface(
+        (FRAME_SIZE * SHEET_FRAMES_LEN, FRAME_SIZE), pg.SRCALPHA
+    )
+    for index in range(SHEET_FRAMES_LEN):
+        sheet_surf.fill(
+            (index * 30, 100, 200, 255),
+            (index * FRAME_SIZE, 0, FRAME_SIZE, FRAME_SIZE),
+        )
+    PNGS_PATHS_DICT["benchmark_sheet.png"] = join(temp_dir, "sheet.png")
+    pg.image.save(sheet_surf, PNGS_PATHS_DICT["benchmark_sheet.png"])
+
+    JSONS_PATHS_DICT["benchmark_animation.json"] = join(
+        temp_dir, "animation.json"
+    )
+    with open(JSONS_PATHS_DICT["benchmark_animation.json"], "w") as json_file:
+        dump(
+            {
+                "sprite_sheet": "benchmark_sheet.png",
+                "frame_width": FRAME_SIZE,
+                "frame_height": FRAME_SIZE,
+                "animations": {
+                    "idle": {
+                        "frames": list(range(SHEET_FRAMES_LEN)),
+                        "durations": FRAME_DURATION,
+                        "is_loop": True,
+                    },
+                },
+            },
+            json_file,
+        )
+
+
+def benchmark_player(
+    surf: pg.Surface, positions: List[Tuple[float, float]]
+) -> Tuple[float, float]:
+    player: AnimationPlayer = AnimationPlayer("benchmark_animation.json")
+    slots: List[int] = [player.add_actor("idle") for _ in range(ACTORS_LEN)]
+
+    update_s: float = 0.0
+    draw_s: float = 0.0
+    for _ in range(FRAMES_LEN):
+        start: float = perf_counter()
+        player.update(DT)
+        update_s += perf_counter() - start
+
+        start = perf_counter()
+        surf.blits(player.get_blit_sequence(slots, positions), False)
+        draw_s += perf_counter() - start
+    return update_s / FRAMES_LEN * 1000, draw_s / FRAMES_LEN * 1000
+
+
+def benchmark_plain(
+    surf: pg.Surface, positions: List[Tuple[float, float]]
+) -> Tuple[float, float]:
+    frames: List[pg.Surface] = AnimationPlayer.sheets_frames[
+        ("benchmark_sheet.png", FRAME_SIZE, FRAME_SIZE)
+    ]
+    animations: List[PlainAnimation] = [
+        PlainAnimation(frames, index) for index in range(ACTORS_LEN)
+    ]
+
+    update_s: float = 0.0
+    draw_s: float = 0.0
+    for _ in range(FRAMES_LEN):
+        start: float = perf_counter()
+        for animation in animations:
+            animation.update(DT)
+        update_s += perf_counter() - start
+
+        start = perf_counter()
+        for animation, position in zip(animations, positions):
+            surf.blit(animation.frames[animation.frame_index], position)
+        draw_s += perf_counter() - start
+    return update_s / FRAMES_LEN * 1000, draw_s / FRAMES_LEN * 1000
+
+
+pg.display.set_mode((1, 1))
+make_sheet_json()
+surf: pg.Surface = pg.Surface((320, 160))
+positions: List[Tuple[float, float]] = [
+    (index % 320, index % 160) for index in range(ACTORS_LEN)
+]
+player_update_ms, player_draw_ms = benchmark_player(surf, positions)
+plain_update_ms, plain_draw_ms = benchmark_plain(surf, positions)
+print(f"{ACTORS_LEN} actors, {FRAMES_LEN} frames, ms per frame:")
+print(f"player: update {player_update_ms:.3f}, draw {player_draw_ms:.3f}")
+print(f"plain: update {plain_update_ms:.3f}, draw {plain_draw_ms:.3f}")
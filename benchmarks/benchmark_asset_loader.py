@@ -0,0 +1,86 @@
+from os import cpu_count
+from os.path import join
+from random import Random
+from tempfile import mkdtemp
+from time import perf_counter
+from typing import List
+from wave import open as open_wave
+
+import numpy as np
+from constants import MIXER_CHANNELS
+from constants import MIXER_FREQUENCY
+from constants import pg
+from constants import PNGS_PATHS_DICT
+from constants import WAVS_PATHS_DICT
+from nodes.asset_loader import AssetLoader
+from nodes.atlas import Atlas
+from nodes.sound_manager import SoundManager
+
+# Load time of pngs and wavs by AssetLoader worker count.
+# 1 worker is about the serial main thread load.
+# Writes temp pngs and wavs, registers them in the paths dicts.
+# Run from repo root: PYTHONPATH=src python -O benchmarks/<this file>.
+# Scaling needs cores, see the printed cpu count.
+
+PNGS_LEN: int = 300
+PNG_SIZE: int = 128
+WAVS_LEN: int = 20
+WAV_SECONDS: float = 1.0
+WORKERS_LENS: List[int] = [1, 2, 4, 8]
+REPEATS_LEN: int = 3
+
+
+def make_assets(random: Random, temp_dir: str) -> None:
+    for index in range(PNGS_LEN):
+        surf: pg.Surface = pg.Surface((PNG_SIZE, PNG_SIZE))
+        for _ in range(50):
+            surf.fill(
+                (random.randrange(256), random.randrange(256), 0),
+                (
+                    random.randrange(PNG_SIZE),
+                    random.randrange(PNG_SIZE),
+                    random.randrange(40),
+                    random.randrange(40),
+                ),
+            )
+        PNGS_PATHS_DICT[f"benchmark_{index}.png"] = join(
+            temp_dir, f"{index}.png"
+        )
+        pg.image.save(surf, PNGS_PATHS_DICT[f"benchmark_{index}.png"])
+
+    samples_len: int = int(MIXER_FREQUENCY * WAV_SECONDS) * MIXER_CHANNELS
+    for index in range(WAVS_LEN):
+        WAVS_PATHS_DICT[f"benchmark_{index}.wav"] = join(
+            temp_dir, f"{index}.wav"
+        )
+        with open_wave(WAVS_PATHS_DICT[f"benchmark_{index}.wav"], "wb") as wav:
+            wav.setnchannels(MIXER_CHANNELS)
+            wav.setsampwidth(2)
+            wav.setframerate(MIXER_FREQUENCY)
+            wav.writeframes(
+                np.random.default_rng(index)
+                .integers(-3000, 3000, samples_len, np.int16)
+                .tobytes()
+            )
+
+
+def load_all(workers_len: int) -> float:
+    Atlas.clear()
+    sound_manager: SoundManager = SoundManager()
+    asset_loader: AssetLoader = AssetLoader(sound_manager, workers_len)
+    start: float = perf_counter()
+    for png_name in PNGS_PATHS_DICT:
+        asset_loader.add_png(png_name)
+    for wav_name in WAVS_PATHS_DICT:
+        asset_loader.add_wav(wav_name)
+    asset_loader.wait()
+    return (perf_counter() - start) * 1000
+
+
+pg.display.set_mode((320, 180))
+make_assets(Random(0), mkdtemp())
+
+print(f"cpus: {cpu_count()}, mixer: {pg.mixer.get_init() is not None}")
+for workers_len in WORKERS_LENS:
+    total_ms: float = sum(load_all(workers_len) for _ in range(REPEATS_LEN))
+    print(f"{workers_len} workers: {total_ms / REPEATS_LEN:.1f} ms")
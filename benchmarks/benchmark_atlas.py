@@ -0,0 +1,106 @@
+from os.path import join
+from random import Random
+from tempfile import mkdtemp
+from time import perf_counter
+from typing import Any
+from typing import Dict
+from typing import List
+from typing import Tuple
+
+from constants import JSONS_PATHS_DICT
+from constants import pg
+from constants import PNGS_PATHS_DICT
+from nodes.atlas import Atlas
+from nodes.atlas_packer import AtlasPacker
+
+# Compares loose pngs with an atlas:
+# - cold load, every png once, loose file opens vs one page.
+# - blits, every png per frame, loose surfs vs page subsurfaces vs page
+#   and area rect.
+# Writes temp pngs, pages and index, registers them in the paths dicts.
+# Run from repo root: PYTHONPATH=src python -O benchmarks/<this file>.
+
+PNGS_LEN: int = 400
+MIN_SIZE: int = 8
+MAX_SIZE: int = 64
+FRAMES_LEN: int = 200
+REPEATS_LEN: int = 5
+
+
+def make_pngs(random: Random, temp_dir: str) -> Dict[str, str]:
+    paths_dict: Dict[str, str] = {}
+    for index in range(PNGS_LEN):
+        surf: pg.Surface = pg.Surface(
+            (
+                random.randint(MIN_SIZE, MAX_SIZE),
+                random.randint(MIN_SIZE, MAX_SIZE),
+            ),
+            pg.SRCALPHA,
+        )
+        surf.fill((index % 256, 100, 200, 255))
+        paths_dict[f"benchmark_{index}.png"] = join(temp_dir, f"{index}.png")
+        pg.image.save(surf, paths_dict[f"benchmark_{index}.png"])
+    return paths_dict
+
+
+def load_loose(names: List[str]) -> List[pg.Surface]:
+    return [
+        pg.image.load(PNGS_PATHS_DICT[name]).convert_alpha() for name in names
+    ]
+
+
+def load_atlas(names: List[str]) -> List[pg.Surface]:
+    Atlas.clear()
+    return [Atlas.get_surf(name) for name in names]
+
+
+def time_blits(sequence: List[Tuple[Any, ...]]) -> float:
+    start: float = perf_counter()
+    for _ in range(FRAMES_LEN):
+        window_surf.blits(sequence, False)
+    return perf_counter() - start
+
+
+window_surf: pg.Surface = pg.display.set_mode((320, 180))
+random: Random = Random(0)
+temp_dir: str = mkdtemp()
+paths_dict: Dict[str, str] = make_pngs(random, temp_dir)
+PNGS_PATHS_DICT.update(paths_dict)
+names: List[str] = list(paths_dict)
+
+JSONS_PATHS_DICT["atlas.json"] = join(temp_dir, "atlas.json")
+start: float = perf_counter()
+AtlasPacker().build(
+    paths_dict, join(temp_dir, "atlas"), JSONS_PATHS_DICT["atlas.json"]
+)
+print(f"build: {(perf_counter() - start) * 1000:.1f} ms")
+
+loose_ms: float = 0.0
+atlas_ms: float = 0.0
+for _ in range(REPEATS_LEN):
+    start = perf_counter()
+    loose_surfs: List[pg.Surface] = load_loose(names)
+    loose_ms += (perf_counter() - start) * 1000
+
+    start = perf_counter()
+    atlas_surfs: List[pg.Surface] = load_atlas(names)
+    atlas_ms += (perf_counter() - start) * 1000
+
+print(f"pages: {len(Atlas.page_paths)}")
+print(f"cold load loose: {loose_ms / REPEATS_LEN:.1f} ms")
+print(f"cold load atlas: {atlas_ms / REPEATS_LEN:.1f} ms")
+
+positions: List[Tuple[int, int]] = [
+    (random.randint(0, 300), random.randint(0, 140)) for _ in names
+]
+blits_len: int = PNGS_LEN * FRAMES_LEN
+loose_s: float = time_blits(list(zip(loose_surfs, positions)))
+print(f"blits loose: {blits_len / loose_s:,.0f} per s")
+atlas_s: float = time_blits(list(zip(atlas_surfs, positions)))
+print(f"blits atlas subsurface: {blits_len / atlas_s:,.0f} per s")
+area_sequence: List[Tuple[Any, ...]] = []
+for name, position in zip(names, positions):
+    page_surf, area = Atlas.get_area(name)
+    area_sequence.append((page_surf, position, area))
+area_s: float = time_blits(area_sequence)
+print(f"blits atlas area: {blits_len / area_s:,.0f} per s")
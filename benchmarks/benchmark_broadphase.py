@@ -0,0 +1,114 @@
+from time import perf_counter
+from typing import List
+from typing import Tuple
+from typing import Type
+
+import numpy as np
+from constants import pg
+from nodes.broadphase import Broadphase
+from nodes.quadtree import QuadTree
+from nodes.spatial_hash import SpatialHash
+
+# Compares broadphase backends on uniform and clustered actors:
+# - rebuild, every rect from a NumPy array.
+# - update, a share of actors move a bit.
+# - query, one small rect around every actor.
+# Also checks every backend returns the same keys.
+# Run from repo root: PYTHONPATH=src python -O benchmarks/<this file>.
+
+ROOM_WIDTH: int = 960
+ROOM_HEIGHT: int = 480
+ACTORS_LEN: int = 4000
+ACTOR_SIZE: int = 8
+CLUSTERS_LEN: int = 8
+CLUSTER_RADIUS: float = 48.0
+MOVERS_SHARE: float = 0.25
+MOVE_DISTANCE: int = 4
+QUERY_MARGIN: int = 8
+FRAMES_LEN: int = 10
+BACKENDS: List[Type[Broadphase]] = [QuadTree, SpatialHash]
+
+
+def make_rects(is_clustered: bool) -> np.ndarray:
+    random: np.random.Generator = np.random.default_rng(0)
+    if is_clustered:
+        centers: np.ndarray = random.uniform(
+            (0, 0), (ROOM_WIDTH, ROOM_HEIGHT), (CLUSTERS_LEN, 2)
+        )
+        positions: np.ndarray = centers[
+            random.integers(0, CLUSTERS_LEN, ACTORS_LEN)
+        ] + random.normal(0, CLUSTER_RADIUS, (ACTORS_LEN, 2))
+    else:
+        positions = random.uniform(
+            (0, 0), (ROOM_WIDTH, ROOM_HEIGHT), (ACTORS_LEN, 2)
+        )
+    positions = np.clip(
+        positions, 0, (ROOM_WIDTH - ACTOR_SIZE, ROOM_HEIGHT - ACTOR_SIZE)
+    )
+    rects: np.ndarray = np.full((ACTORS_LEN, 4), ACTOR_SIZE, np.int64)
+    rects[:, :2] = positions
+    return rects
+
+
+def run(
+    backend: Type[Broadphase], rects: np.ndarray
+) -> Tuple[float, float, float, List[List[int]]]:
+    broadphase: Broadphase = backend(pg.Rect(0, 0, ROOM_WIDTH, ROOM_HEIGHT))
+    movers_len: int = int(ACTORS_LEN * MOVERS_SHARE)
+    rect_list: List[pg.Rect] = [
+        pg.Rect(x, y, width, height) for x, y, width, height in rects.tolist()
+    ]
+    query_rects: List[pg.Rect] = [
+        rect.inflate(QUERY_MARGIN * 2, QUERY_MARGIN * 2) for rect in rect_list
+    ]
+
+    rebuild_ms: float = 0.0
+    update_ms: float = 0.0
+    query_ms: float = 0.0
+    results: List[List[int]] = []
+    for frame in range(FRAMES_LEN):
+        start: float = perf_counter()
+        broadphase.rebuild(rects)
+        rebuild_ms += perf_counter() - start
+
+        # Query rects are from the rects the rebuild used.
+        start = perf_counter()
+        results = [
+            sorted(broadphase.query(query_rect)) for query_rect in query_rects
+        ]
+        query_ms += perf_counter() - start
+
+        # Rebuild made its own rects, movers go through update.
+        step: int = MOVE_DISTANCE if frame % 2 == 0 else -MOVE_DISTANCE
+        start = perf_counter()
+        for key in range(movers_len):
+            old_rect: pg.Rect = rect_list[key]
+            new_rect: pg.Rect = old_rect.move(step, step)
+            broadphase.update(key, old_rect, new_rect)
+            rect_list[key] = new_rect
+        update_ms += perf_counter() - start
+
+    return (
+        rebuild_ms / FRAMES_LEN * 1000,
+        update_ms / FRAMES_LEN * 1000,
+        query_ms / FRAMES_LEN * 1000,
+        results,
+    )
+
+
+print(f"{ACTORS_LEN} actors, {FRAMES_LEN} frames, ms per frame:")
+for is_clustered in [False, True]:
+    rects: np.ndarray = make_rects(is_clustered)
+    expected: List[List[int]] = []
+    for backend in BACKENDS:
+        rebuild_ms, update_ms, query_ms, results = run(backend, rects)
+        if not expected:
+            expected = results
+        print(
+            f"{'clustered' if is_clustered else 'uniform'} "
+            f"{backend.__name__}: "
+            f"rebuild {rebuild_ms:.2f} | "
+            f"update {update_ms:.2f} | "
+            f"query {query_ms:.2f} | "
+            f"same keys {results == expected}"
+        )
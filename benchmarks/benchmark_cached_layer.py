@@ -0,0 +1,89 @@
+from time import perf_counter
+from typing import Callable
+
+from constants import NATIVE_HEIGHT
+from constants import NATIVE_SURF
+from constants import NATIVE_WIDTH
+from constants import pg
+from nodes.cached_layer import CachedLayer
+from nodes.game import Game
+from nodes.options_menu import OptionsMenu
+from scenes.main_menu import MainMenu
+
+# Menu draws with and without cached layers, us per frame:
+# - main menu background, atlas surf with per pixel alpha vs opaque
+#   layer, rendered once.
+# - options menu labels drawn each frame vs a transparent layer, plain
+#   and RLE, on clean frames and on frames where a label changed. Then
+#   how many clean frames a change needs to pay off.
+# OptionsMenu draws its labels each frame, flip it to a layer only if
+# changes are rarer than the break even.
+# Run from repo root with SDL_VIDEODRIVER=dummy for no window:
+# PYTHONPATH=src python -O benchmarks/<this file>.
+
+FRAMES_LEN: int = 2000
+
+
+def time_us(draw: Callable[[], None]) -> float:
+    draw()
+    start: float = perf_counter()
+    for _ in range(FRAMES_LEN):
+        draw()
+    return (perf_counter() - start) * 1e6 / FRAMES_LEN
+
+
+game: Game = Game("MainMenu")
+main_menu: MainMenu = game.current_scene
+options_menu: OptionsMenu = OptionsMenu(game)
+curtain_surf: pg.Surface = options_menu.curtain.surf
+
+
+def draw_main_menu_uncached() -> None:
+    NATIVE_SURF.blit(main_menu.background_surf, (0, 0))
+
+
+def draw_main_menu_cached() -> None:
+    main_menu.background_layer.draw(NATIVE_SURF)
+
+
+uncached_us: float = time_us(draw_main_menu_uncached)
+cached_us: float = time_us(draw_main_menu_cached)
+print(
+    f"main menu: {uncached_us:6.1f} us uncached, "
+    f"{cached_us:6.1f} us cached, {uncached_us / cached_us:4.1f}x"
+)
+
+
+def draw_labels_uncached() -> None:
+    options_menu.draw_labels(curtain_surf)
+
+
+labels_us: float = time_us(draw_labels_uncached)
+print(f"options labels: {labels_us:6.1f} us uncached")
+
+for name, is_rle in [("plain", False), ("rle", True)]:
+    layer: CachedLayer = CachedLayer(
+        (NATIVE_WIDTH, NATIVE_HEIGHT), True, is_rle=is_rle
+    )
+    layer.add_child(options_menu.draw_labels)
+
+    def draw_clean() -> None:
+        layer.draw(curtain_surf)
+
+    def draw_dirty() -> None:
+        layer.set_dirty()
+        layer.draw(curtain_surf)
+
+    clean_us: float = time_us(draw_clean)
+    dirty_us: float = time_us(draw_dirty)
+    break_even: str = "never pays off"
+    if clean_us < labels_us:
+        frames: float = (dirty_us - labels_us) / (labels_us - clean_us)
+        break_even = f"pays off under 1 change per {frames:.0f} frames"
+    print(
+        f"options labels {name} layer: {clean_us:6.1f} us clean, "
+        f"{dirty_us:6.1f} us dirty, {break_even}"
+    )
+
+game.quit()
+pg.quit()
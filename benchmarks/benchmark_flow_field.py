@@ -0,0 +1,75 @@
+from random import Random
+from time import perf_counter
+from typing import List
+from typing import Tuple
+
+import numpy as np
+from constants import TILE_HEIGHT
+from constants import TILE_WIDTH
+from nodes.flow_field import FlowField
+from nodes.pathfinder import Pathfinder
+from nodes.tile_grid import TileGrid
+
+# Compares a horde chasing the player:
+# - FlowField, one field build, every enemy samples it at once.
+# - Pathfinder, one path search per enemy, cache off.
+# Run from repo root: PYTHONPATH=src python -O benchmarks/<this file>.
+
+COLS: int = 80
+ROWS: int = 45
+SOLIDS_SHARE: float = 0.2
+ENEMIES_LEN: int = 1000
+PATHS_LEN: int = 50
+
+
+def make_grid(random: Random) -> TileGrid:
+    grid: TileGrid = TileGrid(COLS, ROWS)
+    for _ in range(int(COLS * ROWS * SOLIDS_SHARE)):
+        grid.set_tile(
+            random.randrange(COLS), random.randrange(ROWS), TileGrid.SOLID
+        )
+    grid.set_tile(COLS // 2, ROWS // 2, TileGrid.EMPTY)
+    return grid
+
+
+def make_enemy_cells(grid: TileGrid, random: Random) -> List[Tuple[int, int]]:
+    cells: List[Tuple[int, int]] = [
+        (col, row)
+        for row in range(ROWS)
+        for col in range(COLS)
+        if grid.get_tile(col, row) != TileGrid.SOLID
+    ]
+    return [random.choice(cells) for _ in range(ENEMIES_LEN)]
+
+
+random: Random = Random(0)
+grid: TileGrid = make_grid(random)
+enemy_cells: List[Tuple[int, int]] = make_enemy_cells(grid, random)
+target_x: float = (COLS // 2 + 0.5) * TILE_WIDTH
+target_y: float = (ROWS // 2 + 0.5) * TILE_HEIGHT
+xs: np.ndarray = (np.array([col for col, _ in enemy_cells]) + 0.5) * TILE_WIDTH
+ys: np.ndarray = (
+    np.array([row for _, row in enemy_cells]) + 0.5
+) * TILE_HEIGHT
+
+flow_field: FlowField = FlowField(grid)
+start: float = perf_counter()
+flow_field.set_target(target_x, target_y)
+flow_field.build_now()
+build_ms: float = (perf_counter() - start) * 1000
+
+start = perf_counter()
+flow_field.get_directions(xs, ys)
+sample_ms: float = (perf_counter() - start) * 1000
+
+# Only a few paths, per enemy time is scaled up.
+pathfinder: Pathfinder = Pathfinder(grid, cache_size=0)
+goal: Tuple[int, int] = Pathfinder.get_cell(target_x, target_y)
+start = perf_counter()
+for cell in enemy_cells[:PATHS_LEN]:
+    pathfinder.find_path(cell, goal)
+paths_ms: float = (perf_counter() - start) * 1000 / PATHS_LEN * ENEMIES_LEN
+
+print(f"{COLS}x{ROWS} tiles, {ENEMIES_LEN} enemies, ms:")
+print(f"flow field: build {build_ms:.3f}, sample all {sample_ms:.3f}")
+print(f"path per enemy: {paths_ms:.3f}")
@@ -0,0 +1,70 @@
+from random import Random
+from time import perf_counter
+from time import process_time
+from typing import List
+
+from constants import pg
+from constants import WINDOW_HEIGHT
+from constants import WINDOW_WIDTH
+from nodes.frame_pacer import FramePacer
+from nodes.presenter import Presenter
+from nodes.profiler import Profiler
+
+# Frame pacing modes at each target, frames with random work:
+# - mean frame ms, should be 1000 / target.
+# - jitter, frame ms standard deviation, lower is smoother.
+# - worst, frame ms furthest from the mean.
+# - cpu, process time over wall time, spinning costs it.
+# The dummy driver has no vsync, there VSYNC is HYBRID.
+# Run from repo root with SDL_VIDEODRIVER=dummy for no window:
+# PYTHONPATH=src python -O benchmarks/<this file>.
+
+FRAMES_LEN: int = 240
+TARGETS: List[int] = [30, 60, 120]
+MIN_WORK_MS: float = 1.0
+MAX_WORK_MS: float = 6.0
+
+
+def work(ms: float) -> None:
+    end: float = perf_counter() + ms / 1000
+    while perf_counter() < end:
+        pass
+
+
+def run(mode: int, fps_target: int) -> None:
+    random: Random = Random(0)
+    profiler: Profiler = Profiler()
+    presenter: Presenter = Presenter(profiler)
+    frame_pacer: FramePacer = FramePacer(presenter, profiler, fps_target, mode)
+    presenter.set_mode((WINDOW_WIDTH, WINDOW_HEIGHT))
+
+    frame_pacer.tick()
+    wall_start: float = perf_counter()
+    cpu_start: float = process_time()
+    frame_ms: List[float] = []
+    last: float = perf_counter()
+    for _ in range(FRAMES_LEN):
+        work(random.uniform(MIN_WORK_MS, MAX_WORK_MS))
+        presenter.present(1)
+        frame_pacer.tick()
+        now: float = perf_counter()
+        frame_ms.append((now - last) * 1000)
+        last = now
+    cpu: float = (process_time() - cpu_start) / (perf_counter() - wall_start)
+
+    mean: float = sum(frame_ms) / len(frame_ms)
+    jitter: float = (
+        sum((ms - mean) ** 2 for ms in frame_ms) / len(frame_ms)
+    ) ** 0.5
+    worst: float = max(abs(ms - mean) for ms in frame_ms)
+    print(
+        f"{FramePacer.mode_names[mode]:>6} {fps_target:>3} fps: "
+        f"{mean:6.2f} ms mean, {jitter:5.2f} ms jitter, "
+        f"{worst:5.2f} ms worst, {cpu:4.0%} cpu"
+    )
+
+
+for fps_target in TARGETS:
+    for mode in range(len(FramePacer.mode_names)):
+        run(mode, fps_target)
+pg.quit()
@@ -0,0 +1,37 @@
+from os import cpu_count
+from os import environ
+from typing import Any
+from typing import Dict
+from typing import List
+
+# Frames per second across sessions by HeadlessRunner worker count.
+# Near linear up to the core count, flat past it.
+# Run from repo root: PYTHONPATH=src python -O benchmarks/<this file>.
+
+SESSIONS_LEN: int = 8
+FRAMES_LEN: int = 300
+WORKERS_LENS: List[int] = [1, 2, 4, 8]
+
+if __name__ == "__main__":
+    # Dummy SDL drivers before constants runs pg.init.
+    environ.setdefault("SDL_VIDEODRIVER", "dummy")
+    environ.setdefault("SDL_AUDIODRIVER", "dummy")
+    from nodes.headless_runner import HeadlessRunner
+
+    sessions: List[Dict[str, Any]] = [
+        {
+            "initial_scene": "CreatedBySplashScreen",
+            "frames": FRAMES_LEN,
+            "inputs": [
+                [frame, "down", "enter"] for frame in range(0, 300, 60)
+            ],
+        }
+        for _ in range(SESSIONS_LEN)
+    ]
+    print(f"cpus: {cpu_count()}")
+    for workers_len in WORKERS_LENS:
+        report: Dict[str, Any] = HeadlessRunner(workers_len).run(sessions)
+        print(
+            f"{workers_len} workers: {report['frames_per_second']:.0f} fps, "
+            f"{report['failed_len']} failed"
+        )
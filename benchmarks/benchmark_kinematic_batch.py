@@ -0,0 +1,98 @@
+from time import perf_counter
+from typing import List
+
+import numpy as np
+from nodes.kinematic_batch import KinematicBatch
+from nodes.kinematic_body import KinematicBody
+from nodes.tile_grid import TileGrid
+
+# AI rollouts, K envs of one body with random actions, env steps per
+# second, K KinematicBody updates vs one step.
+# tests/test_kinematic_batch.py checks both match.
+# Run from repo root: PYTHONPATH=src python -O benchmarks/<this file>.
+
+COLS: int = 40
+ROWS: int = 20
+BODY_SIZE: tuple[int, int] = (12, 14)
+MATCH_ENVS_LEN: int = 64
+MATCH_FRAMES_LEN: int = 600
+ENVS_LENS: List[int] = [1, 64, 1024, 4096]
+FRAMES_LEN: int = 100
+
+
+def make_tiles(rng: np.random.Generator) -> np.ndarray:
+    """
+    Floor, slopes, a one way platform, walls and steps, shuffled a bit.
+    """
+
+    tiles: np.ndarray = np.zeros((ROWS, COLS), np.uint8)
+    tiles[15:] = TileGrid.SOLID
+    shift: int = int(rng.integers(0, 4))
+    up_rights: slice = slice(5 + shift, 10 + shift)
+    up_lefts: slice = slice(20 - shift, 25 - shift)
+    tiles[14, up_rights] = TileGrid.SLOPE_UP_RIGHT
+    tiles[14, up_lefts] = TileGrid.SLOPE_UP_LEFT
+    tiles[10, 12:18] = TileGrid.ONE_WAY
+    tiles[12:15, 30 + shift] = TileGrid.SOLID
+    tiles[14, 34] = TileGrid.SOLID
+    tiles[8, 0:COLS:7] = TileGrid.SOLID
+    return tiles
+
+
+def get_actions(rng: np.random.Generator, envs_len: int) -> np.ndarray:
+    return rng.integers(0, 16, envs_len)
+
+
+def act(body: KinematicBody, action: int) -> None:
+    """
+    Action bit flags to KinematicBody input, like KinematicBody.event.
+    """
+
+    body.direction = 0
+    if action & KinematicBatch.LEFT:
+        body.direction -= 1
+    if action & KinematicBatch.RIGHT:
+        body.direction += 1
+    body.is_jump_just_pressed = bool(action & KinematicBatch.JUMP_PRESS)
+    body.is_jump_just_released = bool(action & KinematicBatch.JUMP_RELEASE)
+
+
+def make_bodies(tiles: np.ndarray, envs_len: int) -> List[KinematicBody]:
+    bodies: List[KinematicBody] = []
+    for env in range(envs_len):
+        grid: TileGrid = TileGrid(COLS, ROWS)
+        grid.set_tiles(tiles[env % len(tiles)])
+        bodies.append(KinematicBody(grid, (100.0, 150.0), BODY_SIZE))
+    return bodies
+
+
+def run_bodies(envs_len: int) -> float:
+    rng: np.random.Generator = np.random.default_rng(1)
+    bodies: List[KinematicBody] = make_bodies(make_tiles(rng)[None], envs_len)
+    start: float = perf_counter()
+    for _ in range(FRAMES_LEN):
+        actions: np.ndarray = get_actions(rng, envs_len)
+        for body, action in zip(bodies, actions.tolist()):
+            act(body, action)
+            body.update(16)
+    return envs_len * FRAMES_LEN / (perf_counter() - start)
+
+
+def run_batch(envs_len: int) -> float:
+    rng: np.random.Generator = np.random.default_rng(1)
+    tiles: np.ndarray = make_tiles(rng)[None]
+    batch: KinematicBatch = KinematicBatch(
+        make_bodies(tiles, 1)[0], envs_len, tiles
+    )
+    start: float = perf_counter()
+    for _ in range(FRAMES_LEN):
+        batch.step(get_actions(rng, envs_len))
+    return envs_len * FRAMES_LEN / (perf_counter() - start)
+
+
+for envs_len in ENVS_LENS:
+    print(
+        f"{envs_len} envs: "
+        f"bodies {run_bodies(envs_len):,.0f} steps/s, "
+        f"batch {run_batch(envs_len):,.0f} steps/s"
+    )
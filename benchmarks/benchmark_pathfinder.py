@@ -0,0 +1,93 @@
+from random import Random
+from time import perf_counter
+from typing import List
+from typing import Tuple
+
+from nodes.path_search import PathSearch
+from nodes.pathfinder import Pathfinder
+from nodes.tile_grid import TileGrid
+
+# Compares path searches on a random room:
+# - plain A* vs jump point search, ms and expanded cells per path.
+# - Pathfinder with a warm cache, enemies asking for the same paths.
+# Run from repo root: PYTHONPATH=src python -O benchmarks/<this file>.
+
+COLS: int = 80
+ROWS: int = 45
+SOLIDS_SHARE: float = 0.2
+PATHS_LEN: int = 200
+ENEMIES_LEN: int = 50
+FRAMES_LEN: int = 60
+
+
+def make_grid(random: Random) -> TileGrid:
+    grid: TileGrid = TileGrid(COLS, ROWS)
+    for _ in range(int(COLS * ROWS * SOLIDS_SHARE)):
+        grid.set_tile(
+            random.randrange(COLS), random.randrange(ROWS), TileGrid.SOLID
+        )
+    return grid
+
+
+def make_pairs(
+    grid: TileGrid, random: Random
+) -> List[Tuple[Tuple[int, int], Tuple[int, int]]]:
+    cells: List[Tuple[int, int]] = [
+        (col, row)
+        for row in range(ROWS)
+        for col in range(COLS)
+        if grid.get_tile(col, row) != TileGrid.SOLID
+    ]
+    return [
+        (random.choice(cells), random.choice(cells)) for _ in range(PATHS_LEN)
+    ]
+
+
+def run_search(
+    grid: TileGrid,
+    pairs: List[Tuple[Tuple[int, int], Tuple[int, int]]],
+    is_jump: bool,
+) -> Tuple[float, float]:
+    walkables: List[List[bool]] = (grid.tiles != TileGrid.SOLID).tolist()
+    expanded_len: int = 0
+    start: float = perf_counter()
+    for path_start, path_goal in pairs:
+        search: PathSearch = PathSearch(
+            walkables, path_start, path_goal, is_jump
+        )
+        while search.state == PathSearch.SEARCHING:
+            search.step(1000)
+        expanded_len += search.expanded_len
+    ms: float = (perf_counter() - start) / PATHS_LEN * 1000
+    return ms, expanded_len / PATHS_LEN
+
+
+def run_cached(
+    grid: TileGrid, pairs: List[Tuple[Tuple[int, int], Tuple[int, int]]]
+) -> float:
+    """
+    Every enemy asks each frame, goals barely change.
+    """
+
+    pathfinder: Pathfinder = Pathfinder(grid)
+    start: float = perf_counter()
+    for frame in range(FRAMES_LEN):
+        for key in range(ENEMIES_LEN):
+            path_start, path_goal = pairs[(key + frame // 30) % PATHS_LEN]
+            pathfinder.request_path(key, path_start, path_goal)
+        pathfinder.update(16)
+    return (perf_counter() - start) / FRAMES_LEN * 1000
+
+
+random: Random = Random(0)
+grid: TileGrid = make_grid(random)
+pairs: List[Tuple[Tuple[int, int], Tuple[int, int]]] = make_pairs(grid, random)
+astar_ms, astar_expanded = run_search(grid, pairs, False)
+jump_ms, jump_expanded = run_search(grid, pairs, True)
+print(f"{COLS}x{ROWS} tiles, {PATHS_LEN} paths, per path:")
+print(f"a*: {astar_ms:.3f} ms, {astar_expanded:.0f} expanded")
+print(f"jump point: {jump_ms:.3f} ms, {jump_expanded:.0f} expanded")
+print(
+    f"{ENEMIES_LEN} enemies polling, "
+    f"{run_cached(grid, pairs):.3f} ms per frame"
+)
@@ -0,0 +1,97 @@
+from time import perf_counter
+from typing import Dict
+from typing import List
+
+import numpy as np
+from constants import NATIVE_HEIGHT
+from constants import NATIVE_SURF
+from constants import NATIVE_WIDTH
+from constants import pg
+from constants import WINDOW_HEIGHT
+from constants import WINDOW_WIDTH
+from nodes.presenter import Presenter
+from nodes.profiler import Profiler
+
+# Presenter backends, window at SCALE:
+# - surface, CPU scale on the main thread.
+# - threaded, CPU scale on the present thread.
+# - renderer, SDL renderer scales a streaming texture. With the dummy
+#   driver or no GPU that is the SDL software renderer.
+# Measures:
+# - frames per second, update and draw work plus present.
+# - latency, ms from present call to flip done.
+# - main thread ms spent in present.
+# Overlap needs a spare core, on one core threaded can only lose.
+# Run from repo root with SDL_VIDEODRIVER=dummy for no window:
+# PYTHONPATH=src python -O benchmarks/<this file>.
+
+SCALE: int = 6
+FRAMES_LEN: int = 300
+SPRITES_LEN: int = 400
+SPRITE_SIZE: int = 16
+
+
+def make_sprites() -> List[pg.Surface]:
+    sprites: List[pg.Surface] = []
+    for index in range(8):
+        sprite: pg.Surface = pg.Surface((SPRITE_SIZE, SPRITE_SIZE))
+        sprite.fill((index * 30, 255 - index * 30, 128))
+        sprites.append(sprite)
+    return sprites
+
+
+def run(is_threaded: bool, is_renderer: bool) -> Dict[str, float]:
+    rng: np.random.Generator = np.random.default_rng(0)
+    profiler: Profiler = Profiler()
+    presenter: Presenter = Presenter(profiler, is_threaded, is_renderer)
+    presenter.set_mode((WINDOW_WIDTH * SCALE, WINDOW_HEIGHT * SCALE))
+    sprites: List[pg.Surface] = make_sprites()
+    latencies: List[float] = []
+    present_ms: List[float] = []
+
+    start: float = perf_counter()
+    for _ in range(FRAMES_LEN):
+        # Update, plain Python work, holds the GIL.
+        positions: List[tuple[int, int]] = [
+            (int(x), int(y))
+            for x, y in rng.integers(
+                0, (NATIVE_WIDTH, NATIVE_HEIGHT), (SPRITES_LEN, 2)
+            )
+        ]
+
+        # Draw.
+        NATIVE_SURF.fill("black")
+        NATIVE_SURF.blits(
+            [
+                (sprites[index % len(sprites)], position)
+                for index, position in enumerate(positions)
+            ]
+        )
+
+        presenter.present(SCALE)
+        latencies.append(presenter.latency_ms)
+        present_ms.append(profiler.frame_ms["present"])
+        profiler.end_frame()
+    presenter.stop()
+    seconds: float = perf_counter() - start
+
+    return {
+        "fps": FRAMES_LEN / seconds,
+        "latency_ms": float(np.mean(latencies[2:])),
+        "present_ms": float(np.mean(present_ms)),
+    }
+
+
+# Renderer last, it opens its own window.
+for name, is_threaded, is_renderer in [
+    ("surface", False, False),
+    ("threaded", True, False),
+    ("renderer", False, True),
+]:
+    result: Dict[str, float] = run(is_threaded, is_renderer)
+    print(
+        f"{name}: "
+        f"{result['fps']:.0f} fps, "
+        f"{result['latency_ms']:.2f} ms latency, "
+        f"{result['present_ms']:.2f} ms in present"
+    )
@@ -0,0 +1,102 @@
+from random import Random
+from time import perf_counter
+from typing import List
+
+from constants import NATIVE_SURF
+from constants import pg
+from nodes.frame_pacer import FramePacer
+from nodes.particle_emitter import ParticleEmitter
+from nodes.presenter import Presenter
+from nodes.profiler import Profiler
+from nodes.quality_governor import QualityGovernor
+
+# Quality governor knobs, then the governor on a made up load:
+# - particle cap, ms per frame of a busy emitter at each level.
+# - made up frames of work ms, the particle ms measured above at the
+#   current level included. Prints every change, frame, knob, levels
+#   and p95, then frames over budget per phase, without and with it.
+# Run from repo root with SDL_VIDEODRIVER=dummy for no window:
+# PYTHONPATH=src python -O benchmarks/<this file>.
+
+BUDGET_MS: float = 1000 / 60
+
+# Busy emitter, particles per frame.
+CAPACITY: int = 4000
+EMITS_LEN: int = 70
+PARTICLE_FRAMES_LEN: int = 300
+
+# Frames and work ms without particles, light, heavy, light again.
+PHASES: List[tuple[int, float]] = [(300, 8.0), (900, 15.0), (1500, 8.0)]
+JITTER_MS: float = 1.5
+
+
+def time_particles(level: int) -> float:
+    ParticleEmitter.set_quality(level)
+    emitter: ParticleEmitter = ParticleEmitter(
+        CAPACITY, "#ffffff", 1000, 60, 30
+    )
+
+    # Fill up first.
+    for _ in range(60):
+        emitter.emit(EMITS_LEN, (160, 80))
+        emitter.update(16)
+
+    start: float = perf_counter()
+    for _ in range(PARTICLE_FRAMES_LEN):
+        emitter.emit(EMITS_LEN, (160, 80))
+        emitter.update(16)
+        emitter.draw(NATIVE_SURF)
+    ParticleEmitter.set_quality(0)
+    return (perf_counter() - start) * 1000 / PARTICLE_FRAMES_LEN
+
+
+def simulate(levels_ms: List[float], is_governed: bool) -> List[int]:
+    random: Random = Random(0)
+    profiler: Profiler = Profiler()
+    presenter: Presenter = Presenter(profiler)
+    frame_pacer: FramePacer = FramePacer(presenter, profiler, 60)
+    quality_governor: QualityGovernor = QualityGovernor(frame_pacer, profiler)
+    quality_governor.add_knob("particle cap", len(levels_ms), lambda _: None)
+
+    overs: List[int] = []
+    for frames_len, work_ms in PHASES:
+        over: int = 0
+        for _ in range(frames_len):
+            frame_pacer.work_ms = (
+                work_ms
+                + levels_ms[quality_governor.levels["particle cap"]]
+                + random.uniform(-JITTER_MS, JITTER_MS)
+            )
+            if frame_pacer.work_ms > BUDGET_MS:
+                over += 1
+            if is_governed:
+                quality_governor.end_frame()
+        overs.append(over)
+
+    if is_governed:
+        for change in quality_governor.log:
+            print(
+                f"frame {change['frame']:>4}: {change['knob']:<12} "
+                f"{change['from_level']} -> {change['to_level']}, "
+                f"p95 {change['p95_ms']:5.2f} ms, "
+                f"budget {change['budget_ms']:5.2f} ms"
+            )
+    return overs
+
+
+levels_ms: List[float] = [
+    time_particles(level)
+    for level in range(len(ParticleEmitter.QUALITY_CAP_FRACTIONS))
+]
+for level, ms in enumerate(levels_ms):
+    print(f"particle cap level {level}: {ms:.2f} ms per frame")
+
+without: List[int] = simulate(levels_ms, False)
+with_governor: List[int] = simulate(levels_ms, True)
+for index, (frames_len, work_ms) in enumerate(PHASES):
+    print(
+        f"phase {index}, {frames_len} frames of {work_ms} ms: "
+        f"{without[index]} over budget without, "
+        f"{with_governor[index]} with governor"
+    )
+pg.quit()
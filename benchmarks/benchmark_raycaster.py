@@ -0,0 +1,70 @@
+from random import Random
+from time import perf_counter
+from typing import List
+from typing import Tuple
+
+import numpy as np
+from constants import TILE_HEIGHT
+from constants import TILE_WIDTH
+from nodes.raycaster import Raycaster
+from nodes.tile_grid import TileGrid
+
+# Rays per second over a random room:
+# - single rays, plain python DDA.
+# - 360 ray visibility polygons, NumPy DDA.
+# - same polygon asked again in one frame, memo hits.
+# Run from repo root: PYTHONPATH=src python -O benchmarks/<this file>.
+
+COLS: int = 80
+ROWS: int = 45
+SOLIDS_SHARE: float = 0.1
+ORIGINS_LEN: int = 100
+RAYS_LEN: int = 360
+MAX_DISTANCE: float = 320.0
+REPEATS_LEN: int = 10
+
+
+def make_grid(random: Random) -> TileGrid:
+    grid: TileGrid = TileGrid(COLS, ROWS)
+    for _ in range(int(COLS * ROWS * SOLIDS_SHARE)):
+        grid.set_tile(
+            random.randrange(COLS), random.randrange(ROWS), TileGrid.SOLID
+        )
+    return grid
+
+
+random: Random = Random(0)
+grid: TileGrid = make_grid(random)
+raycaster: Raycaster = Raycaster(grid)
+origins: List[Tuple[float, float]] = [
+    (
+        random.uniform(0, COLS * TILE_WIDTH),
+        random.uniform(0, ROWS * TILE_HEIGHT),
+    )
+    for _ in range(ORIGINS_LEN)
+]
+angles: np.ndarray = np.linspace(0, 360, RAYS_LEN, endpoint=False)
+
+start: float = perf_counter()
+for x, y in origins:
+    for angle in angles.tolist():
+        raycaster.cast_ray_at_angle(x, y, angle, MAX_DISTANCE)
+single_s: float = perf_counter() - start
+raycaster.update(16)
+
+start = perf_counter()
+for x, y in origins:
+    raycaster.get_visibility_polygon(x, y, RAYS_LEN, MAX_DISTANCE)
+batched_s: float = perf_counter() - start
+
+start = perf_counter()
+for _ in range(REPEATS_LEN):
+    for x, y in origins:
+        raycaster.get_visibility_polygon(x, y, RAYS_LEN, MAX_DISTANCE)
+memo_s: float = perf_counter() - start
+
+rays_len: int = ORIGINS_LEN * RAYS_LEN
+print(f"{COLS}x{ROWS} tiles, {ORIGINS_LEN} origins x {RAYS_LEN} rays:")
+print(f"single rays: {rays_len / single_s:.0f} rays per s")
+print(f"batched polygons: {rays_len / batched_s:.0f} rays per s")
+print(f"memo polygons: {rays_len * REPEATS_LEN / memo_s:.0f} rays per s")
@@ -0,0 +1,74 @@
+from json import dump
+from os.path import join
+from random import Random
+from tempfile import mkdtemp
+from time import perf_counter
+from typing import List
+
+from constants import pg
+from nodes.resource_pack import ResourcePack
+
+# Startup load of many small assets:
+# - loose files, one open each.
+# - raw pack, one mmap, memoryview per entry.
+# - zlib pack, one mmap, decompress per entry.
+# Writes temp pngs and jsons, OS file cache is warm for all three.
+# Run from repo root: PYTHONPATH=src python -O benchmarks/<this file>.
+
+PNGS_LEN: int = 400
+JSONS_LEN: int = 100
+MIN_SIZE: int = 8
+MAX_SIZE: int = 64
+REPEATS_LEN: int = 5
+
+
+def make_assets(random: Random, temp_dir: str) -> List[str]:
+    paths: List[str] = []
+    for index in range(PNGS_LEN):
+        surf: pg.Surface = pg.Surface(
+            (
+                random.randint(MIN_SIZE, MAX_SIZE),
+                random.randint(MIN_SIZE, MAX_SIZE),
+            ),
+            pg.SRCALPHA,
+        )
+        surf.fill((index % 256, 100, 200, 255))
+        paths.append(join(temp_dir, f"{index}.png"))
+        pg.image.save(surf, paths[-1])
+    for index in range(JSONS_LEN):
+        paths.append(join(temp_dir, f"{index}.json"))
+        with open(paths[-1], "w") as json_file:
+            dump({"frames": list(range(random.randint(4, 64)))}, json_file)
+    return paths
+
+
+def load_all(paths: List[str]) -> float:
+    start: float = perf_counter()
+    for path in paths:
+        if path.endswith(".png"):
+            ResourcePack.load_image(path)
+        else:
+            ResourcePack.load_json(path)
+    return (perf_counter() - start) * 1000
+
+
+temp_dir: str = mkdtemp()
+paths: List[str] = make_assets(Random(0), temp_dir)
+raw_pack_path: str = join(temp_dir, "raw.pack")
+zlib_pack_path: str = join(temp_dir, "zlib.pack")
+ResourcePack.build(paths, raw_pack_path)
+ResourcePack.build(paths, zlib_pack_path, True)
+
+# No pack at this path, every load is loose.
+for name, pack_path in (
+    ("loose", join(temp_dir, "missing.pack")),
+    ("raw pack", raw_pack_path),
+    ("zlib pack", zlib_pack_path),
+):
+    total_ms: float = 0.0
+    for _ in range(REPEATS_LEN):
+        start: float = perf_counter()
+        ResourcePack.open(pack_path)
+        total_ms += (perf_counter() - start) * 1000 + load_all(paths)
+    print(f"{name}: {total_ms / REPEATS_LEN:.1f} ms")
+ResourcePack.close()
@@ -0,0 +1,100 @@
+from json import dump
+from os import makedirs
+from os import utime
+from os.path import join
+from tempfile import mkdtemp
+from time import perf_counter
+from tracemalloc import get_traced_memory
+from tracemalloc import start as start_tracing
+from tracemalloc import stop as stop_tracing
+from typing import Any
+from typing import Callable
+from typing import Dict
+from typing import Tuple
+
+import nodes.room_data
+import numpy as np
+from nodes.room_compiler import RoomCompiler
+from nodes.room_data import RoomData
+
+# Opening one huge room, 2000 x 2000 tiles, 2 layers:
+# - json parse, RoomData.load.
+# - first compile to the npy cache.
+# - cached open, npy mmap, then reading one screen of tiles.
+# - touched json, same hash, revalidated without compiling.
+# Peak is python traced memory while opening, mmap pages not counted.
+# Writes a temp room, points RoomData at it.
+# Run from repo root: PYTHONPATH=src python -O benchmarks/<this file>.
+
+ROOM_COLS: int = 2000
+ROOM_ROWS: int = 2000
+SCREEN_COLS: int = 20
+SCREEN_ROWS: int = 10
+
+
+def make_room(rooms_dir: str) -> None:
+    makedirs(rooms_dir, exist_ok=True)
+    rng: np.random.Generator = np.random.default_rng(0)
+    data: Dict[str, Any] = {
+        "cols": ROOM_COLS,
+        "rows": ROOM_ROWS,
+        "tiles": rng.integers(0, 2, (ROOM_ROWS, ROOM_COLS)).tolist(),
+        "layers": {
+            "background": rng.integers(
+                -1, 64, (ROOM_ROWS, ROOM_COLS)
+            ).tolist(),
+            "foreground": rng.integers(
+                -1, 64, (ROOM_ROWS, ROOM_COLS)
+            ).tolist(),
+        },
+        "neighbors": {},
+    }
+    with open(join(rooms_dir, "huge.json"), "w") as room_json:
+        dump(data, room_json)
+
+
+def measure(function: Callable[[], Any]) -> Tuple[Any, float, float]:
+    """
+    Result, ms, peak traced mb. Tracing is slow, so a second run.
+    """
+
+    start: float = perf_counter()
+    result: Any = function()
+    ms: float = (perf_counter() - start) * 1000
+
+    start_tracing()
+    function()
+    peak_mb: float = get_traced_memory()[1] / 1024 / 1024
+    stop_tracing()
+    return result, ms, peak_mb
+
+
+def read_screen(room: RoomData) -> int:
+    rows: slice = slice(ROOM_ROWS // 2, ROOM_ROWS // 2 + SCREEN_ROWS)
+    cols: slice = slice(ROOM_COLS // 2, ROOM_COLS // 2 + SCREEN_COLS)
+    return int(room.tiles[rows, cols].sum())
+
+
+nodes.room_data.ROOMS_DIR_PATH = join(mkdtemp(), "rooms")
+make_room(nodes.room_data.ROOMS_DIR_PATH)
+
+_, ms, peak_mb = measure(lambda: RoomData.load("huge"))
+print(f"json load: {ms:.0f} ms, peak {peak_mb:.0f} mb")
+
+start: float = perf_counter()
+RoomCompiler.compile("huge")
+print(f"compile: {(perf_counter() - start) * 1000:.0f} ms")
+
+room, ms, peak_mb = measure(lambda: RoomCompiler.load("huge"))
+print(f"cached open: {ms:.2f} ms, peak {peak_mb:.2f} mb")
+start = perf_counter()
+read_screen(room)
+print(f"read one screen: {(perf_counter() - start) * 1000:.3f} ms")
+
+utime(RoomData.get_path("huge"))
+start = perf_counter()
+RoomCompiler.load("huge")
+print(
+    f"touched json, revalidated by hash: "
+    f"{(perf_counter() - start) * 1000:.0f} ms"
+)
@@ -0,0 +1,127 @@
+from json import dump
+from os import makedirs
+from os.path import join
+from tempfile import mkdtemp
+from time import perf_counter
+from time import sleep
+from typing import Any
+from typing import Dict
+from typing import List
+
+import nodes.room_data
+import numpy as np
+from nodes.profiler import Profiler
+from nodes.room_data import RoomData
+from nodes.room_streamer import RoomStreamer
+
+# Room transition hitch, walking a grid of big json rooms:
+# - blocking, RoomData.load on the frame the player crosses.
+# - streamed, RoomStreamer swaps in the prefetched room.
+# Frames in between sleep like a 60 fps game, prefetch runs meanwhile.
+# Writes temp rooms, points RoomData at them.
+# Run from repo root: PYTHONPATH=src python -O benchmarks/<this file>.
+
+WORLD_COLS: int = 4
+WORLD_ROWS: int = 4
+ROOM_COLS: int = 320
+ROOM_ROWS: int = 180
+FRAMES_PER_ROOM: int = 30
+FRAME_S: float = 1 / 60
+SIDES: Dict[str, tuple[int, int]] = {
+    "left": (-1, 0),
+    "right": (1, 0),
+    "up": (0, -1),
+    "down": (0, 1),
+}
+
+
+def get_room_name(col: int, row: int) -> str:
+    return f"room_{col}_{row}"
+
+
+def make_world(rooms_dir: str) -> None:
+    makedirs(rooms_dir, exist_ok=True)
+    rng: np.random.Generator = np.random.default_rng(0)
+    for row in range(WORLD_ROWS):
+        for col in range(WORLD_COLS):
+            neighbors: Dict[str, str] = {
+                side: get_room_name(col + dx, row + dy)
+                for side, (dx, dy) in SIDES.items()
+                if 0 <= col + dx < WORLD_COLS and 0 <= row + dy < WORLD_ROWS
+            }
+            data: Dict[str, Any] = {
+                "cols": ROOM_COLS,
+                "rows": ROOM_ROWS,
+                "tiles": rng.integers(0, 2, (ROOM_ROWS, ROOM_COLS)).tolist(),
+                "layers": {
+                    "background": rng.integers(
+                        -1, 64, (ROOM_ROWS, ROOM_COLS)
+                    ).tolist()
+                },
+                "actors": [{"name": "fire", "x": 32, "y": 32}],
+                "neighbors": neighbors,
+            }
+            with open(
+                join(rooms_dir, f"{get_room_name(col, row)}.json"), "w"
+            ) as room_json:
+                dump(data, room_json)
+
+
+def get_walk() -> List[str]:
+    """
+    Snake through every room, left to right then right to left.
+    """
+
+    names: List[str] = []
+    for row in range(WORLD_ROWS):
+        cols: List[int] = list(range(WORLD_COLS))
+        if row % 2:
+            cols.reverse()
+        names += [get_room_name(col, row) for col in cols]
+    return names
+
+
+def walk_blocking(names: List[str]) -> List[float]:
+    hitches: List[float] = []
+    for name in names:
+        start: float = perf_counter()
+        RoomData.load(name)
+        hitches.append((perf_counter() - start) * 1000)
+        sleep(FRAMES_PER_ROOM * FRAME_S)
+    return hitches
+
+
+def walk_streamed(names: List[str], profiler: Profiler) -> List[float]:
+    streamer: RoomStreamer = RoomStreamer(profiler)
+    hitches: List[float] = []
+    for name in names:
+        start: float = perf_counter()
+        streamer.set_current(name)
+        hitches.append((perf_counter() - start) * 1000)
+        for _ in range(FRAMES_PER_ROOM):
+            sleep(FRAME_S)
+            streamer.end_frame()
+            profiler.end_frame()
+    return hitches
+
+
+temp_dir: str = mkdtemp()
+nodes.room_data.ROOMS_DIR_PATH = join(temp_dir, "rooms")
+make_world(nodes.room_data.ROOMS_DIR_PATH)
+walk: List[str] = get_walk()
+
+blocking: List[float] = walk_blocking(walk)
+print(
+    f"blocking: {np.mean(blocking):.1f} ms mean, "
+    f"{np.max(blocking):.1f} ms worst transition"
+)
+
+profiler: Profiler = Profiler()
+streamed: List[float] = walk_streamed(walk, profiler)
+# First room has nothing to prefetch from, it always blocks.
+print(
+    f"streamed: {np.mean(streamed[1:]):.2f} ms mean, "
+    f"{np.max(streamed[1:]):.2f} ms worst transition, "
+    f"first room {streamed[0]:.1f} ms"
+)
+print(profiler.get_debug_lines())
@@ -0,0 +1,178 @@
+from random import Random
+from time import perf_counter
+from typing import Dict
+from typing import List
+from typing import Tuple
+
+from constants import pg
+from constants import TILE_HEIGHT
+from constants import TILE_WIDTH
+from nodes.quadtree import QuadTree
+from nodes.swept_aabb import SweptAabb
+from nodes.tile_grid import TileGrid
+
+# Stress test fast movers at big dt values:
+# - Naive move, counts how many end up in a SOLID tile or out of room.
+# - Swept move against tiles, counts the same, should be 0.
+# - Swept against actors, QuadTree broadphase vs checking every rect.
+# Run from repo root: PYTHONPATH=src python -O benchmarks/<this file>.
+
+COLS: int = 60
+ROWS: int = 30
+MOVERS_LEN: int = 1000
+MOVER_SIZE: int = 6
+MAX_SPEED: float = 900.0
+DTS: List[int] = [16, 100, 250, 1000]
+FRAMES_LEN: int = 5
+
+
+def make_grid(random: Random) -> TileGrid:
+    grid: TileGrid = TileGrid(COLS, ROWS)
+    grid.tiles[0, :] = TileGrid.SOLID
+    grid.tiles[-1, :] = TileGrid.SOLID
+    grid.tiles[:, 0] = TileGrid.SOLID
+    grid.tiles[:, -1] = TileGrid.SOLID
+    for _ in range(COLS * ROWS // 10):
+        grid.set_tile(
+            random.randrange(1, COLS - 1),
+            random.randrange(1, ROWS - 1),
+            TileGrid.SOLID,
+        )
+    return grid
+
+
+def make_movers(
+    grid: TileGrid, random: Random
+) -> List[Tuple[float, float, float, float]]:
+    movers: List[Tuple[float, float, float, float]] = []
+    while len(movers) < MOVERS_LEN:
+        x: float = random.uniform(0, COLS * TILE_WIDTH)
+        y: float = random.uniform(0, ROWS * TILE_HEIGHT)
+        if grid.is_rect_solid(x, y, MOVER_SIZE, MOVER_SIZE):
+            continue
+        movers.append(
+            (
+                x,
+                y,
+                random.uniform(-MAX_SPEED, MAX_SPEED),
+                random.uniform(-MAX_SPEED, MAX_SPEED),
+            )
+        )
+    return movers
+
+
+def count_stuck(
+    grid: TileGrid, movers: List[Tuple[float, float, float, float]]
+) -> int:
+    """
+    Movers inside a SOLID tile or tunneled out of the walled room.
+    """
+
+    room: pg.Rect = pg.Rect(0, 0, COLS * TILE_WIDTH, ROWS * TILE_HEIGHT)
+    return len(
+        [
+            1
+            for x, y, _, _ in movers
+            if grid.is_rect_solid(x, y, MOVER_SIZE, MOVER_SIZE)
+            or not room.collidepoint(x, y)
+        ]
+    )
+
+
+def run_tiles(dt: int, is_swept: bool) -> Tuple[float, int]:
+    random: Random = Random(0)
+    grid: TileGrid = make_grid(random)
+    movers: List[Tuple[float, float, float, float]] = make_movers(grid, random)
+    seconds: float = dt / 1000
+
+    start: float = perf_counter()
+    for _ in range(FRAMES_LEN):
+        next_movers: List[Tuple[float, float, float, float]] = []
+        for x, y, vx, vy in movers:
+            if is_swept:
+                x, y, normal_x, normal_y = SweptAabb.move(
+                    grid,
+                    x,
+                    y,
+                    MOVER_SIZE,
+                    MOVER_SIZE,
+                    vx * seconds,
+                    vy * seconds,
+                )
+                # Bounce.
+                if normal_x != 0:
+                    vx = -vx
+                if normal_y != 0:
+                    vy = -vy
+            else:
+                x += vx * seconds
+                y += vy * seconds
+            next_movers.append((x, y, vx, vy))
+        movers = next_movers
+    ms: float = (perf_counter() - start) / FRAMES_LEN * 1000
+    return ms, count_stuck(grid, movers)
+
+
+def run_actors(dt: int, is_broadphase: bool) -> float:
+    random: Random = Random(0)
+    grid: TileGrid = make_grid(random)
+    movers: List[Tuple[float, float, float, float]] = make_movers(grid, random)
+    seconds: float = dt / 1000
+    rects: Dict[int, pg.Rect] = {
+        key: pg.Rect(int(x), int(y), MOVER_SIZE, MOVER_SIZE)
+        for key, (x, y, _, _) in enumerate(movers)
+    }
+    rects_list: List[pg.Rect] = list(rects.values())
+
+    start: float = perf_counter()
+    for _ in range(FRAMES_LEN):
+        tree: QuadTree = QuadTree(
+            pg.Rect(0, 0, COLS * TILE_WIDTH, ROWS * TILE_HEIGHT)
+        )
+        for key, rect in rects.items():
+            tree.insert(key, rect)
+        for key, (x, y, vx, vy) in enumerate(movers):
+            if is_broadphase:
+                SweptAabb.sweep_actors(
+                    tree,
+                    rects,
+                    key,
+                    x,
+                    y,
+                    MOVER_SIZE,
+                    MOVER_SIZE,
+                    vx * seconds,
+                    vy * seconds,
+                )
+            else:
+                SweptAabb.sweep_rects(
+                    x,
+                    y,
+                    MOVER_SIZE,
+                    MOVER_SIZE,
+                    vx * seconds,
+                    vy * seconds,
+                    rects_list,
+                )
+    return (perf_counter() - start) / FRAMES_LEN * 1000
+
+
+print(f"{MOVERS_LEN} movers, max {MAX_SPEED} px/s, ms per frame:")
+for dt in DTS:
+    naive_ms, naive_stuck = run_tiles(dt, False)
+    swept_ms, swept_stuck = run_tiles(dt, True)
+    print(
+        f"dt {dt}: "
+        f"naive {naive_ms:.2f} ms, {naive_stuck} in walls | "
+        f"swept tiles {swept_ms:.2f} ms, {swept_stuck} in walls, "
+        f"{MOVERS_LEN / swept_ms * 1000:.0f} sweeps per s"
+    )
+
+for dt in DTS:
+    broadphase_ms: float = run_actors(dt, True)
+    every_rect_ms: float = run_actors(dt, False)
+    print(
+        f"dt {dt}: swept actors "
+        f"quadtree {broadphase_ms:.2f} ms | "
+        f"every rect {every_rect_ms:.2f} ms"
+    )
@@ -0,0 +1,14 @@
+from constants import ATLAS_DIR_PATH
+from constants import JSONS_PATHS_DICT
+from constants import PNGS_PATHS_DICT
+from nodes.atlas_packer import AtlasPacker
+
+# REMOVE IN BUILD
+# Build step, packs every png in PNGS_PATHS_DICT into atlas pages.
+# Run from repo root again after adding or editing pngs:
+# python src/build_atlas.py
+
+rects = AtlasPacker().build(
+    PNGS_PATHS_DICT, ATLAS_DIR_PATH, JSONS_PATHS_DICT["atlas.json"]
+)
+print(f"packed {len(rects)} pngs into {ATLAS_DIR_PATH}")
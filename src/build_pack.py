@@ -0,0 +1,47 @@
+from argparse import ArgumentParser
+from json import load
+from os.path import exists
+from typing import List
+
+from constants import JSONS_PATHS_DICT
+from constants import OGGS_PATHS_DICT
+from constants import PNGS_PATHS_DICT
+from constants import RESOURCE_PACK_PATH
+from constants import WAVS_PATHS_DICT
+from nodes.resource_pack import ResourcePack
+
+# REMOVE IN BUILD
+# Build step, packs every path in the paths dicts into one file.
+# Settings json is written by the game, it stays loose.
+# Fonts stay loose too, constants makes FONT before any pack opens.
+# Build the atlas first to pack its pages too.
+# Run from repo root again after editing any asset:
+# python src/build_pack.py [--zlib]
+
+parser: ArgumentParser = ArgumentParser()
+parser.add_argument(
+    "--zlib", action="store_true", help="compress entries that shrink"
+)
+is_zlib: bool = parser.parse_args().zlib
+
+paths: List[str] = [
+    path for name, path in JSONS_PATHS_DICT.items() if name != "settings.json"
+]
+paths += list(PNGS_PATHS_DICT.values())
+paths += list(WAVS_PATHS_DICT.values())
+paths += list(OGGS_PATHS_DICT.values())
+
+# Atlas pages are listed in its index, not in a paths dict.
+# Read loose, loading through the pack would map the old pack file
+# that build is about to write over.
+if exists(JSONS_PATHS_DICT["atlas.json"]):
+    with open(JSONS_PATHS_DICT["atlas.json"], "r") as atlas_file:
+        paths += load(atlas_file)["pages"]
+
+paths = [path for path in paths if exists(path)]
+sizes = ResourcePack.build(paths, RESOURCE_PACK_PATH, is_zlib)
+print(
+    f"packed {len(sizes)} files into {RESOURCE_PACK_PATH}, "
+    f"{sum(size[0] for size in sizes.values())} to "
+    f"{sum(size[1] for size in sizes.values())} bytes"
+)
@@ -0,0 +1,24 @@
+from glob import glob
+from os.path import basename
+from os.path import join
+from os.path import splitext
+from typing import List
+
+from constants import ROOMS_DIR_PATH
+from nodes.room_compiler import RoomCompiler
+
+# REMOVE IN BUILD
+# Build step, compiles every stale room json into its binary cache.
+# The game also compiles stale rooms on load, this just does it ahead.
+# Run from repo root: python src/build_rooms.py
+
+names: List[str] = [
+    splitext(basename(path))[0]
+    for path in sorted(glob(join(ROOMS_DIR_PATH, "*.json")))
+]
+compiled_len: int = 0
+for name in names:
+    if RoomCompiler.read_header(name) is None:
+        RoomCompiler.compile(name)
+        compiled_len += 1
+print(f"compiled {compiled_len} of {len(names)} rooms in {ROOMS_DIR_PATH}")
@@ -7,6 +7,13 @@ import pygame.freetype as font
 
 # Everything here never changes ever.
 
+# Mixer format, every sound is converted to this once at load.
+MIXER_FREQUENCY: int = 44100
+MIXER_SIZE: int = -16
+MIXER_CHANNELS: int = 2
+MIXER_BUFFER: int = 512
+pg.mixer.pre_init(MIXER_FREQUENCY, MIXER_SIZE, MIXER_CHANNELS, MIXER_BUFFER)
+
 # Initialize pygame.
 pg.init()
 
@@ -21,14 +28,25 @@ DEFAULT_SETTINGS_DICT: Dict[str, int] = {
     "pause": 27,
     "jump": 99,
     "attack": 120,
+    # 1 scales and flips on a present thread, see Presenter.
+    "threaded_present": 0,
+    # 1 scales with the SDL renderer, see Presenter.
+    "renderer_present": 0,
+    # Frames per second, 0 is uncapped, and mode, see FramePacer.
+    "fps_target": 60,
+    "frame_pacing": 2,
 }
 
 # Path dictionaries.
 JSONS_DIR_PATH: str = "jsons"
 JSONS_PATHS_DICT: Dict[str, str] = {
     "settings.json": join(JSONS_DIR_PATH, "settings.json"),
+    "atlas.json": join(JSONS_DIR_PATH, "atlas.json"),
 }
 
+# Room jsons, one per room, by room name, see RoomData.
+ROOMS_DIR_PATH: str = join(JSONS_DIR_PATH, "rooms")
+
 PNGS_DIR_PATH: str = "pngs"
 PNGS_PATHS_DICT: Dict[str, str] = {
     "main_menu_background.png": join(
@@ -39,12 +57,39 @@ PNGS_PATHS_DICT: Dict[str, str] = {
     ),
 }
 
+# Atlas pages, made by src/build_atlas.py out of PNGS_PATHS_DICT.
+ATLAS_DIR_PATH: str = join(PNGS_DIR_PATH, "atlas")
+
+TTFS_DIR_PATH: str = "ttf"
+TTFS_PATHS_DICT: Dict[str, str] = {
+    "cg_pixel_3x5_mono.ttf": join(TTFS_DIR_PATH, "cg_pixel_3x5_mono.ttf"),
+}
+
 WAVS_DIR_PATH: str = "wavs"
 WAVS_PATHS_DICT: Dict[str, str] = {
     # "cursor.wav":
     # join(WAVS_DIR_PATH, "cursor.wav"),
 }
 
+# Streamed by MusicPlayer, see SCENES_MUSIC_DICT.
+OGGS_DIR_PATH: str = "oggs"
+OGGS_PATHS_DICT: Dict[str, str] = {
+    # "title.ogg":
+    # join(OGGS_DIR_PATH, "title.ogg"),
+}
+
+# Scene name to OGGS_PATHS_DICT key, crossfaded to on scene change.
+# Scenes not in here keep the current music playing.
+SCENES_MUSIC_DICT: Dict[str, str] = {
+    # "MainMenu": "title.ogg",
+}
+
+# Optional single file pack of the paths above, made by src/build_pack.py.
+RESOURCE_PACK_PATH: str = "resources.pack"
+
+# QualityGovernor changes this run, json lines, written on quit.
+QUALITY_LOG_PATH: str = "quality_log.jsonl"
+
 # FPS.
 FPS: int = 60
 
@@ -80,7 +125,7 @@ EVENTS: List[int] = [
 FONT_HEIGHT: int = 5
 FONT_WIDTH: int = 3
 FONT: font.Font = font.Font(
-    join("ttf", "cg_pixel_3x5_mono.ttf"),
+    TTFS_PATHS_DICT["cg_pixel_3x5_mono.ttf"],
     FONT_HEIGHT,
 )
 
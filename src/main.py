@@ -1,7 +1,5 @@
 from constants import CLOCK
 from constants import EVENTS
-from constants import FPS
-from constants import NATIVE_SURF
 from constants import NEXT_FRAME
 from constants import pg
 from nodes.game import Game
@@ -28,13 +26,7 @@ while 1:
             game.event(event)
 
         if pg.key.get_just_pressed()[NEXT_FRAME]:
-            game.current_scene.draw()
-
-            if game.is_options_menu_active:
-                options_menu.draw()
-                options_menu.update(16)  # Hardcoded 16 dt.
-            else:
-                game.current_scene.update(16)  # Hardcoded 16 dt.
+            game.step(options_menu, 16)  # Hardcoded 16 dt.
 
             # REMOVE IN BUILD
             game.debug_draw.add(
@@ -48,20 +40,49 @@ while 1:
             )
 
             # REMOVE IN BUILD
-            if game.is_debug:
-                game.debug_draw.draw()
+            game.debug_draw.add(
+                {
+                    "type": "text",
+                    "layer": 6,
+                    "x": 0,
+                    "y": 12,
+                    "text": game.sound_manager.get_debug_text(),
+                }
+            )
 
-            game.window_surf.blit(
-                pg.transform.scale_by(NATIVE_SURF, game.resolution_scale),
-                (0, game.native_y_offset),
+            # REMOVE IN BUILD
+            game.debug_draw.add(
+                {
+                    "type": "text",
+                    "layer": 6,
+                    "x": 0,
+                    "y": 18,
+                    "text": game.music_player.get_debug_text(),
+                }
             )
 
-            pg.display.update()
+            # REMOVE IN BUILD
+            for index, line in enumerate(game.profiler.get_debug_lines()):
+                game.debug_draw.add(
+                    {
+                        "type": "text",
+                        "layer": 6,
+                        "x": 0,
+                        "y": 24 + index * 6,
+                        "text": line,
+                    }
+                )
 
-            game.reset_just_events()
+            # REMOVE IN BUILD
+            if game.is_debug:
+                game.debug_draw.draw()
+
+            game.presenter.present(game.resolution_scale)
+
+            game.end_frame()
 
     else:
-        dt: int = CLOCK.tick(FPS)
+        dt: int = game.frame_pacer.tick()
 
         # REMOVE IN BUILD
         # Quick hacky solution to prevent dt build up in frame by frame debug.
@@ -72,13 +93,7 @@ while 1:
         for event in pg.event.get(EVENTS):
             game.event(event)
 
-        game.current_scene.draw()
-
-        if game.is_options_menu_active:
-            options_menu.draw()
-            options_menu.update(dt)
-        else:
-            game.current_scene.update(dt)
+        game.step(options_menu, dt)
 
         # REMOVE IN BUILD
         game.debug_draw.add(
@@ -91,15 +106,47 @@ while 1:
             }
         )
 
+        # REMOVE IN BUILD
+        game.debug_draw.add(
+            {
+                "type": "text",
+                "layer": 6,
+                "x": 0,
+                "y": 12,
+                "text": game.sound_manager.get_debug_text(),
+            }
+        )
+
+        # REMOVE IN BUILD
+        game.debug_draw.add(
+            {
+                "type": "text",
+                "layer": 6,
+                "x": 0,
+                "y": 18,
+                "text": game.music_player.get_debug_text(),
+            }
+        )
+
+        # REMOVE IN BUILD
+        for index, line in enumerate(game.profiler.get_debug_lines()):
+            game.debug_draw.add(
+                {
+                    "type": "text",
+                    "layer": 6,
+                    "x": 0,
+                    "y": 24 + index * 6,
+                    "text": line,
+                }
+            )
+
         # REMOVE IN BUILD
         if game.is_debug:
             game.debug_draw.draw()
 
-        game.window_surf.blit(
-            pg.transform.scale_by(NATIVE_SURF, game.resolution_scale),
-            (0, game.native_y_offset),
-        )
+        game.presenter.present(game.resolution_scale)
 
-        pg.display.update()
+        # Not in frame per frame mode, frame times mean nothing there.
+        game.quality_governor.end_frame()
 
-        game.reset_just_events()
+        game.end_frame()
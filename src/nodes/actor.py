@@ -0,0 +1,86 @@
+from typing import Tuple
+
+from constants import pg
+from nodes.actor_store import ActorStore
+from typeguard import typechecked
+
+
+@typechecked
+class Actor:
+    """
+    Thin facade over one ActorStore slot.
+    Game.actors classes extend this.
+
+    I do not hold position or velocity, the store does.
+    Movement is done by the store systems for all actors at once.
+    Override update for per actor logic like state machines.
+
+    Parameters:
+    - store: where my components live.
+    - topleft: rect topleft.
+    - size: rect size.
+    - flags: ActorStore flags.
+    """
+
+    def __init__(
+        self,
+        store: ActorStore,
+        topleft: Tuple[float, float],
+        size: Tuple[float, float],
+        flags: int = ActorStore.ALIVE | ActorStore.MOVING,
+    ):
+        self.store: ActorStore = store
+        self.slot: int = self.store.spawn(
+            topleft[0], topleft[1], size[0], size[1], flags, self
+        )
+
+    def get_position(self) -> Tuple[float, float]:
+        return (
+            float(self.store.xs[self.slot]),
+            float(self.store.ys[self.slot]),
+        )
+
+    def set_position(self, x: float, y: float) -> None:
+        self.store.xs[self.slot] = x
+        self.store.ys[self.slot] = y
+
+    def get_velocity(self) -> Tuple[float, float]:
+        return (
+            float(self.store.vxs[self.slot]),
+            float(self.store.vys[self.slot]),
+        )
+
+    def set_velocity(self, vx: float, vy: float) -> None:
+        self.store.vxs[self.slot] = vx
+        self.store.vys[self.slot] = vy
+
+    def get_rect(self) -> pg.Rect:
+        return self.store.get_rect(self.slot)
+
+    def has_flags(self, flags: int) -> bool:
+        return bool(self.store.flags[self.slot] & flags == flags)
+
+    def set_flags(self, flags: int, value: bool) -> None:
+        """
+        Turn given flags on or off.
+        """
+
+        if value:
+            self.store.flags[self.slot] |= flags
+        else:
+            # Mask to uint32, python ~ gives a negative int.
+            self.store.flags[self.slot] &= ~flags & 0xFFFFFFFF
+
+    def kill(self) -> None:
+        """
+        Give my slot back to the store.
+        """
+
+        self.store.despawn(self.slot)
+
+    def update(self, dt: int) -> None:
+        """
+        Per actor logic, override this.
+        """
+
+        pass
@@ -0,0 +1,182 @@
+from typing import Any
+from typing import Callable
+from typing import List
+from typing import Tuple
+from typing import Union
+
+import numpy as np
+from constants import pg
+from typeguard import typechecked
+
+
+@typechecked
+class ActorStore:
+    """
+    Holds every actor component in contiguous NumPy arrays, one slot per
+    actor. Systems update all matching slots in one vectorized pass.
+
+    Components, index is slot:
+    - xs, ys: rect topleft.
+    - widths, heights: rect size.
+    - vxs, vys: velocity in px per second.
+    - flags: bit flags, see flags enum.
+
+    Dead slots go to a free list and are reused by the next spawn.
+    Full? Arrays double in size.
+
+    Parameters:
+    - capacity: initial slot count.
+
+    Update:
+    - every system, in added order.
+    """
+
+    # Flags.
+    ALIVE: int = 1
+    MOVING: int = 2
+    SOLID: int = 4
+    ON_FLOOR: int = 8
+
+    def __init__(self, capacity: int = 256):
+        self.capacity: int = capacity
+
+        # Components.
+        self.xs: np.ndarray = np.zeros(capacity, np.float32)
+        self.ys: np.ndarray = np.zeros(capacity, np.float32)
+        self.widths: np.ndarray = np.zeros(capacity, np.float32)
+        self.heights: np.ndarray = np.zeros(capacity, np.float32)
+        self.vxs: np.ndarray = np.zeros(capacity, np.float32)
+        self.vys: np.ndarray = np.zeros(capacity, np.float32)
+        self.flags: np.ndarray = np.zeros(capacity, np.uint32)
+
+        # Slot to facade instance, None if slot has no facade.
+        self.facades: List[Any] = [None] * capacity
+
+        # Free slots, pop from the end so lowest slot is used first.
+        self.free_slots: List[int] = list(range(capacity - 1, -1, -1))
+
+        # Alive actors count.
+        self.actors_len: int = 0
+
+        # Systems list, (required flags, callback).
+        # Callback takes (store, mask, dt).
+        self.systems: List[Tuple[int, Callable]] = [
+            (self.ALIVE | self.MOVING, self.move_system),
+        ]
+
+    def spawn(
+        self,
+        x: float,
+        y: float,
+        width: float,
+        height: float,
+        flags: int = ALIVE | MOVING,
+        facade: Any = None,
+    ) -> int:
+        """
+        Takes a free slot, fills its components.
+        Returns the slot.
+        """
+
+        # No free slot? Grow.
+        if not self.free_slots:
+            self.grow()
+
+        slot: int = self.free_slots.pop()
+        self.xs[slot] = x
+        self.ys[slot] = y
+        self.widths[slot] = width
+        self.heights[slot] = height
+        self.vxs[slot] = 0
+        self.vys[slot] = 0
+        self.flags[slot] = flags | self.ALIVE
+        self.facades[slot] = facade
+        self.actors_len += 1
+        return slot
+
+    def despawn(self, slot: int) -> None:
+        """
+        Clears slot flags, gives slot back to the free list.
+        """
+
+        # Already dead? Do not free it twice.
+        if not self.flags[slot] & self.ALIVE:
+            return
+
+        self.flags[slot] = 0
+        self.facades[slot] = None
+        self.free_slots.append(slot)
+        self.actors_len -= 1
+
+    def grow(self) -> None:
+        """
+        Doubles every component array, new slots go to the free list.
+        """
+
+        old_capacity: int = self.capacity
+        self.capacity *= 2
+        extra: int = self.capacity - old_capacity
+
+        self.xs = np.concatenate((self.xs, np.zeros(extra, np.float32)))
+        self.ys = np.concatenate((self.ys, np.zeros(extra, np.float32)))
+        self.widths = np.concatenate(
+            (self.widths, np.zeros(extra, np.float32))
+        )
+        self.heights = np.concatenate(
+            (self.heights, np.zeros(extra, np.float32))
+        )
+        self.vxs = np.concatenate((self.vxs, np.zeros(extra, np.float32)))
+        self.vys = np.concatenate((self.vys, np.zeros(extra, np.float32)))
+        self.flags = np.concatenate((self.flags, np.zeros(extra, np.uint32)))
+        self.facades.extend([None] * extra)
+
+        # Keep lowest slot first out.
+        self.free_slots = (
+            list(range(self.capacity - 1, old_capacity - 1, -1))
+            + self.free_slots
+        )
+
+    def add_system(self, callback: Callable, required_flags: int) -> None:
+        """
+        Add a system, it runs on slots that have all required flags.
+        Callback takes (store, mask, dt).
+        """
+
+        self.systems.append((required_flags | self.ALIVE, callback))
+
+    def get_mask(self, required_flags: int) -> np.ndarray:
+        """
+        Returns bool array, true for slots that have all required flags.
+        """
+
+        return (self.flags & required_flags) == required_flags
+
+    def get_rect(self, slot: int) -> pg.Rect:
+        return pg.Rect(
+            int(self.xs[slot]),
+            int(self.ys[slot]),
+            int(self.widths[slot]),
+            int(self.heights[slot]),
+        )
+
+    def get_facade(self, slot: int) -> Union[Any, None]:
+        return self.facades[slot]
+
+    def update(self, dt: int) -> None:
+        """
+        Update:
+        - every system, in added order.
+        """
+
+        for required_flags, callback in self.systems:
+            callback(self, self.get_mask(required_flags), dt)
+
+    @staticmethod
+    def move_system(store: "ActorStore", mask: np.ndarray, dt: int) -> None:
+        """
+        Position += velocity * dt, for ALIVE and MOVING slots.
+        """
+
+        seconds: float = dt / 1000
+        np.add(store.xs, store.vxs * seconds, out=store.xs, where=mask)
+        np.add(store.ys, store.vys * seconds, out=store.ys, where=mask)
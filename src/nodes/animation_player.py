@@ -0,0 +1,266 @@
+from typing import Any
+from typing import Dict
+from typing import List
+from typing import Tuple
+from typing import Union
+
+import numpy as np
+from constants import JSONS_PATHS_DICT
+from constants import pg
+from nodes.atlas import Atlas
+from nodes.resource_pack import ResourcePack
+from typeguard import typechecked
+
+
+@typechecked
+class AnimationPlayer:
+    """
+    Plays sprite sheet animations for many actors at once.
+    One player per animation json, every actor using it gets a slot.
+
+    Frames are subsurface views of the sheet, no pixel copies. Each
+    sheet is sliced once, all players and actors share the frames.
+
+    Actor state is a few ints per slot in NumPy arrays, update advances
+    every slot in one vectorized pass:
+    - animation_indexes: which animation.
+    - frame_indexes: frame in that animation.
+    - elapseds: ms into that frame.
+    - is_dones: non loop animation reached its last frame.
+
+    Json, under jsons/:
+    - sprite_sheet: PNGS_PATHS_DICT key, atlas aware.
+    - frame_width, frame_height: px.
+    - animations: name to:
+        - frames: sheet frame indexes, left to right, top to bottom.
+        - durations: ms per frame, or one int for all frames.
+        - is_loop.
+
+    Parameters:
+    - json_name: JSONS_PATHS_DICT key.
+    - capacity: initial slot count.
+
+    Update:
+    - advance every slot frame.
+    """
+
+    # Sheet png name, frame width and height to its frame subsurfaces,
+    # shared by every player.
+    sheets_frames: Dict[Tuple[str, int, int], List[pg.Surface]] = {}
+
+    def __init__(self, json_name: str, capacity: int = 64):
+        data: Dict[str, Any] = ResourcePack.load_json(
+            JSONS_PATHS_DICT[json_name]
+        )
+
+        self.frames: List[pg.Surface] = self.get_sheet_frames(
+            data["sprite_sheet"], data["frame_width"], data["frame_height"]
+        )
+
+        # Animation name to index, flat frame tables by index.
+        self.animation_names: Dict[str, int] = {}
+        starts: List[int] = []
+        lens: List[int] = []
+        is_loops: List[bool] = []
+        frame_surf_indexes: List[int] = []
+        frame_durations: List[int] = []
+        totals: List[int] = []
+        for name, animation in data["animations"].items():
+            frames: List[int] = animation["frames"]
+            durations: Any = animation["durations"]
+            if isinstance(durations, int):
+                durations = [durations] * len(frames)
+
+            self.animation_names[name] = len(starts)
+            starts.append(len(frame_surf_indexes))
+            lens.append(len(frames))
+            is_loops.append(animation["is_loop"])
+            frame_surf_indexes.extend(frames)
+
+            # 0 ms frame would never end.
+            durations = [max(duration, 1) for duration in durations]
+            frame_durations.extend(durations)
+            totals.append(sum(durations))
+
+        self.animation_starts: np.ndarray = np.array(starts, np.int32)
+        self.animation_lens: np.ndarray = np.array(lens, np.int32)
+        self.animation_is_loops: np.ndarray = np.array(is_loops, np.bool_)
+        self.frame_surf_indexes: np.ndarray = np.array(
+            frame_surf_indexes, np.int32
+        )
+        self.frame_durations: np.ndarray = np.array(frame_durations, np.int32)
+        self.animation_totals: np.ndarray = np.array(totals, np.int32)
+
+        # Slot state.
+        self.capacity: int = capacity
+        self.animation_indexes: np.ndarray = np.zeros(capacity, np.int32)
+        self.frame_indexes: np.ndarray = np.zeros(capacity, np.int32)
+        self.elapseds: np.ndarray = np.zeros(capacity, np.int32)
+        self.is_dones: np.ndarray = np.zeros(capacity, np.bool_)
+        self.is_alives: np.ndarray = np.zeros(capacity, np.bool_)
+
+        # Free slots, pop from the end so lowest slot is used first.
+        self.free_slots: List[int] = list(range(capacity - 1, -1, -1))
+
+    @classmethod
+    def get_sheet_frames(
+        cls, sprite_sheet: str, frame_width: int, frame_height: int
+    ) -> List[pg.Surface]:
+        """
+        Slice a sheet into frame subsurfaces once, then reuse them.
+        """
+
+        key: Tuple[str, int, int] = (sprite_sheet, frame_width, frame_height)
+        frames: Union[List[pg.Surface], None] = cls.sheets_frames.get(key)
+        if frames is not None:
+            return frames
+
+        sheet_surf: pg.Surface = Atlas.get_surf(sprite_sheet)
+        cols: int = sheet_surf.get_width() // frame_width
+        rows: int = sheet_surf.get_height() // frame_height
+        frames = [
+            sheet_surf.subsurface(
+                (col * frame_width, row * frame_height),
+                (frame_width, frame_height),
+            )
+            for row in range(rows)
+            for col in range(cols)
+        ]
+        cls.sheets_frames[key] = frames
+        return frames
+
+    def add_actor(self, animation_name: str) -> int:
+        """
+        Takes a free slot, starts the animation.
+        Returns the slot.
+        """
+
+        # No free slot? Double every state array.
+        if not self.free_slots:
+            old_capacity: int = self.capacity
+            self.capacity *= 2
+            extra: int = self.capacity - old_capacity
+            self.animation_indexes = np.concatenate(
+                (self.animation_indexes, np.zeros(extra, np.int32))
+            )
+            self.frame_indexes = np.concatenate(
+                (self.frame_indexes, np.zeros(extra, np.int32))
+            )
+            self.elapseds = np.concatenate(
+                (self.elapseds, np.zeros(extra, np.int32))
+            )
+            self.is_dones = np.concatenate(
+                (self.is_dones, np.zeros(extra, np.bool_))
+            )
+            self.is_alives = np.concatenate(
+                (self.is_alives, np.zeros(extra, np.bool_))
+            )
+            self.free_slots = (
+                list(range(self.capacity - 1, old_capacity - 1, -1))
+                + self.free_slots
+            )
+
+        slot: int = self.free_slots.pop()
+        self.is_alives[slot] = True
+        self.play(slot, animation_name, True)
+        return slot
+
+    def remove_actor(self, slot: int) -> None:
+        # Already removed? Do not free it twice.
+        if not self.is_alives[slot]:
+            return
+
+        self.is_alives[slot] = False
+        self.free_slots.append(slot)
+
+    def play(
+        self, slot: int, animation_name: str, is_restart: bool = False
+    ) -> None:
+        """
+        Switch slot animation, from frame 0.
+        Same animation keeps playing unless is_restart.
+        """
+
+        animation_index: int = self.animation_names[animation_name]
+        if not is_restart and self.animation_indexes[slot] == animation_index:
+            return
+
+        self.animation_indexes[slot] = animation_index
+        self.frame_indexes[slot] = 0
+        self.elapseds[slot] = 0
+        self.is_dones[slot] = False
+
+    def is_done(self, slot: int) -> bool:
+        return bool(self.is_dones[slot])
+
+    def update(self, dt: int) -> None:
+        """
+        Update:
+        - advance every slot frame.
+        """
+
+        self.elapseds[self.is_alives & ~self.is_dones] += dt
+
+        # Whole loops skipped land on the same frame, drop them first.
+        is_loops: np.ndarray = self.is_alives & (
+            self.animation_is_loops[self.animation_indexes]
+        )
+        np.remainder(
+            self.elapseds,
+            self.animation_totals[self.animation_indexes],
+            out=self.elapseds,
+            where=is_loops,
+        )
+
+        # A big dt can skip many frames, step until none is overdue.
+        while True:
+            flat_indexes: np.ndarray = (
+                self.animation_starts[self.animation_indexes]
+                + self.frame_indexes
+            )
+            durations: np.ndarray = self.frame_durations[flat_indexes]
+            is_overdues: np.ndarray = (
+                self.is_alives & ~self.is_dones & (self.elapseds >= durations)
+            )
+            if not is_overdues.any():
+                break
+
+            self.elapseds[is_overdues] -= durations[is_overdues]
+            self.frame_indexes[is_overdues] += 1
+
+            # Past the last frame? Loop, or stay on it and be done.
+            lens: np.ndarray = self.animation_lens[self.animation_indexes]
+            is_ends: np.ndarray = is_overdues & (self.frame_indexes >= lens)
+            self.frame_indexes[is_ends & is_loops] = 0
+            is_stops: np.ndarray = is_ends & ~is_loops
+            self.frame_indexes[is_stops] = lens[is_stops] - 1
+            self.elapseds[is_stops] = 0
+            self.is_dones[is_stops] = True
+
+    def get_surf(self, slot: int) -> pg.Surface:
+        """
+        Slot current frame, a shared subsurface, do not draw on it.
+        """
+
+        animation_index: int = int(self.animation_indexes[slot])
+        flat_index: int = int(self.animation_starts[animation_index]) + int(
+            self.frame_indexes[slot]
+        )
+        return self.frames[int(self.frame_surf_indexes[flat_index])]
+
+    def get_blit_sequence(
+        self, slots: List[int], positions: List[Tuple[float, float]]
+    ) -> List[Tuple[pg.Surface, Tuple[float, float]]]:
+        """
+        Current frames for Surface.blits, one (surf, position) per slot.
+        """
+
+        surf_indexes: List[int] = self.frame_surf_indexes[
+            self.animation_starts[self.animation_indexes[slots]]
+            + self.frame_indexes[slots]
+        ].tolist()
+        frames: List[pg.Surface] = self.frames
+        return [
+            (frames[surf_index], position)
+            for surf_index, position in zip(surf_indexes, positions)
+        ]
@@ -0,0 +1,195 @@
+from concurrent.futures import Future
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any
+from typing import Callable
+from typing import List
+from typing import Set
+from typing import Tuple
+from typing import Union
+
+from constants import JSONS_PATHS_DICT
+from constants import PNGS_PATHS_DICT
+from constants import WAVS_PATHS_DICT
+from nodes.atlas import Atlas
+from nodes.resource_pack import ResourcePack
+from nodes.sound_manager import SoundManager
+from typeguard import typechecked
+
+
+@typechecked
+class AssetLoader:
+    """
+    Decodes pngs and wavs on a thread pool, pygame decoding releases the
+    GIL. Convert and registering happen on the main thread in update.
+
+    Finished pngs go to Atlas, so later Atlas.get_surf calls in scene
+    constructors are instant. Packed pngs decode their atlas page once.
+    Finished wavs go to the sound manager.
+
+    Queue with add_png and add_wav, then start, then update every frame
+    until is_done. See LoadingScreen.
+
+    Parameters:
+    - sound_manager: gets the decoded sounds.
+    - workers_len: pool threads.
+
+    Update:
+    - finalize finished decodes.
+    """
+
+    def __init__(self, sound_manager: SoundManager, workers_len: int = 4):
+        self.sound_manager: SoundManager = sound_manager
+        self.workers_len: int = workers_len
+        self.executor: Union[ThreadPoolExecutor, None] = None
+
+        # Queued (decode path, main thread finalize), before start.
+        self.queue: List[Tuple[str, Callable[[Any], Any]]] = []
+
+        # Submitted, not finalized yet, oldest first.
+        self.pending: List[Tuple[Future, Callable[[Any], Any]]] = []
+
+        # Decode paths queued, so a shared page is only decoded once.
+        self.queued_paths: Set[str] = set()
+
+        self.total_len: int = 0
+        self.done_len: int = 0
+
+    def add_png(self, png_name: str) -> None:
+        """
+        Queue a png by its PNGS_PATHS_DICT key, atlas aware.
+        """
+
+        if png_name in Atlas.surfs:
+            return
+
+        page: Union[int, None] = Atlas.get_page(png_name)
+        if page is None:
+            self.add_path(
+                PNGS_PATHS_DICT[png_name],
+                lambda surf: Atlas.add_loose_surf(png_name, surf),
+            )
+            return
+
+        if page in Atlas.page_surfs:
+            return
+        self.add_path(
+            Atlas.page_paths[page],
+            lambda surf: Atlas.add_page_surf(page, surf),
+        )
+
+    def add_wav(
+        self,
+        wav_name: str,
+        category: int = SoundManager.SFX,
+        priority: int = 0,
+        max_voices: int = 2,
+    ) -> None:
+        """
+        Queue a wav by its WAVS_PATHS_DICT key, see SoundManager.
+        """
+
+        if not self.sound_manager.is_mixer_ready:
+            return
+
+        self.add_path(
+            WAVS_PATHS_DICT[wav_name],
+            lambda sound: self.sound_manager.add_sound(
+                wav_name, sound, category, priority, max_voices
+            ),
+        )
+
+    def add_path(self, path: str, finalize: Callable[[Any], Any]) -> None:
+        """
+        Queue a decode, finalize gets the decoded asset on the main
+        thread, what it returns is ignored.
+        """
+
+        if path in self.queued_paths:
+            return
+
+        self.queued_paths.add(path)
+        self.queue.append((path, finalize))
+        self.total_len += 1
+
+    @staticmethod
+    def decode(path: str) -> Any:
+        """
+        Pool thread, no convert here, that needs the main thread.
+        """
+
+        if path.endswith(".wav"):
+            return ResourcePack.load_sound(path)
+        return ResourcePack.load_image(path)
+
+    def start(self) -> None:
+        """
+        Submit everything queued to the pool.
+        """
+
+        # Open the pack and atlas index here, not racing on the pool.
+        ResourcePack.get_entry(JSONS_PATHS_DICT["atlas.json"])
+
+        if self.executor is None:
+            self.executor = ThreadPoolExecutor(self.workers_len)
+        for path, finalize in self.queue:
+            self.pending.append(
+                (self.executor.submit(self.decode, path), finalize)
+            )
+        self.queue = []
+
+    def update(self, dt: int) -> None:
+        """
+        Update:
+        - finalize finished decodes.
+        """
+
+        still_pending: List[Tuple[Future, Callable[[Any], Any]]] = []
+        for future, finalize in self.pending:
+            if not future.done():
+                still_pending.append((future, finalize))
+                continue
+
+            # Decode failed? Raise it here, on the main thread.
+            finalize(future.result())
+            self.done_len += 1
+        self.pending = still_pending
+
+        if self.is_done() and self.executor is not None:
+            self.executor.shutdown(wait=False)
+            self.executor = None
+            self.queued_paths = set()
+
+    def is_done(self) -> bool:
+        return not self.queue and not self.pending
+
+    def get_progress(self) -> float:
+        """
+        0 to 1, finalized share of everything queued.
+        """
+
+        if self.total_len == 0:
+            return 1.0
+        return self.done_len / self.total_len
+
+    def wait(self) -> None:
+        """
+        Block until everything queued is finalized, no loading screen.
+        """
+
+        self.start()
+        while not self.is_done():
+            if self.pending:
+                self.pending[0][0].result()
+            self.update(0)
+
+    def close(self) -> None:
+        """
+        Drop what is not decoded yet and end the pool threads.
+        """
+
+        if self.executor is not None:
+            self.executor.shutdown(wait=True, cancel_futures=True)
+            self.executor = None
+        self.queue = []
+        self.pending = []
+        self.queued_paths = set()
@@ -0,0 +1,156 @@
+from typing import Any
+from typing import Dict
+from typing import List
+from typing import Tuple
+from typing import Union
+
+from constants import JSONS_PATHS_DICT
+from constants import pg
+from constants import PNGS_PATHS_DICT
+from nodes.resource_pack import ResourcePack
+from typeguard import typechecked
+
+
+@typechecked
+class Atlas:
+    """
+    Atlas aware png loading, everyone loads pngs through get_surf.
+    Packed pngs are subsurface views of one shared page, no pixel
+    copies, so do not draw on them. Each page is opened once.
+
+    Pngs not in the atlas index, or no index at all, load from their
+    loose file as before. Run src/build_atlas.py to make the index.
+
+    Hot blit paths can use get_area instead, page and area rect.
+    """
+
+    # Png name to [page, x, y, width, height], loaded once.
+    rects: Union[Dict[str, List[int]], None] = None
+
+    page_paths: List[str] = []
+
+    # Page index to its surf, opened on first use.
+    page_surfs: Dict[int, pg.Surface] = {}
+
+    # Png name to its surf, every png is handed out once.
+    surfs: Dict[str, pg.Surface] = {}
+
+    @classmethod
+    def load_index(cls) -> None:
+        """
+        Read the index json, no index means every png is loose.
+        """
+
+        cls.rects = {}
+        cls.page_paths = []
+        try:
+            data: Dict[str, Any] = ResourcePack.load_json(
+                JSONS_PATHS_DICT["atlas.json"]
+            )
+        except FileNotFoundError:
+            return
+
+        cls.rects = data["rects"]
+        cls.page_paths = data["pages"]
+
+    @classmethod
+    def get_page_surf(cls, page: int) -> pg.Surface:
+        page_surf: Union[pg.Surface, None] = cls.page_surfs.get(page)
+        if page_surf is not None:
+            return page_surf
+
+        return cls.add_page_surf(
+            page, ResourcePack.load_image(cls.page_paths[page])
+        )
+
+    @staticmethod
+    def finalize(surf: pg.Surface) -> pg.Surface:
+        """
+        Match the window format for fast blits. Main thread only.
+        """
+
+        if pg.display.get_surface() is not None:
+            return surf.convert_alpha()
+
+        # Renderer window or none, match NATIVE_SURF, keep alpha.
+        return surf.convert(pg.Surface((1, 1), pg.SRCALPHA))
+
+    @classmethod
+    def get_page(cls, png_name: str) -> Union[int, None]:
+        """
+        Page holding a png, None if loose.
+        """
+
+        if cls.rects is None:
+            cls.load_index()
+        rect: Union[List[int], None] = (cls.rects or {}).get(png_name)
+        if rect is None:
+            return None
+        return rect[0]
+
+    @classmethod
+    def add_page_surf(cls, page: int, page_surf: pg.Surface) -> pg.Surface:
+        """
+        Page decoded elsewhere, like on the asset loader pool.
+        """
+
+        page_surf = cls.finalize(page_surf)
+        cls.page_surfs[page] = page_surf
+        return page_surf
+
+    @classmethod
+    def add_loose_surf(cls, png_name: str, surf: pg.Surface) -> pg.Surface:
+        """
+        Loose png decoded elsewhere, like on the asset loader pool.
+        """
+
+        surf = cls.finalize(surf)
+        cls.surfs[png_name] = surf
+        return surf
+
+    @classmethod
+    def get_surf(cls, png_name: str) -> pg.Surface:
+        """
+        Png by its PNGS_PATHS_DICT key, from the atlas if packed.
+        """
+
+        surf: Union[pg.Surface, None] = cls.surfs.get(png_name)
+        if surf is not None:
+            return surf
+
+        # Not packed? Loose file.
+        page: Union[int, None] = cls.get_page(png_name)
+        if page is None:
+            return cls.add_loose_surf(
+                png_name, ResourcePack.load_image(PNGS_PATHS_DICT[png_name])
+            )
+
+        _, x, y, width, height = (cls.rects or {})[png_name]
+        surf = cls.get_page_surf(page).subsurface((x, y, width, height))
+        cls.surfs[png_name] = surf
+        return surf
+
+    @classmethod
+    def get_area(cls, png_name: str) -> Tuple[pg.Surface, pg.Rect]:
+        """
+        Page and area of a png, for hot blits: blit(page, position, area).
+        Subsurface blits pay a parent lock each, page and area do not.
+        Loose png is its own page, area is all of it.
+        """
+
+        surf: pg.Surface = cls.get_surf(png_name)
+        parent: Union[pg.Surface, None] = surf.get_parent()
+        if parent is None:
+            return surf, surf.get_rect()
+        return parent, pg.Rect(surf.get_offset(), surf.get_size())
+
+    @classmethod
+    def clear(cls) -> None:
+        """
+        Forget every surf and the index, like after a rebuild.
+        """
+
+        cls.rects = None
+        cls.page_paths = []
+        cls.page_surfs = {}
+        cls.surfs = {}
@@ -0,0 +1,170 @@
+from json import dump
+from os import makedirs
+from os.path import join
+from typing import Dict
+from typing import List
+from typing import Tuple
+
+from constants import pg
+from typeguard import typechecked
+
+
+@typechecked
+class AtlasPacker:
+    """
+    Offline build step, packs loose pngs into a few atlas pages.
+    Loading one page and handing out subsurfaces is far fewer file opens
+    and surfs than loading every png, see Atlas.
+
+    Shelf packer: images sorted tallest first, each goes on the open
+    shelf with the least height left over, else a new shelf, else a new
+    page. An image bigger than a page gets a page of its own, never
+    reused or resized.
+
+    build checks every rect fits its page and overlaps no other before
+    saving anything.
+
+    Index json:
+    - pages: page png paths, from repo root.
+    - rects: png name to [page, x, y, width, height].
+
+    Parameters:
+    - page_width, page_height: px, most pages.
+    - padding: px between images.
+    """
+
+    def __init__(
+        self, page_width: int = 1024, page_height: int = 1024, padding: int = 1
+    ):
+        self.page_width: int = page_width
+        self.page_height: int = page_height
+        self.padding: int = padding
+
+    def pack(
+        self, sizes: Dict[str, Tuple[int, int]]
+    ) -> Tuple[
+        Dict[str, Tuple[int, int, int, int, int]], List[Tuple[int, int]]
+    ]:
+        """
+        Name to (width, height) in, name to (page, x, y, width, height)
+        and page sizes out. Pages are cropped to their used height.
+        """
+
+        rects: Dict[str, Tuple[int, int, int, int, int]] = {}
+        page_sizes: List[Tuple[int, int]] = []
+
+        # Page the shelves are on, -1 before the first, [y, height,
+        # next x] shelves.
+        shelf_page: int = -1
+        shelves: List[List[int]] = []
+        page_used_height: int = 0
+
+        for name in sorted(
+            sizes, key=lambda name: (-sizes[name][1], -sizes[name][0], name)
+        ):
+            width, height = sizes[name]
+
+            # Too big for any page? Own page.
+            if width > self.page_width or height > self.page_height:
+                rects[name] = (len(page_sizes), 0, 0, width, height)
+                page_sizes.append((width, height))
+                continue
+
+            # Open shelf with the least height left over.
+            best_shelf: List[int] = []
+            for shelf in shelves:
+                if (
+                    height <= shelf[1]
+                    and shelf[2] + width <= self.page_width
+                    and (not best_shelf or shelf[1] < best_shelf[1])
+                ):
+                    best_shelf = shelf
+
+            if not best_shelf:
+                # Page full or no page yet? Start one.
+                if shelf_page == -1 or (
+                    page_used_height + height > self.page_height
+                ):
+                    shelf_page = len(page_sizes)
+                    page_sizes.append((self.page_width, 0))
+                    shelves = []
+                    page_used_height = 0
+                best_shelf = [page_used_height, height, 0]
+                shelves.append(best_shelf)
+                page_used_height += height + self.padding
+
+            rects[name] = (
+                shelf_page,
+                best_shelf[2],
+                best_shelf[0],
+                width,
+                height,
+            )
+            best_shelf[2] += width + self.padding
+            page_sizes[shelf_page] = (
+                self.page_width,
+                max(page_sizes[shelf_page][1], best_shelf[0] + height),
+            )
+
+        return rects, page_sizes
+
+    @staticmethod
+    def check(
+        rects: Dict[str, Tuple[int, int, int, int, int]],
+        page_sizes: List[Tuple[int, int]],
+    ) -> None:
+        """
+        Raise ValueError if a rect leaves its page or overlaps another.
+        """
+
+        pages_rects: List[List[Tuple[str, pg.Rect]]] = [[] for _ in page_sizes]
+        for name, (page, x, y, width, height) in rects.items():
+            rect: pg.Rect = pg.Rect(x, y, width, height)
+            if not pg.Rect((0, 0), page_sizes[page]).contains(rect):
+                raise ValueError(f"{name} {rect} outside page {page}")
+            for other_name, other_rect in pages_rects[page]:
+                if rect.colliderect(other_rect):
+                    raise ValueError(
+                        f"{name} overlaps {other_name} on page {page}"
+                    )
+            pages_rects[page].append((name, rect))
+
+    def build(
+        self, pngs_paths_dict: Dict[str, str], pages_dir: str, index_path: str
+    ) -> Dict[str, Tuple[int, int, int, int, int]]:
+        """
+        Load every png, pack, save the pages and the index json.
+        Returns the rects.
+        """
+
+        surfs: Dict[str, pg.Surface] = {
+            name: pg.image.load(path) for name, path in pngs_paths_dict.items()
+        }
+        rects, page_sizes = self.pack(
+            {name: surf.get_size() for name, surf in surfs.items()}
+        )
+        self.check(rects, page_sizes)
+
+        page_surfs: List[pg.Surface] = [
+            pg.Surface(page_size, pg.SRCALPHA) for page_size in page_sizes
+        ]
+        for name, (page, x, y, _, _) in rects.items():
+            page_surfs[page].blit(surfs[name], (x, y))
+
+        makedirs(pages_dir, exist_ok=True)
+        page_paths: List[str] = []
+        for page, page_surf in enumerate(page_surfs):
+            page_paths.append(join(pages_dir, f"atlas_{page}.png"))
+            pg.image.save(page_surf, page_paths[-1])
+
+        with open(index_path, "w") as index_json:
+            dump(
+                {
+                    "pages": page_paths,
+                    "rects": {
+                        name: list(rect) for name, rect in rects.items()
+                    },
+                },
+                index_json,
+            )
+        return rects
@@ -0,0 +1,66 @@
+from abc import ABC
+from abc import abstractmethod
+from typing import List
+
+import numpy as np
+from constants import pg
+from typeguard import typechecked
+
+
+@typechecked
+class Broadphase(ABC):
+    """
+    Common broadphase interface, rooms pick a backend by name.
+    Holds actor rects by int key, returns keys near a given rect.
+
+    Backends:
+    - QuadTree: clustered or uneven actors.
+    - SpatialHash: many evenly spread actors.
+
+    Backends must define clear, insert, remove and query, missing one
+    fails on creation.
+
+    Parameters:
+    - bounds: area the room covers.
+    """
+
+    def __init__(self, bounds: pg.Rect):
+        self.bounds: pg.Rect = bounds
+
+    @abstractmethod
+    def clear(self) -> None:
+        pass
+
+    @abstractmethod
+    def insert(self, key: int, rect: pg.Rect) -> None:
+        pass
+
+    @abstractmethod
+    def remove(self, key: int, rect: pg.Rect) -> None:
+        """
+        Rect must be the one key was inserted with.
+        """
+
+    def update(self, key: int, old_rect: pg.Rect, new_rect: pg.Rect) -> None:
+        """
+        Move one item, for movers.
+        """
+
+        self.remove(key, old_rect)
+        self.insert(key, new_rect)
+
+    @abstractmethod
+    def query(self, rect: pg.Rect) -> List[int]:
+        """
+        Returns keys of items whose rect overlaps given rect.
+        """
+
+    def rebuild(self, rects: np.ndarray) -> None:
+        """
+        Clear then insert every rect at once.
+        Rects is a (n, 4) array of x, y, width, height, key is row index.
+        """
+
+        self.clear()
+        for key, (x, y, width, height) in enumerate(rects.tolist()):
+            self.insert(key, pg.Rect(x, y, width, height))
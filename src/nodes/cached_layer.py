@@ -0,0 +1,90 @@
+from typing import Callable
+from typing import List
+
+from constants import pg
+from typeguard import typechecked
+
+
+@typechecked
+class CachedLayer:
+    """
+    Drawing that rarely changes, rendered once into my surf, then only
+    blitted. Backgrounds, titles, labels, decorations.
+
+    Children are draw callables taking my surf, called in added order.
+    Whoever changes what a child draws calls set_dirty, the layer
+    renders again on its next draw, so many changes a frame cost one
+    render.
+
+    Opaque layers clear to clear_color and blit as a plain copy, cheaper
+    than per pixel alpha sources like atlas surfs. Transparent layers
+    clear to no alpha, for overlays on top of things that animate.
+
+    RLE layers are encoded again on the first blit after a render, about
+    a millisecond full screen. Blits then skip clear runs, a mostly empty
+    overlay costs little more than its drawn pixels. Only for layers that
+    render once or so, a plain full screen alpha blit costs more than
+    redrawing a few texts, see benchmarks/benchmark_cached_layer.py.
+
+    Parameters:
+    - size: surf size.
+    - is_transparent: per pixel alpha surf.
+    - clear_color: opaque layer background.
+    - is_rle: RLE encode, for layers that are rarely dirty.
+    """
+
+    def __init__(
+        self,
+        size: tuple[int, int],
+        is_transparent: bool = False,
+        clear_color: str = "#000000",
+        is_rle: bool = False,
+    ):
+        self.is_transparent: bool = is_transparent
+        self.clear_color: str = clear_color
+        self.surf: pg.Surface = pg.Surface(
+            size, pg.SRCALPHA if self.is_transparent else 0
+        )
+        if is_rle:
+            # Encoded again on the first blit after a render.
+            self.surf.set_alpha(255, pg.RLEACCEL)
+
+        self.children: List[Callable[[pg.Surface], None]] = []
+
+        # Render on next draw?
+        self.is_dirty: bool = True
+
+        # Times rendered, for debug and benchmarks.
+        self.renders_len: int = 0
+
+    def add_child(self, child: Callable[[pg.Surface], None]) -> None:
+        self.children.append(child)
+        self.set_dirty()
+
+    def set_dirty(self) -> None:
+        self.is_dirty = True
+
+    def render(self) -> None:
+        """
+        Clear, draw every child into my surf.
+        """
+
+        if self.is_transparent:
+            self.surf.fill((0, 0, 0, 0))
+        else:
+            self.surf.fill(self.clear_color)
+        for child in self.children:
+            child(self.surf)
+        self.is_dirty = False
+        self.renders_len += 1
+
+    def draw(
+        self, surf: pg.Surface, position: tuple[int, int] = (0, 0)
+    ) -> None:
+        """
+        Render if dirty, blit my surf.
+        """
+
+        if self.is_dirty:
+            self.render()
+        surf.blit(self.surf, position)
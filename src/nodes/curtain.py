@@ -86,7 +86,7 @@ class Curtain:
             self.fade_counter = self.fade_duration
 
         # Set surf alpha.
-        self.surf.set_alpha(self.alpha)
+        self.set_surf_alpha()
 
         # Store truncated float.
         self.remainder: float = 0
@@ -147,6 +147,14 @@ class Curtain:
         self.remainder = 0
         self.fade_counter = self.fade_duration
 
+    def set_surf_alpha(self) -> None:
+        """
+        Surf alpha from alpha.
+        """
+
+        # Fully opaque? No alpha, blending at 255 is far slower.
+        self.surf.set_alpha(None if self.alpha == 255 else self.alpha)
+
     def set_max_alpha(self, value: int) -> None:
         """
         Sets the max_alpha of the surface.
@@ -203,7 +211,7 @@ class Curtain:
         self.remainder = lerp_alpha - self.alpha
 
         # Set surf alpha.
-        self.surf.set_alpha(self.alpha)
+        self.set_surf_alpha()
 
         # Counter is 0?
         if self.fade_counter == 0:
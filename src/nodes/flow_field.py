@@ -0,0 +1,274 @@
+from math import sqrt
+from typing import List
+from typing import Tuple
+
+import numpy as np
+from constants import TILE_HEIGHT
+from constants import TILE_WIDTH
+from nodes.tile_grid import TileGrid
+from typeguard import typechecked
+
+# Diagonal direction length.
+HALF_SQRT_2: float = sqrt(2) / 2
+
+
+@typechecked
+class FlowField:
+    """
+    Shared navigation for many enemies chasing one target.
+    Every tile stores how many steps it is from the target, and which
+    way to go to get closer. Agents only look up their tile.
+
+    Distances grow one ring per wavefront step, all tiles at once in
+    NumPy. A new field is only built when the target changes tile or
+    the grid changes, a few rings per update. Agents keep reading the
+    last finished field until the new one is done.
+
+    SOLID tiles block, every other tile kind is walkable.
+
+    Parameters:
+    - grid: room solidity.
+    - rings_per_update: wavefront steps per update.
+
+    Properties:
+    - distances: [row, col] steps to target, -1 unreachable.
+    - direction_xs, direction_ys: [row, col] unit direction, 0 at target.
+
+    Update:
+    - grow the field being built.
+    - swap it in when done.
+    """
+
+    # Neighbor (dx, dy), straight first so ties go straight.
+    OFFSETS: List[Tuple[int, int]] = [
+        (1, 0),
+        (-1, 0),
+        (0, 1),
+        (0, -1),
+        (1, 1),
+        (1, -1),
+        (-1, 1),
+        (-1, -1),
+    ]
+
+    # Not reached yet.
+    UNREACHED: int = -1
+
+    def __init__(self, grid: TileGrid, rings_per_update: int = 16):
+        self.grid: TileGrid = grid
+        self.rings_per_update: int = rings_per_update
+
+        # Finished field, what agents read.
+        self.distances: np.ndarray = np.full(
+            (grid.rows, grid.cols), self.UNREACHED, np.int32
+        )
+        self.direction_xs: np.ndarray = np.zeros(
+            (grid.rows, grid.cols), np.float32
+        )
+        self.direction_ys: np.ndarray = np.zeros(
+            (grid.rows, grid.cols), np.float32
+        )
+
+        # What the finished field was built for.
+        self.target_cell: Tuple[int, int] = (-1, -1)
+        self.version: int = grid.version
+
+        # Field being built.
+        self.is_building: bool = False
+        self.building_cell: Tuple[int, int] = (-1, -1)
+        self.building_version: int = -1
+        self.building_distances: np.ndarray = self.distances.copy()
+        self.walkables: np.ndarray = np.zeros((grid.rows, grid.cols), np.bool_)
+        self.frontier: np.ndarray = np.zeros((grid.rows, grid.cols), np.bool_)
+        self.ring: int = 0
+
+    def set_target(self, x: float, y: float) -> None:
+        """
+        Px target position.
+        Starts a new field only if the target changed tile or the grid
+        changed.
+        """
+
+        cell: Tuple[int, int] = (int(x // TILE_WIDTH), int(y // TILE_HEIGHT))
+        if self.is_building:
+            if (
+                cell == self.building_cell
+                and self.grid.version == self.building_version
+            ):
+                return
+        elif cell == self.target_cell and self.grid.version == self.version:
+            return
+
+        self.start_build(cell)
+
+    def start_build(self, cell: Tuple[int, int]) -> None:
+        self.is_building = True
+        self.building_cell = cell
+        self.building_version = self.grid.version
+        self.walkables = self.grid.tiles != TileGrid.SOLID
+        self.building_distances = np.full(
+            self.walkables.shape, self.UNREACHED, np.int32
+        )
+        self.frontier = np.zeros(self.walkables.shape, np.bool_)
+        self.ring = 0
+
+        col, row = cell
+        rows, cols = self.walkables.shape
+        if 0 <= col < cols and 0 <= row < rows and self.walkables[row, col]:
+            self.frontier[row, col] = True
+            self.building_distances[row, col] = 0
+
+    def grow(self) -> bool:
+        """
+        One wavefront step, every frontier tile spreads to its 4
+        neighbors at once.
+        Returns False when nothing is left to reach.
+        """
+
+        if not self.frontier.any():
+            return False
+
+        frontier: np.ndarray = self.frontier
+        grown: np.ndarray = np.zeros_like(frontier)
+        grown[1:, :] |= frontier[:-1, :]
+        grown[:-1, :] |= frontier[1:, :]
+        grown[:, 1:] |= frontier[:, :-1]
+        grown[:, :-1] |= frontier[:, 1:]
+        grown &= self.walkables & (self.building_distances == self.UNREACHED)
+
+        self.ring += 1
+        self.building_distances[grown] = self.ring
+        self.frontier = grown
+        return True
+
+    @staticmethod
+    def get_shifted(
+        array: np.ndarray, dx: int, dy: int, fill: int
+    ) -> np.ndarray:
+        """
+        Returns array[row + dy, col + dx] for every tile.
+        Out of grid reads fill.
+        """
+
+        rows, cols = array.shape
+        shifted: np.ndarray = np.full_like(array, fill)
+        source_rows: slice = slice(max(dy, 0), rows + min(dy, 0))
+        source_cols: slice = slice(max(dx, 0), cols + min(dx, 0))
+        target_rows: slice = slice(max(-dy, 0), rows + min(-dy, 0))
+        target_cols: slice = slice(max(-dx, 0), cols + min(-dx, 0))
+        shifted[target_rows, target_cols] = array[source_rows, source_cols]
+        return shifted
+
+    def finish_build(self) -> None:
+        """
+        Point every tile at its closest neighbor, then swap the field in.
+        Diagonals need both straight neighbors walkable, no corner cuts.
+        """
+
+        # Unreached tiles and out of grid never win.
+        far: int = int(np.iinfo(np.int32).max)
+        reach_distances: np.ndarray = np.where(
+            self.building_distances == self.UNREACHED,
+            far,
+            self.building_distances,
+        )
+        best_distances: np.ndarray = reach_distances.copy()
+        best_xs: np.ndarray = np.zeros(reach_distances.shape, np.float32)
+        best_ys: np.ndarray = np.zeros(reach_distances.shape, np.float32)
+        for dx, dy in self.OFFSETS:
+            neighbor_distances: np.ndarray = self.get_shifted(
+                reach_distances, dx, dy, far
+            )
+            is_closers: np.ndarray = neighbor_distances < best_distances
+            length: float = 1.0
+            if dx != 0 and dy != 0:
+                is_closers &= self.get_shifted(self.walkables, dx, 0, False)
+                is_closers &= self.get_shifted(self.walkables, 0, dy, False)
+                length = HALF_SQRT_2
+            best_distances[is_closers] = neighbor_distances[is_closers]
+            best_xs[is_closers] = dx * length
+            best_ys[is_closers] = dy * length
+
+        self.distances = self.building_distances
+        self.direction_xs = best_xs
+        self.direction_ys = best_ys
+        self.target_cell = self.building_cell
+        self.version = self.building_version
+        self.is_building = False
+
+    def update(self, dt: int) -> None:
+        """
+        Update:
+        - grow the field being built.
+        - swap it in when done.
+        """
+
+        # Grid changed mid build? Start over on the new tiles.
+        if self.is_building and self.grid.version != self.building_version:
+            self.start_build(self.building_cell)
+        elif not self.is_building and self.grid.version != self.version:
+            self.start_build(self.target_cell)
+
+        if not self.is_building:
+            return
+
+        for _ in range(self.rings_per_update):
+            if not self.grow():
+                self.finish_build()
+                return
+
+    def build_now(self) -> None:
+        """
+        Finish the field being built this frame.
+        """
+
+        while self.is_building:
+            if not self.grow():
+                self.finish_build()
+
+    def get_direction(self, x: float, y: float) -> Tuple[float, float]:
+        """
+        Unit direction at a px position, (0, 0) at target, unreachable or
+        out of grid.
+        """
+
+        col: int = int(x // TILE_WIDTH)
+        row: int = int(y // TILE_HEIGHT)
+        rows, cols = self.direction_xs.shape
+        if 0 <= col < cols and 0 <= row < rows:
+            return (
+                float(self.direction_xs[row, col]),
+                float(self.direction_ys[row, col]),
+            )
+        return 0.0, 0.0
+
+    def get_directions(
+        self, xs: np.ndarray, ys: np.ndarray
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        get_direction for many px positions at once, like ActorStore xs.
+        """
+
+        rows, cols = self.direction_xs.shape
+        col_indexes: np.ndarray = np.floor_divide(xs, TILE_WIDTH).astype(
+            np.int64
+        )
+        row_indexes: np.ndarray = np.floor_divide(ys, TILE_HEIGHT).astype(
+            np.int64
+        )
+        is_insides: np.ndarray = (
+            (col_indexes >= 0)
+            & (col_indexes < cols)
+            & (row_indexes >= 0)
+            & (row_indexes < rows)
+        )
+        col_indexes = np.clip(col_indexes, 0, cols - 1)
+        row_indexes = np.clip(row_indexes, 0, rows - 1)
+        return (
+            np.where(
+                is_insides, self.direction_xs[row_indexes, col_indexes], 0
+            ),
+            np.where(
+                is_insides, self.direction_ys[row_indexes, col_indexes], 0
+            ),
+        )
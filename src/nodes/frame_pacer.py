@@ -0,0 +1,158 @@
+from time import perf_counter
+from time import sleep
+from typing import List
+
+from constants import CLOCK
+from constants import FPS
+from nodes.presenter import Presenter
+from nodes.profiler import Profiler
+from typeguard import typechecked
+
+
+@typechecked
+class FramePacer:
+    """
+    Waits out the rest of the frame, returns dt.
+    main.py calls tick once per frame, instead of CLOCK.tick.
+
+    Modes:
+    - TICK: CLOCK.tick, sleeps on the coarse OS timer, jitters.
+    - BUSY: CLOCK.tick_busy_loop, spins the whole wait, exact but
+      keeps a core busy.
+    - HYBRID: sleeps until SPIN_MS before the deadline, spins the rest.
+    - VSYNC: display vsync waits in present, HYBRID still caps at the
+      target, for a faster screen or vsync not supported.
+
+    Targets are frames per second, 0 is uncapped.
+
+    work_ms is the last frame minus its wait, for QualityGovernor.
+    In VSYNC mode the flip wait in present counts as work.
+
+    Profiler counters, over the last SAMPLES_LEN frames, to compare
+    modes:
+    - "frame ms": mean frame time.
+    - "frame jitter ms": frame time standard deviation.
+
+    Parameters:
+    - presenter: turns display vsync on and off.
+    - profiler: game profiler.
+    - fps_target: frames per second, 0 is uncapped.
+    - mode: pacing mode.
+    """
+
+    # Modes.
+    TICK: int = 0
+    BUSY: int = 1
+    HYBRID: int = 2
+    VSYNC: int = 3
+
+    # For options menu and debug.
+    mode_names: List[str] = [
+        "tick",
+        "busy",
+        "hybrid",
+        "vsync",
+    ]
+
+    # Targets the options menu cycles, 0 is uncapped.
+    FPS_TARGETS: List[int] = [30, 60, 120, 0]
+
+    # HYBRID spins this last part of the wait, more than the OS sleep
+    # overshoot. Windows may need more.
+    SPIN_MS: float = 2.0
+
+    # Frames to measure over.
+    SAMPLES_LEN: int = 120
+
+    def __init__(
+        self,
+        presenter: Presenter,
+        profiler: Profiler,
+        fps_target: int = FPS,
+        mode: int = HYBRID,
+    ):
+        self.presenter: Presenter = presenter
+        self.profiler: Profiler = profiler
+        self.fps_target: int = fps_target
+        self.mode: int = self.TICK
+        self.set_mode(mode)
+
+        # When this frame may end, HYBRID and VSYNC.
+        self.deadline: float = perf_counter()
+
+        # Last frame ms, oldest first.
+        self.last_time: float = perf_counter()
+        self.samples: List[float] = []
+
+        # Last frame ms before waiting.
+        self.work_ms: float = 0.0
+
+    def get_budget_ms(self) -> float:
+        """
+        Ms per frame at the target, at FPS if uncapped.
+        """
+
+        return 1000 / (self.fps_target or FPS)
+
+    def set_fps_target(self, value: int) -> None:
+        self.fps_target = value
+        self.deadline = perf_counter()
+
+    def set_mode(self, value: int) -> None:
+        self.mode = value
+        self.deadline = perf_counter()
+        self.presenter.set_vsync(self.mode == self.VSYNC)
+
+    def wait(self) -> None:
+        """
+        HYBRID wait, sleep most of the way, spin the rest.
+        """
+
+        if self.fps_target == 0:
+            return
+
+        frame_s: float = 1 / self.fps_target
+        now: float = perf_counter()
+
+        # A frame or more late? Do not rush frames out to catch up.
+        if self.deadline < now - frame_s:
+            self.deadline = now
+
+        sleep_s: float = self.deadline - now - self.SPIN_MS / 1000
+        if sleep_s > 0:
+            sleep(sleep_s)
+        while perf_counter() < self.deadline:
+            pass
+        self.deadline += frame_s
+
+    def tick(self) -> int:
+        """
+        Wait for the frame to end, returns ms since the last tick.
+        """
+
+        self.work_ms = (perf_counter() - self.last_time) * 1000
+
+        dt: int = 0
+        if self.mode == self.TICK:
+            dt = CLOCK.tick(self.fps_target)
+        elif self.mode == self.BUSY:
+            dt = CLOCK.tick_busy_loop(self.fps_target)
+        else:
+            self.wait()
+            # Still tick, so CLOCK.get_fps keeps working.
+            dt = CLOCK.tick()
+
+        now: float = perf_counter()
+        self.samples.append((now - self.last_time) * 1000)
+        self.last_time = now
+        if len(self.samples) > self.SAMPLES_LEN:
+            del self.samples[0]
+
+        mean: float = sum(self.samples) / len(self.samples)
+        variance: float = sum(
+            (sample - mean) ** 2 for sample in self.samples
+        ) / len(self.samples)
+        self.profiler.set_counter("frame ms", round(mean, 2))
+        self.profiler.set_counter("frame jitter ms", round(variance**0.5, 2))
+
+        return dt
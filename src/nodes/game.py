@@ -2,23 +2,44 @@ from json import dump
 from json import load
 from typing import Any
 from typing import Dict
+from typing import Tuple
 from typing import Type
+from typing import TYPE_CHECKING
 
 from constants import DEFAULT_SETTINGS_DICT
+from constants import FPS
 from constants import JSONS_PATHS_DICT
 from constants import NATIVE_HEIGHT
 from constants import NATIVE_WIDTH
+from constants import OGGS_PATHS_DICT
 from constants import pg
+from constants import QUALITY_LOG_PATH
+from constants import SCENES_MUSIC_DICT
 from constants import WINDOW_HEIGHT
 from constants import WINDOW_WIDTH
+from nodes.asset_loader import AssetLoader
 from nodes.debug_draw import DebugDraw
+from nodes.frame_pacer import FramePacer
+from nodes.music_player import MusicPlayer
+from nodes.particle_emitter import ParticleEmitter
+from nodes.presenter import Presenter
+from nodes.profiler import Profiler
+from nodes.quadtree import QuadTree
+from nodes.quality_governor import QualityGovernor
+from nodes.room_streamer import RoomStreamer
 from nodes.sound_manager import SoundManager
+from nodes.spatial_hash import SpatialHash
+from nodes.transform_cache import TransformCache
 from scenes.created_by_splash_screen import CreatedBySplashScreen
+from scenes.loading_screen import LoadingScreen
 from scenes.made_with_splash_screen import MadeWithSplashScreen
 from scenes.main_menu import MainMenu
 from scenes.title_screen import TitleScreen
 from typeguard import typechecked
 
+if TYPE_CHECKING:
+    from nodes.options_menu import OptionsMenu
+
 
 @typechecked
 class Game:
@@ -27,7 +48,11 @@ class Game:
     - save.
     - set_is_options_menu_active.
     - set_resolution.
+    - set_fps_target.
+    - set_frame_pacing.
     - set_scene.
+    - step.
+    - end_frame.
     - quit.
     - event.
 
@@ -36,17 +61,25 @@ class Game:
     - is_options_menu_active.
     - is_debug.
     - debug_draw.
+    - profiler.
     - is_per_frame.
     - resolution_scale.
     - window_width.
     - window_height.
-    - window_surf.
     - native_y_offset.
     - input flags.
     - inputs dict, name to int. KEYBINDS
     - actors dict, name to memory.
     - scenes dict, name to memory.
+    - broadphases dict, name to memory.
     - sound_manager.
+    - music_player.
+    - asset_loader.
+    - room_streamer.
+    - transform_cache.
+    - presenter.
+    - frame_pacer.
+    - quality_governor.
     - current_scene.
     """
 
@@ -77,10 +110,29 @@ class Game:
         # The thing that does the actual debug data drawing.
         self.debug_draw: DebugDraw = DebugDraw()
 
+        # Per frame section timings, shown in the debug overlay.
+        self.profiler: Profiler = Profiler()
+
         # REMOVE IN BUILD
         # Toggle frame per frame debug mode.
         self.is_per_frame: bool = False
 
+        # Owns the window, scales native to it and flips.
+        # Older settings files do not have these.
+        self.presenter: Presenter = Presenter(
+            self.profiler,
+            bool(self.local_settings_dict.get("threaded_present", 0)),
+            bool(self.local_settings_dict.get("renderer_present", 0)),
+        )
+
+        # Waits out each frame, before the window opens so vsync is set.
+        self.frame_pacer: FramePacer = FramePacer(
+            self.presenter,
+            self.profiler,
+            self.local_settings_dict.get("fps_target", FPS),
+            self.local_settings_dict.get("frame_pacing", FramePacer.HYBRID),
+        )
+
         # Window resolution scale, size, y offset.
         # Y offset because native is shorter than window.
         self.resolution_scale: int = self.local_settings_dict[
@@ -88,9 +140,7 @@ class Game:
         ]
         self.window_width: int = WINDOW_WIDTH * self.resolution_scale
         self.window_height: int = WINDOW_HEIGHT * self.resolution_scale
-        self.window_surf: pg.Surface = pg.display.set_mode(
-            (self.window_width, self.window_height)
-        )
+        self.presenter.set_mode((self.window_width, self.window_height))
         self.native_y_offset: int = (
             (WINDOW_HEIGHT - NATIVE_HEIGHT) // 2
         ) * self.resolution_scale
@@ -162,15 +212,50 @@ class Game:
         self.scenes: Dict[str, Type[Any]] = {
             "CreatedBySplashScreen": CreatedBySplashScreen,
             "MadeWithSplashScreen": MadeWithSplashScreen,
+            "LoadingScreen": LoadingScreen,
             "TitleScreen": TitleScreen,
             "MainMenu": MainMenu,
         }
 
+        # All broadphase backends dict, name to memory.
+        # Rooms pick one by name, all take bounds first.
+        self.broadphases: Dict[str, Type[Any]] = {
+            "QuadTree": QuadTree,
+            "SpatialHash": SpatialHash,
+        }
+
         # Handles sounds.
         self.sound_manager: SoundManager = SoundManager()
 
+        # Streams music, keeps playing across scene changes.
+        self.music_player: MusicPlayer = MusicPlayer()
+        for ogg_name, ogg_path in OGGS_PATHS_DICT.items():
+            self.music_player.load_music(ogg_name, ogg_path)
+
+        # Decodes pngs and wavs on a thread pool, see LoadingScreen.
+        self.asset_loader: AssetLoader = AssetLoader(self.sound_manager)
+
+        # Loads rooms ahead of the player on a worker thread.
+        self.room_streamer: RoomStreamer = RoomStreamer(self.profiler)
+
+        # Flipped, rotated and scaled sprite copies, shared by everyone.
+        self.transform_cache: TransformCache = TransformCache(self.profiler)
+
+        # Lowers quality knobs when frames go over budget. Add knobs
+        # biggest measured saving first, see
+        # benchmarks/benchmark_quality_governor.py.
+        self.quality_governor: QualityGovernor = QualityGovernor(
+            self.frame_pacer, self.profiler
+        )
+        self.quality_governor.add_knob(
+            "particle cap",
+            len(ParticleEmitter.QUALITY_CAP_FRACTIONS),
+            ParticleEmitter.set_quality,
+        )
+
         # Keeps track of current scene.
         self.current_scene: Any = self.scenes[initial_scene](self)
+        self.play_scene_music(initial_scene)
 
     def load_or_create_settings(self) -> None:
         # Got load file on disk?
@@ -215,36 +300,32 @@ class Game:
             self.resolution_scale = value
 
             # Update local saves.
-            self.local_settings_dict[
-                "resolution_scale"
-            ] = self.resolution_scale
+            self.local_settings_dict["resolution_scale"] = (
+                self.resolution_scale
+            )
 
             # Update window size, surf and y offset
             self.window_width = WINDOW_WIDTH * self.resolution_scale
             self.window_height = WINDOW_HEIGHT * self.resolution_scale
-            self.window_surf = pg.display.set_mode(
-                (self.window_width, self.window_height)
-            )
+            self.presenter.set_mode((self.window_width, self.window_height))
             self.native_y_offset = (
                 (WINDOW_HEIGHT - NATIVE_HEIGHT) // 2
             ) * self.resolution_scale
 
         # Full screen.
         elif value == 7:
-            # Set window surface to be fullscreen size.
-            self.window_surf = pg.display.set_mode(
-                (self.window_width, self.window_height), pg.FULLSCREEN
+            # Set window to be fullscreen size.
+            window_size: Tuple[int, int] = self.presenter.set_mode(
+                (self.window_width, self.window_height), True
             )
 
             # Update self.resolution_scale with window fullscreen size.
-            self.resolution_scale = (
-                self.window_surf.get_width() // NATIVE_WIDTH
-            )
+            self.resolution_scale = window_size[0] // NATIVE_WIDTH
 
             # Update local saves.
-            self.local_settings_dict[
-                "resolution_scale"
-            ] = self.resolution_scale
+            self.local_settings_dict["resolution_scale"] = (
+                self.resolution_scale
+            )
 
             # Update window size, surf and y offset
             self.window_width = WINDOW_WIDTH * self.resolution_scale
@@ -253,18 +334,88 @@ class Game:
                 (WINDOW_HEIGHT - NATIVE_HEIGHT) // 2
             ) * self.resolution_scale
 
+    def set_fps_target(self, value: int) -> None:
+        """
+        Sets frames per second, 0 is uncapped.
+        Called by options screen.
+        """
+
+        self.frame_pacer.set_fps_target(value)
+        self.local_settings_dict["fps_target"] = value
+
+    def set_frame_pacing(self, value: int) -> None:
+        """
+        Sets FramePacer mode.
+        Called by options screen.
+        """
+
+        self.frame_pacer.set_mode(value)
+        self.local_settings_dict["frame_pacing"] = value
+
     def set_scene(self, value: str) -> None:
         """
         Sets the current scene with a new scene instance.
         """
 
         self.current_scene = self.scenes[value](self)
+        self.play_scene_music(value)
+
+    def play_scene_music(self, value: str) -> None:
+        """
+        Crossfades to the scene track, see SCENES_MUSIC_DICT.
+        No track for this scene? Current music keeps playing.
+        """
+
+        if value in SCENES_MUSIC_DICT:
+            self.music_player.play_music(SCENES_MUSIC_DICT[value], 2000)
+
+    def step(self, options_menu: "OptionsMenu", dt: int) -> None:
+        """
+        Draw and update one frame, input events already passed to event.
+        Shared by main.py and HeadlessRunner, so both run the same frame.
+        """
+
+        self.profiler.begin("scene draw")
+        self.current_scene.draw()
+        self.profiler.end("scene draw")
+
+        if self.is_options_menu_active:
+            options_menu.draw()
+            options_menu.update(dt)
+        else:
+            self.profiler.begin("scene update")
+            self.current_scene.update(dt)
+            self.profiler.end("scene update")
+
+        self.music_player.update(dt)
+
+    def end_frame(self) -> None:
+        """
+        After present, resets just events and ends every node frame.
+        """
+
+        self.reset_just_events()
+        self.sound_manager.end_frame()
+        self.transform_cache.end_frame()
+        self.room_streamer.end_frame()
+        self.profiler.end_frame()
+
+    def close(self) -> None:
+        """
+        End every thread this game started, does not exit.
+        """
+
+        self.presenter.stop()
+        self.asset_loader.close()
+        self.room_streamer.close()
 
     def quit(self) -> None:
         """
         Exit the game.
         """
 
+        self.close()
+        self.quality_governor.save_log(QUALITY_LOG_PATH)
         pg.quit()
         exit()
 
@@ -0,0 +1,148 @@
+from concurrent.futures import ProcessPoolExecutor
+from json import dump
+from multiprocessing import get_context
+from os import cpu_count
+from os.path import join
+from shutil import rmtree
+from tempfile import mkdtemp
+from time import perf_counter
+from traceback import format_exc
+from typing import Any
+from typing import Dict
+from typing import List
+from typing import Union
+
+from constants import DEFAULT_SETTINGS_DICT
+from constants import EVENTS
+from constants import JSONS_PATHS_DICT
+from constants import pg
+from nodes.game import Game
+from nodes.options_menu import OptionsMenu
+from typeguard import typechecked
+
+
+@typechecked
+class HeadlessRunner:
+    """
+    Runs many game sessions with no display, one per pool process.
+    For AI tuning and soak tests.
+
+    Each session is a Game plus OptionsMenu stepped like main.py, at
+    fixed dt, as fast as it goes: no CLOCK.tick, no window present.
+    Scripted inputs are posted as key events, so Game.event sets the
+    same input flags as a player would.
+
+    SDL must use its dummy drivers before constants is imported, in
+    every process. Set SDL_VIDEODRIVER and SDL_AUDIODRIVER to dummy in
+    the environment before starting, workers inherit it. See
+    src/run_headless.py.
+
+    Frames run Game.step and Game.end_frame, same as main.py, with no
+    present and no quality governor, there is no frame budget here.
+
+    Each session uses its own default settings json in a temp dir,
+    removed after, so sessions never read or write the player settings.
+    Its Game is closed after, so pool processes do not pile up threads.
+
+    Session dict:
+    - initial_scene: Game scenes key.
+    - frames: how many frames to step.
+    - dt: ms per frame, default 16.
+    - inputs: list of [frame, "down" or "up", action], action is a
+      settings key like "enter" or "left".
+
+    Parameters:
+    - workers_len: pool processes, default every core.
+    """
+
+    def __init__(self, workers_len: Union[int, None] = None):
+        self.workers_len: int = workers_len or cpu_count() or 1
+
+    @staticmethod
+    def run_session(session: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Worker process, one session, returns its metrics.
+        Errors are reported in the metrics, not raised.
+        """
+
+        dt: int = session.get("dt", 16)
+        frames: int = session["frames"]
+
+        # Frame to its input events.
+        frame_inputs: Dict[int, List[List[Any]]] = {}
+        for frame_input in session.get("inputs", []):
+            frame_inputs.setdefault(frame_input[0], []).append(frame_input)
+
+        metrics: Dict[str, Any] = {
+            "session": session,
+            "frames": 0,
+            "seconds": 0.0,
+            "error": None,
+        }
+        start: float = perf_counter()
+        settings_dir: str = mkdtemp()
+        game: Union[Game, None] = None
+        try:
+            JSONS_PATHS_DICT["settings.json"] = join(
+                settings_dir, "settings.json"
+            )
+            with open(JSONS_PATHS_DICT["settings.json"], "w") as settings_json:
+                dump(DEFAULT_SETTINGS_DICT, settings_json)
+
+            game = Game(session["initial_scene"])
+            options_menu: OptionsMenu = OptionsMenu(game)
+            for frame in range(frames):
+                for _, direction, action in frame_inputs.get(frame, []):
+                    pg.event.post(
+                        pg.event.Event(
+                            pg.KEYDOWN if direction == "down" else pg.KEYUP,
+                            key=game.local_settings_dict[action],
+                        )
+                    )
+                for event in pg.event.get(EVENTS):
+                    game.event(event)
+                game.step(options_menu, dt)
+                game.end_frame()
+                metrics["frames"] = frame + 1
+
+            metrics["final_scene"] = type(game.current_scene).__name__
+            metrics["section_ms"] = {
+                name: game.profiler.get_ms(name)
+                for name in game.profiler.samples
+            }
+            metrics["counters"] = dict(game.profiler.counters)
+        except Exception:
+            metrics["error"] = format_exc()
+        finally:
+            # Not quit, that exits the worker.
+            if game is not None:
+                game.close()
+            rmtree(settings_dir, ignore_errors=True)
+
+        metrics["seconds"] = perf_counter() - start
+        return metrics
+
+    def run(self, sessions: List[Dict[str, Any]]) -> Dict[str, Any]:
+        """
+        Every session across the pool, one report, sessions in order.
+        """
+
+        start: float = perf_counter()
+        with ProcessPoolExecutor(
+            self.workers_len, mp_context=get_context("spawn")
+        ) as executor:
+            runs: List[Dict[str, Any]] = list(
+                executor.map(self.run_session, sessions)
+            )
+        seconds: float = perf_counter() - start
+
+        frames: int = sum(run["frames"] for run in runs)
+        return {
+            "workers_len": self.workers_len,
+            "sessions_len": len(runs),
+            "failed_len": sum(run["error"] is not None for run in runs),
+            "frames": frames,
+            "seconds": seconds,
+            "frames_per_second": frames / seconds if seconds else 0.0,
+            "runs": runs,
+        }
@@ -0,0 +1,165 @@
+from typing import TYPE_CHECKING
+
+from constants import pg
+from constants import TILE_HEIGHT
+from nodes.tile_grid import TileGrid
+from pygame.math import clamp
+from typeguard import typechecked
+
+
+if TYPE_CHECKING:
+    from nodes.game import Game
+
+
+@typechecked
+class KinematicBody:
+    """
+    Platformer character controller.
+    Moves a rect against a tile grid, x first then y.
+    KinematicBatch runs this same update vectorized, keep them in sync,
+    tests/test_kinematic_batch.py checks they match.
+
+    Parameters:
+    - grid: room solidity.
+    - topleft: rect topleft.
+    - size: rect size.
+
+    Properties:
+    - x, y: float topleft, rect is the int copy.
+    - velocity_x, velocity_y: px per second.
+    - is_on_floor, is_on_wall, is_on_ceiling: last update contacts.
+
+    Event:
+    - left, right, jump input flags.
+
+    Update:
+    - velocity, gravity, jump.
+    - move x, move y, slope snap.
+    - rect.
+    """
+
+    def __init__(
+        self,
+        grid: TileGrid,
+        topleft: tuple[float, float],
+        size: tuple[int, int],
+    ):
+        self.grid: TileGrid = grid
+
+        # Float position, rect is the int copy for drawing.
+        self.x: float = topleft[0]
+        self.y: float = topleft[1]
+        self.width: int = size[0]
+        self.height: int = size[1]
+        self.rect: pg.Rect = pg.Rect(topleft, size)
+
+        # Px per second.
+        self.velocity_x: float = 0.0
+        self.velocity_y: float = 0.0
+        self.run_speed: float = 90.0
+        self.jump_speed: float = 240.0
+        self.max_fall_speed: float = 300.0
+
+        # Px per second squared.
+        self.gravity: float = 720.0
+
+        # How high a tile edge can be to walk onto it, for slopes.
+        self.step_height: float = TILE_HEIGHT / 2
+
+        # How far down to stick to the floor when walking down slopes.
+        self.snap_distance: float = TILE_HEIGHT / 2
+
+        # Input.
+        self.direction: int = 0
+        self.is_jump_just_pressed: bool = False
+        self.is_jump_just_released: bool = False
+
+        # Contacts.
+        self.is_on_floor: bool = False
+        self.is_on_wall: bool = False
+        self.is_on_ceiling: bool = False
+
+    def event(self, game: "Game") -> None:
+        """
+        Read input flags.
+        """
+
+        self.direction = 0
+        if game.is_left_pressed:
+            self.direction -= 1
+        if game.is_right_pressed:
+            self.direction += 1
+        self.is_jump_just_pressed = game.is_jump_just_pressed
+        self.is_jump_just_released = game.is_jump_just_released
+
+    def update(self, dt: int) -> None:
+        """
+        Update:
+        - velocity, gravity, jump.
+        - move x, move y, slope snap.
+        - rect.
+        """
+
+        seconds: float = dt / 1000
+
+        # Run.
+        self.velocity_x = self.direction * self.run_speed
+
+        # Gravity.
+        self.velocity_y = clamp(
+            self.velocity_y + self.gravity * seconds,
+            -self.jump_speed,
+            self.max_fall_speed,
+        )
+
+        # Jump, release early for a short jump.
+        if self.is_jump_just_pressed and self.is_on_floor:
+            self.velocity_y = -self.jump_speed
+        if self.is_jump_just_released and self.velocity_y < 0:
+            self.velocity_y /= 2
+
+        was_on_floor: bool = self.is_on_floor
+
+        # Move x, can step onto low edges only while on floor.
+        self.x, self.is_on_wall = self.grid.move_x(
+            self.x,
+            self.y,
+            self.width,
+            self.height,
+            self.velocity_x * seconds,
+            self.step_height if was_on_floor else 0,
+        )
+
+        # Move y.
+        is_hit: bool = False
+        self.y, is_hit = self.grid.move_y(
+            self.x,
+            self.y,
+            self.width,
+            self.height,
+            self.velocity_y * seconds,
+        )
+        self.is_on_floor = is_hit and self.velocity_y > 0
+        self.is_on_ceiling = is_hit and self.velocity_y < 0
+        if is_hit:
+            self.velocity_y = 0
+
+        # Walked off a slope or ledge? Stick to floor below if close.
+        if was_on_floor and not self.is_on_floor and self.velocity_y >= 0:
+            snap_y, is_snapped = self.grid.move_y(
+                self.x,
+                self.y,
+                self.width,
+                self.height,
+                self.snap_distance,
+            )
+            if is_snapped:
+                self.y = snap_y
+                self.is_on_floor = True
+                self.velocity_y = 0
+
+        self.rect.x = round(self.x)
+        self.rect.y = round(self.y)
+
+        self.is_jump_just_pressed = False
+        self.is_jump_just_released = False
@@ -0,0 +1,35 @@
+from typing import Union
+
+from constants import pg
+from typeguard import typechecked
+
+
+@typechecked
+class Light:
+    """
+    One point light for the Lighting node.
+    Static lights never move, they are baked once per room.
+    Dynamic lights can move, set x and y freely.
+
+    Parameters:
+    - name: profiler section name, unique per room.
+    - position: px center.
+    - radius: px reach.
+    - color: at the center, fades to black at radius.
+    - is_static: baked.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        position: tuple[float, float],
+        radius: int,
+        color: Union[str, pg.Color] = "white",
+        is_static: bool = False,
+    ):
+        self.name: str = name
+        self.x: float = position[0]
+        self.y: float = position[1]
+        self.radius: int = radius
+        self.color: pg.Color = pg.Color(color)
+        self.is_static: bool = is_static
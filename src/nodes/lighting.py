@@ -0,0 +1,271 @@
+from math import ceil
+from typing import Dict
+from typing import List
+from typing import Tuple
+from typing import Union
+
+import numpy as np
+from constants import NATIVE_HEIGHT
+from constants import NATIVE_WIDTH
+from constants import pg
+from constants import TILE_HEIGHT
+from constants import TILE_WIDTH
+from nodes.light import Light
+from nodes.profiler import Profiler
+from nodes.raycaster import Raycaster
+from nodes.tile_grid import TileGrid
+from typeguard import typechecked
+
+
+@typechecked
+class Lighting:
+    """
+    2D lights with tile shadows, multiplied onto the scene.
+
+    Each light is a sprite: its visibility polygon (see Raycaster)
+    filled white, times a radial falloff of its color.
+    Sprites are added on a small light map, ambient color where no light
+    reaches, then the light map is scaled up and multiplied onto the
+    given surf with BLEND_RGB_MULT.
+
+    Caches, only dropped when SOLID tiles change:
+    - static lights: baked once per room into one room sized layer.
+    - dynamic lights: sprite kept until the light moves.
+    - falloffs: one per radius and color.
+
+    Every light shows up in the profiler as "light <name>".
+
+    Parameters:
+    - grid: room solidity.
+    - raycaster: shared room raycaster, room calls its update.
+    - profiler: game profiler.
+    - ambient: color where no light reaches.
+
+    Update:
+    - drop caches if SOLID tiles changed.
+
+    Draw:
+    - light map on given surf.
+    """
+
+    # Native px per light map px.
+    LIGHT_MAP_SCALE: int = 2
+
+    # Rays per visibility polygon.
+    RAYS_LEN: int = 180
+
+    def __init__(
+        self,
+        grid: TileGrid,
+        raycaster: Raycaster,
+        profiler: Profiler,
+        ambient: str = "gray20",
+    ):
+        self.grid: TileGrid = grid
+        self.raycaster: Raycaster = raycaster
+        self.profiler: Profiler = profiler
+        self.ambient: pg.Color = pg.Color(ambient)
+        self.lights: List[Light] = []
+
+        self.light_map: pg.Surface = pg.Surface(
+            (
+                ceil(NATIVE_WIDTH / self.LIGHT_MAP_SCALE),
+                ceil(NATIVE_HEIGHT / self.LIGHT_MAP_SCALE),
+            )
+        )
+
+        # All static lights, room sized, light map scale.
+        self.static_surf: pg.Surface = pg.Surface((1, 1))
+        self.is_static_dirty: bool = True
+
+        # (radius, r, g, b) to falloff surf.
+        self.falloff_surfs: Dict[Tuple[int, int, int, int], pg.Surface] = {}
+
+        # Dynamic light name to (x, y, radius, r, g, b) and its sprite.
+        self.sprites: Dict[
+            str,
+            Tuple[Tuple[float, float, int, int, int, int], pg.Surface],
+        ] = {}
+
+        # SOLID tiles snapshot, grid version bumps on any tile change.
+        self.solids: np.ndarray = self.grid.tiles == TileGrid.SOLID
+        self.grid_version: int = self.grid.version
+
+    def add_light(self, light: Light) -> None:
+        self.lights.append(light)
+        if light.is_static:
+            self.is_static_dirty = True
+
+    def remove_light(self, light: Light) -> None:
+        self.lights.remove(light)
+        if light.is_static:
+            self.is_static_dirty = True
+        self.sprites.pop(light.name, None)
+        self.profiler.forget(f"light {light.name}")
+
+    def update(self, dt: int) -> None:
+        """
+        Update:
+        - drop caches if SOLID tiles changed.
+        """
+
+        if self.grid_version == self.grid.version:
+            return
+        self.grid_version = self.grid.version
+
+        # Only a non SOLID tile changed? Shadows are the same.
+        solids: np.ndarray = self.grid.tiles == TileGrid.SOLID
+        if np.array_equal(solids, self.solids):
+            return
+
+        self.solids = solids
+        self.is_static_dirty = True
+        self.sprites = {}
+
+    def get_falloff_surf(self, radius: int, color: pg.Color) -> pg.Surface:
+        """
+        Light map scale square, color at center, black at radius.
+        """
+
+        falloff_key: Tuple[int, int, int, int] = (
+            radius,
+            color.r,
+            color.g,
+            color.b,
+        )
+        surf: Union[pg.Surface, None] = self.falloff_surfs.get(falloff_key)
+        if surf is not None:
+            return surf
+
+        size: int = ceil(radius * 2 / self.LIGHT_MAP_SCALE)
+        centers: np.ndarray = (np.arange(size) + 0.5) * self.LIGHT_MAP_SCALE
+        distances: np.ndarray = np.hypot(
+            centers[:, None] - radius, centers[None, :] - radius
+        )
+        intensities: np.ndarray = np.clip(1 - distances / radius, 0, 1) ** 2
+        rgbs: np.ndarray = intensities[:, :, None] * np.array(
+            (color.r, color.g, color.b)
+        )
+        surf = pg.surfarray.make_surface(rgbs.astype(np.uint8))
+        self.falloff_surfs[falloff_key] = surf
+        return surf
+
+    def make_sprite(self, light: Light) -> pg.Surface:
+        """
+        Visibility polygon filled white, times the falloff.
+        """
+
+        falloff_surf: pg.Surface = self.get_falloff_surf(
+            light.radius, light.color
+        )
+        sprite: pg.Surface = pg.Surface(falloff_surf.get_size())
+        polygon: List[Tuple[float, float]] = (
+            self.raycaster.get_visibility_polygon(
+                light.x, light.y, self.RAYS_LEN, float(light.radius)
+            )
+        )
+        left: float = light.x - light.radius
+        top: float = light.y - light.radius
+        pg.draw.polygon(
+            sprite,
+            "white",
+            [
+                (
+                    (x - left) / self.LIGHT_MAP_SCALE,
+                    (y - top) / self.LIGHT_MAP_SCALE,
+                )
+                for x, y in polygon
+            ],
+        )
+        sprite.blit(falloff_surf, (0, 0), special_flags=pg.BLEND_RGB_MULT)
+        return sprite
+
+    def bake_static(self) -> None:
+        """
+        Add every static light sprite on the room sized layer.
+        """
+
+        self.static_surf = pg.Surface(
+            (
+                ceil(self.grid.cols * TILE_WIDTH / self.LIGHT_MAP_SCALE),
+                ceil(self.grid.rows * TILE_HEIGHT / self.LIGHT_MAP_SCALE),
+            )
+        )
+        for light in self.lights:
+            if not light.is_static:
+                continue
+
+            self.profiler.begin(f"light {light.name}")
+            self.static_surf.blit(
+                self.make_sprite(light),
+                (
+                    (light.x - light.radius) / self.LIGHT_MAP_SCALE,
+                    (light.y - light.radius) / self.LIGHT_MAP_SCALE,
+                ),
+                special_flags=pg.BLEND_RGB_ADD,
+            )
+            self.profiler.end(f"light {light.name}")
+        self.is_static_dirty = False
+
+    def draw(
+        self, surf: pg.Surface, camera_x: int = 0, camera_y: int = 0
+    ) -> None:
+        """
+        Multiply the light map onto surf, after the room, before the UI.
+        Camera is the room px at surf topleft.
+        """
+
+        self.profiler.begin("lighting")
+
+        if self.is_static_dirty:
+            self.bake_static()
+
+        self.light_map.fill(self.ambient)
+        self.light_map.blit(
+            self.static_surf,
+            (
+                -camera_x / self.LIGHT_MAP_SCALE,
+                -camera_y / self.LIGHT_MAP_SCALE,
+            ),
+            special_flags=pg.BLEND_RGB_ADD,
+        )
+
+        for light in self.lights:
+            if light.is_static:
+                continue
+
+            self.profiler.begin(f"light {light.name}")
+
+            # Moved or changed? Remake its sprite.
+            sprite_key: Tuple[float, float, int, int, int, int] = (
+                light.x,
+                light.y,
+                light.radius,
+                light.color.r,
+                light.color.g,
+                light.color.b,
+            )
+            cached: Union[
+                Tuple[Tuple[float, float, int, int, int, int], pg.Surface],
+                None,
+            ] = self.sprites.get(light.name)
+            if cached is None or cached[0] != sprite_key:
+                cached = (sprite_key, self.make_sprite(light))
+                self.sprites[light.name] = cached
+
+            self.light_map.blit(
+                cached[1],
+                (
+                    (light.x - light.radius - camera_x) / self.LIGHT_MAP_SCALE,
+                    (light.y - light.radius - camera_y) / self.LIGHT_MAP_SCALE,
+                ),
+                special_flags=pg.BLEND_RGB_ADD,
+            )
+            self.profiler.end(f"light {light.name}")
+
+        surf.blit(
+            pg.transform.scale(self.light_map, surf.get_size()),
+            (0, 0),
+            special_flags=pg.BLEND_RGB_MULT,
+        )
+        self.profiler.end("lighting")
@@ -0,0 +1,305 @@
+from os.path import getsize
+from typing import Dict
+from typing import List
+from typing import Union
+
+from constants import MIXER_BUFFER
+from constants import MIXER_CHANNELS
+from constants import MIXER_SIZE
+from constants import pg
+from nodes.resource_pack import ResourcePack
+from pygame.math import clamp
+from pygame.math import lerp
+from typeguard import typechecked
+
+
+@typechecked
+class MusicPlayer:
+    """
+    Streams music tracks with pg.mixer.music.
+    Tracks are decoded in small chunks while playing, never fully in RAM.
+    Lives in game, so it keeps playing across scene changes.
+
+    Game calls play_music on scene change, see SCENES_MUSIC_DICT. Same
+    track as the one playing? Nothing happens. Other track? Crossfade.
+
+    Tracks are played once, loops are counted here and the track is
+    played again when it ends, so position never runs past the end.
+
+    States:
+    - IDLE.
+    - FADING_OUT.
+    - FADING_IN.
+    - PLAYING.
+
+    Parameters:
+    - none.
+
+    Update:
+    - state machine, fade volume, next queued track.
+    """
+
+    # States.
+    IDLE: int = 0
+    FADING_OUT: int = 1
+    FADING_IN: int = 2
+    PLAYING: int = 3
+
+    # REMOVE IN BUILD
+    # For debug draw.
+    state_names: List[str] = [
+        "IDLE",
+        "FADING_OUT",
+        "FADING_IN",
+        "PLAYING",
+    ]
+
+    def __init__(self) -> None:
+        # No audio device? Then everything is a no op.
+        self.is_mixer_ready: bool = pg.mixer.get_init() is not None
+
+        # Track name to file path, files are only opened on play.
+        self.track_paths: Dict[str, str] = {}
+
+        # Track name to seconds, where to continue from on resume.
+        self.resume_positions: Dict[str, float] = {}
+
+        # Track names to play after the current one ends.
+        self.queue: List[str] = []
+
+        # Currently playing track.
+        self.current_track: Union[str, None] = None
+        # Plays left after this one, -1 forever.
+        self.current_loops: int = 0
+        # Seconds offset the current track was started from.
+        self.start_position: float = 0.0
+
+        # Track to play once fade out is done.
+        self.next_track: Union[str, None] = None
+        self.next_loops: int = 0
+        self.next_is_resume: bool = False
+
+        # Fade volume.
+        self.max_volume: float = 1.0
+        self.fade_duration: float = 0.0
+        self.fade_counter: float = 0.0
+
+        self.state: int = self.IDLE
+
+    def load_music(self, name: str, path: str) -> None:
+        """
+        Register a track path. Nothing is decoded here.
+        """
+
+        self.track_paths[name] = path
+
+    def play_music(
+        self,
+        name: str,
+        crossfade_duration: float = 1000.0,
+        loops: int = -1,
+        is_resume: bool = False,
+    ) -> None:
+        """
+        Crossfade to a track.
+        Half the duration fades the old track out, half fades new in.
+        is_resume continues the track from where it was left.
+        """
+
+        if not self.is_mixer_ready or name not in self.track_paths:
+            return
+
+        # Already playing this track? Keep playing.
+        if name == self.current_track and self.state in [
+            self.FADING_IN,
+            self.PLAYING,
+        ]:
+            return
+
+        self.next_track = name
+        self.next_loops = loops
+        self.next_is_resume = is_resume
+        self.fade_duration = crossfade_duration / 2
+
+        # Nothing playing? Fade in right away.
+        if self.current_track is None:
+            self.start_next_track()
+            return
+
+        # Already fading out? Keep fading, next_track is swapped.
+        if self.state != self.FADING_OUT:
+            self.set_state(self.FADING_OUT)
+
+    def queue_music(self, name: str) -> None:
+        """
+        Play this track once the current one ends.
+        """
+
+        if name in self.track_paths:
+            self.queue.append(name)
+
+    def stop_music(self, fade_duration: float = 1000.0) -> None:
+        """
+        Fade out and stop, remembers position for resume.
+        """
+
+        if self.current_track is None:
+            return
+
+        self.next_track = None
+        self.queue = []
+        self.fade_duration = fade_duration
+        self.set_state(self.FADING_OUT)
+
+    def set_max_volume(self, value: float) -> None:
+        self.max_volume = clamp(value, 0.0, 1.0)
+        if self.state == self.PLAYING:
+            pg.mixer.music.set_volume(self.max_volume)
+
+    def get_position(self) -> float:
+        """
+        Returns current track position in seconds.
+        """
+
+        if self.current_track is None:
+            return 0.0
+
+        # get_pos counts from the last play call, not track start.
+        return self.start_position + max(pg.mixer.music.get_pos(), 0) / 1000
+
+    def start_next_track(self) -> None:
+        """
+        Plays next_track from 0 or its resume position, fades it in.
+        """
+
+        if self.next_track is None:
+            return
+
+        start_position: float = 0.0
+        if self.next_is_resume:
+            start_position = self.resume_positions.get(self.next_track, 0.0)
+
+        ResourcePack.load_music(self.track_paths[self.next_track])
+        pg.mixer.music.set_volume(0.0)
+        # Play once, update plays it again for loops.
+        try:
+            pg.mixer.music.play(0, start_position)
+        # Format cannot seek? Play from 0.
+        except pg.error:
+            start_position = 0.0
+            pg.mixer.music.play(0)
+
+        self.current_track = self.next_track
+        self.current_loops = self.next_loops
+        self.start_position = start_position
+        self.next_track = None
+
+        self.set_state(self.FADING_IN)
+
+    def update(self, dt: int) -> None:
+        """
+        Update:
+        - loop track.
+        - state machine.
+        """
+
+        # Track ended with loops left? Play it again from 0.
+        if (
+            self.state in [self.FADING_IN, self.PLAYING]
+            and self.current_loops != 0
+            and not pg.mixer.music.get_busy()
+        ):
+            if self.current_loops > 0:
+                self.current_loops -= 1
+            pg.mixer.music.play(0)
+            self.start_position = 0.0
+
+        if self.state == self.FADING_OUT:
+            self.fade_counter += dt
+            fraction: float = self.get_fade_fraction()
+            pg.mixer.music.set_volume(lerp(self.max_volume, 0.0, fraction))
+
+            if fraction == 1:
+                # Remember where to resume, then stop.
+                if self.current_track is not None:
+                    self.resume_positions[self.current_track] = (
+                        self.get_position()
+                    )
+                pg.mixer.music.stop()
+                pg.mixer.music.unload()
+                self.current_track = None
+                self.set_state(self.IDLE)
+                self.start_next_track()
+
+        elif self.state == self.FADING_IN:
+            self.fade_counter += dt
+            fraction = self.get_fade_fraction()
+            pg.mixer.music.set_volume(lerp(0.0, self.max_volume, fraction))
+
+            if fraction == 1:
+                self.set_state(self.PLAYING)
+
+        elif self.state == self.PLAYING:
+            # Track ended? Play next queued track.
+            if not pg.mixer.music.get_busy():
+                if self.current_track is not None:
+                    self.resume_positions.pop(self.current_track, None)
+                self.current_track = None
+                self.set_state(self.IDLE)
+                if self.queue:
+                    self.next_track = self.queue.pop(0)
+                    self.next_loops = 0
+                    self.next_is_resume = False
+                    self.start_next_track()
+
+    def get_fade_fraction(self) -> float:
+        if self.fade_duration <= 0:
+            return 1.0
+        return clamp(self.fade_counter / self.fade_duration, 0.0, 1.0)
+
+    def set_state(self, value: int) -> None:
+        self.state = value
+
+        # Any fade restarts counter.
+        if self.state in [self.FADING_IN, self.FADING_OUT]:
+            self.fade_counter = 0.0
+
+        elif self.state == self.PLAYING:
+            pg.mixer.music.set_volume(self.max_volume)
+
+    def get_stats(self) -> Dict[str, float]:
+        """
+        Returns music memory use.
+        - streamed_file_bytes: registered track files on disk.
+        - stream_buffer_bytes: what streaming keeps decoded at a time.
+        - position: current track seconds.
+        """
+
+        streamed_file_bytes: int = 0
+        for path in self.track_paths.values():
+            try:
+                streamed_file_bytes += getsize(path)
+            except OSError:
+                pass
+
+        return {
+            "streamed_file_bytes": streamed_file_bytes,
+            "stream_buffer_bytes": (
+                MIXER_BUFFER * MIXER_CHANNELS * (abs(MIXER_SIZE) // 8)
+            ),
+            "position": self.get_position(),
+        }
+
+    # REMOVE IN BUILD
+    def get_debug_text(self) -> str:
+        """
+        One line summary for debug draw.
+        """
+
+        stats: Dict[str, float] = self.get_stats()
+        return (
+            f"music: {self.current_track} "
+            f"{self.state_names[self.state]} "
+            f"pos: {stats['position']:.1f} "
+            f"stream buffer: {int(stats['stream_buffer_bytes'])} b"
+        )
@@ -2,6 +2,7 @@ from typing import List
 from typing import TYPE_CHECKING
 
 from constants import FONT
+from constants import FPS
 from constants import NATIVE_HEIGHT
 from constants import NATIVE_RECT
 from constants import NATIVE_SURF
@@ -10,10 +11,10 @@ from constants import pg
 from nodes.button import Button
 from nodes.button_container import ButtonContainer
 from nodes.curtain import Curtain
+from nodes.frame_pacer import FramePacer
 from nodes.timer import Timer
 from typeguard import typechecked
 
-
 if TYPE_CHECKING:
     from nodes.game import Game
 
@@ -44,10 +45,8 @@ class OptionsMenu:
 
     Draw:
     - clear curtain.
-    - draw title.
     - button container.
-    - resolution texts.
-    - decorations.
+    - labels, title, option texts and decorations.
     - draw curtain on native.
     """
 
@@ -70,6 +69,15 @@ class OptionsMenu:
         "REBIND",
     ]
 
+    # Settings that are not key binds, rebind ignores them.
+    not_key_names: List[str] = [
+        "resolution_scale",
+        "threaded_present",
+        "renderer_present",
+        "fps_target",
+        "frame_pacing",
+    ]
+
     def __init__(self, game: "Game"):
         # For input and toggle options menu mode.
         self.game = game
@@ -142,6 +150,20 @@ class OptionsMenu:
             (4, 2),
             "press enter to rebind",
         )
+        self.fps_target_button: Button = Button(
+            (149, self.button_height),
+            (87, 18),
+            "frame rate",
+            (4, 2),
+            "set frame rate cap",
+        )
+        self.frame_pacing_button: Button = Button(
+            (149, self.button_height),
+            (87, 18),
+            "frame pacing",
+            (4, 2),
+            "set how frames are timed",
+        )
         self.apply_button: Button = Button(
             (73, self.button_height),
             (87, 18),
@@ -168,6 +190,8 @@ class OptionsMenu:
                 self.resolution_button,
                 self.up_input_button,
                 self.down_input_button,
+                self.fps_target_button,
+                self.frame_pacing_button,
                 self.apply_button,
                 self.reset_button,
                 self.exit_button,
@@ -235,6 +259,31 @@ class OptionsMenu:
         self.down_input_text_rect.x -= 3
         self.down_input_text_rect.y += 2
 
+        # Frame rate texts, same order as FramePacer.FPS_TARGETS.
+        self.fps_target_texts: List[str] = [
+            "< 30 fps >",
+            "< 60 fps >",
+            "< 120 fps >",
+            "< uncapped >",
+        ]
+        self.fps_target_texts_len: int = len(self.fps_target_texts)
+        self.fps_target_index: int = 0
+        self.fps_target_text: str = ""
+        self.fps_target_text_rect: pg.Rect = pg.Rect(0, 0, 0, 0)
+        self.set_fps_target_index(
+            self.get_fps_target_index(self.game.frame_pacer.fps_target)
+        )
+
+        # Frame pacing texts, same order as FramePacer modes.
+        self.frame_pacing_texts: List[str] = [
+            f"< {mode_name} >" for mode_name in FramePacer.mode_names
+        ]
+        self.frame_pacing_texts_len: int = len(self.frame_pacing_texts)
+        self.frame_pacing_index: int = 0
+        self.frame_pacing_text: str = ""
+        self.frame_pacing_text_rect: pg.Rect = pg.Rect(0, 0, 0, 0)
+        self.set_frame_pacing_index(self.game.frame_pacer.mode)
+
         # Decoration lines.
         self.decoration_vertical_start = (160, 18)
         self.decoration_vertical_x: int = 160
@@ -287,6 +336,20 @@ class OptionsMenu:
             pg.key.name(self.game.local_settings_dict["down"]),
         )
 
+        # Frame rate and pacing texts, older settings files lack them.
+        self.set_fps_target_index(
+            self.get_fps_target_index(
+                self.game.local_settings_dict.get("fps_target", FPS)
+            )
+        )
+        self.game.set_fps_target(FramePacer.FPS_TARGETS[self.fps_target_index])
+        self.set_frame_pacing_index(
+            self.game.local_settings_dict.get(
+                "frame_pacing", FramePacer.HYBRID
+            )
+        )
+        self.game.set_frame_pacing(self.frame_pacing_index)
+
     def update_input_text(self, button: Button, text: str) -> None:
         """
         Input texts are not classes, have to check one by one.
@@ -333,6 +396,51 @@ class OptionsMenu:
         self.resolution_text_rect.x -= 3
         self.resolution_text_rect.y += 2
 
+    def get_fps_target_index(self, fps_target: int) -> int:
+        """
+        Index in FramePacer.FPS_TARGETS, FPS if not in there.
+        """
+
+        if fps_target in FramePacer.FPS_TARGETS:
+            return FramePacer.FPS_TARGETS.index(fps_target)
+        return FramePacer.FPS_TARGETS.index(FPS)
+
+    def set_fps_target_index(self, value: int) -> None:
+        """
+        Left and right input while frame rate button is focused:
+        - fps_target_index (modulo wrap)
+        - fps_target_text
+        - fps_target_text_rect
+        """
+
+        self.fps_target_index = value % self.fps_target_texts_len
+        self.fps_target_text = self.fps_target_texts[self.fps_target_index]
+        self.fps_target_text_rect = FONT.get_rect(self.fps_target_text)
+        self.fps_target_text_rect.topright = (
+            self.fps_target_button.rect.topright
+        )
+        self.fps_target_text_rect.x -= 3
+        self.fps_target_text_rect.y += 2
+
+    def set_frame_pacing_index(self, value: int) -> None:
+        """
+        Left and right input while frame pacing button is focused:
+        - frame_pacing_index (modulo wrap)
+        - frame_pacing_text
+        - frame_pacing_text_rect
+        """
+
+        self.frame_pacing_index = value % self.frame_pacing_texts_len
+        self.frame_pacing_text = self.frame_pacing_texts[
+            self.frame_pacing_index
+        ]
+        self.frame_pacing_text_rect = FONT.get_rect(self.frame_pacing_text)
+        self.frame_pacing_text_rect.topright = (
+            self.frame_pacing_button.rect.topright
+        )
+        self.frame_pacing_text_rect.x -= 3
+        self.frame_pacing_text_rect.y += 2
+
     def on_entry_delay_timer_end(self) -> None:
         """
         Delay ends, starts going to opaque.
@@ -403,34 +511,26 @@ class OptionsMenu:
             # Exit state to REBIND.
             self.set_state(self.REBIND)
 
-    def draw(self) -> None:
+    def draw_labels(self, surf: pg.Surface) -> None:
         """
-        Draw:
-        - clear curtain.
-        - draw title.
-        - button container.
+        Draw over the buttons:
+        - title.
         - resolution texts.
+        - frame rate and pacing texts.
         - decorations.
-        - draw curtain on native.
         """
 
-        # Clear curtain.
-        self.curtain.surf.fill(self.native_clear_color)
-
-        # Draw title.
+        # Title.
         FONT.render_to(
-            self.curtain.surf,
+            surf,
             self.title_rect,
             self.title_text,
             self.font_color,
         )
 
-        # Button container.
-        self.button_container.draw(self.curtain.surf)
-
         # Resolution texts.
         FONT.render_to(
-            self.curtain.surf,
+            surf,
             self.resolution_text_rect,
             self.resolution_text,
             self.font_color,
@@ -438,7 +538,7 @@ class OptionsMenu:
 
         # Up input text.
         FONT.render_to(
-            self.curtain.surf,
+            surf,
             self.up_input_text_rect,
             self.up_input_text,
             self.font_color,
@@ -446,28 +546,62 @@ class OptionsMenu:
 
         # Down input text.
         FONT.render_to(
-            self.curtain.surf,
+            surf,
             self.down_input_text_rect,
             self.down_input_text,
             self.font_color,
         )
 
+        # Frame rate text.
+        FONT.render_to(
+            surf,
+            self.fps_target_text_rect,
+            self.fps_target_text,
+            self.font_color,
+        )
+
+        # Frame pacing text.
+        FONT.render_to(
+            surf,
+            self.frame_pacing_text_rect,
+            self.frame_pacing_text,
+            self.font_color,
+        )
+
         # Decorations.
         pg.draw.line(
-            self.curtain.surf,
+            surf,
             "#0193bc",
             (self.decoration_horizontal_left, self.decoration_horizontal_y),
             (self.decoration_horizontal_right, self.decoration_horizontal_y),
             1,
         )
         pg.draw.line(
-            self.curtain.surf,
+            surf,
             "#0193bc",
             (self.decoration_vertical_x, self.decoration_vertical_top),
             (self.decoration_vertical_x, self.decoration_vertical_bottom),
             1,
         )
 
+    def draw(self) -> None:
+        """
+        Draw:
+        - clear curtain.
+        - button container.
+        - labels.
+        - draw curtain on native.
+        """
+
+        # Clear curtain.
+        self.curtain.surf.fill(self.native_clear_color)
+
+        # Button container.
+        self.button_container.draw(self.curtain.surf)
+
+        # Labels, over the buttons.
+        self.draw_labels(self.curtain.surf)
+
         # Draw curtain on native.
         self.curtain.draw(NATIVE_SURF, 0)
 
@@ -532,12 +666,40 @@ class OptionsMenu:
                             # Update game.local_settings_dict resolution.
                             self.game.set_resolution(self.resolution_index)
 
+            # Focusing on frame rate or frame pacing button?
+            elif self.focused_button in [
+                self.fps_target_button,
+                self.frame_pacing_button,
+            ]:
+                # Get left right direction.
+                direction: int = 0
+                if self.game.is_left_just_pressed:
+                    direction -= 1
+                if self.game.is_right_just_pressed:
+                    direction += 1
+                # Update index, apply to game.local_settings_dict.
+                if direction != 0:
+                    if self.focused_button == self.fps_target_button:
+                        self.set_fps_target_index(
+                            self.fps_target_index + direction
+                        )
+                        self.game.set_fps_target(
+                            FramePacer.FPS_TARGETS[self.fps_target_index]
+                        )
+                    else:
+                        self.set_frame_pacing_index(
+                            self.frame_pacing_index + direction
+                        )
+                        self.game.set_frame_pacing(self.frame_pacing_index)
+
         # REBIND state.
         elif self.state == self.REBIND:
             # Pressed any key?
             if self.game.is_any_key_just_pressed:
                 # Find if pressed key is used already?
                 for key_name, key_int in self.game.local_settings_dict.items():
+                    if key_name in self.not_key_names:
+                        continue
                     # Update text to alert message. Return.
                     if self.game.this_frame_event.key == key_int:
                         self.update_input_text(
@@ -547,13 +709,13 @@ class OptionsMenu:
 
                 # Rebind. Update game.local_settings_dict input and input text.
                 if self.focused_button == self.up_input_button:
-                    self.game.local_settings_dict[
-                        "up"
-                    ] = self.game.this_frame_event.key
+                    self.game.local_settings_dict["up"] = (
+                        self.game.this_frame_event.key
+                    )
                 elif self.focused_button == self.down_input_button:
-                    self.game.local_settings_dict[
-                        "down"
-                    ] = self.game.this_frame_event.key
+                    self.game.local_settings_dict["down"] = (
+                        self.game.this_frame_event.key
+                    )
                 self.update_input_text(
                     self.focused_button,
                     pg.key.name(self.game.this_frame_event.key),
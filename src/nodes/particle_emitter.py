@@ -0,0 +1,226 @@
+from typing import List
+from typing import Tuple
+from typing import Union
+
+import numpy as np
+from constants import pg
+from typeguard import typechecked
+
+
+@typechecked
+class ParticleEmitter:
+    """
+    Dust, sparks, hit effects.
+    Particles live in preallocated NumPy arrays, no per particle object.
+    Capacity is fixed, emitting when full recycles the oldest particles.
+
+    Quality, QualityGovernor knob, shared by every emitter:
+    - emit only uses the first cap_fraction of capacity, so fewer live.
+
+    Draw modes:
+    - BLITS: one Surface.blits call, particle surf with stepped alpha.
+    - PIXELS: 1 px particles, alpha blended into surfarray pixels.
+
+    Parameters:
+    - capacity: max particles alive.
+    - color: particle color.
+    - lifetime: max ms a particle lives, each gets 50% - 100% of it.
+    - speed: max px per second, each gets 50% - 100% of it.
+    - gravity: px per second squared, added to y velocity.
+    - draw_mode: BLITS or PIXELS.
+    - surf: particle surf for BLITS, None for a 1 px color square.
+
+    Update:
+    - velocity, position, age, alpha.
+
+    Draw:
+    - alive particles.
+    """
+
+    # Draw modes.
+    BLITS: int = 0
+    PIXELS: int = 1
+
+    # How many alpha levels BLITS mode pre renders.
+    ALPHA_STEPS: int = 16
+
+    # Capacity fraction per quality level, see set_quality.
+    QUALITY_CAP_FRACTIONS: List[float] = [1.0, 0.5, 0.25]
+    cap_fraction: float = 1.0
+
+    def __init__(
+        self,
+        capacity: int,
+        color: str,
+        lifetime: float,
+        speed: float,
+        gravity: float,
+        draw_mode: int = BLITS,
+        surf: Union[pg.Surface, None] = None,
+    ):
+        self.capacity: int = capacity
+        self.color: pg.Color = pg.Color(color)
+        self.lifetime: float = lifetime
+        self.speed: float = speed
+        self.gravity: float = gravity
+        self.draw_mode: int = draw_mode
+
+        # Particle components, index is slot.
+        self.xs: np.ndarray = np.zeros(capacity, np.float32)
+        self.ys: np.ndarray = np.zeros(capacity, np.float32)
+        self.vxs: np.ndarray = np.zeros(capacity, np.float32)
+        self.vys: np.ndarray = np.zeros(capacity, np.float32)
+        self.ages: np.ndarray = np.zeros(capacity, np.float32)
+        self.lifetimes: np.ndarray = np.zeros(capacity, np.float32)
+        # 1 is opaque, 0 is gone.
+        self.alphas: np.ndarray = np.zeros(capacity, np.float32)
+        self.is_alives: np.ndarray = np.zeros(capacity, np.bool_)
+
+        # Ring index, the slot after the newest is the oldest.
+        self.next_slot: int = 0
+
+        # Random generator for spread.
+        self.rng: np.random.Generator = np.random.default_rng()
+
+        # BLITS mode surf, pre rendered per alpha step.
+        if surf is None:
+            surf = pg.Surface((1, 1))
+            surf.fill(self.color)
+        self.alpha_surfs: List[pg.Surface] = []
+        for step in range(self.ALPHA_STEPS):
+            alpha_surf: pg.Surface = surf.copy()
+            alpha_surf.set_alpha(round(255 * (step + 1) / self.ALPHA_STEPS))
+            self.alpha_surfs.append(alpha_surf)
+
+    @classmethod
+    def set_quality(cls, level: int) -> None:
+        """
+        QualityGovernor knob, 0 is best. Every emitter, from next emit.
+        """
+
+        cls.cap_fraction = cls.QUALITY_CAP_FRACTIONS[level]
+
+    def get_cap(self) -> int:
+        """
+        Slots emit uses, capacity times cap_fraction.
+        """
+
+        return max(round(self.capacity * self.cap_fraction), 1)
+
+    def emit(
+        self,
+        count: int,
+        position: Tuple[float, float],
+        angle: float = -90.0,
+        spread: float = 360.0,
+    ) -> None:
+        """
+        Emit count particles from position.
+        Direction is angle in degrees, +- half the spread.
+        Overwrites the oldest particles.
+        Only the first get_cap slots, those past it die out.
+        """
+
+        cap: int = self.get_cap()
+        count = min(count, cap)
+        if count <= 0:
+            return
+
+        slots: np.ndarray = (self.next_slot + np.arange(count)) % cap
+        self.next_slot = (self.next_slot + count) % cap
+
+        radians: np.ndarray = np.radians(
+            angle + (self.rng.random(count) - 0.5) * spread
+        )
+        speeds: np.ndarray = self.speed * (0.5 + self.rng.random(count) / 2)
+
+        self.xs[slots] = position[0]
+        self.ys[slots] = position[1]
+        self.vxs[slots] = np.cos(radians) * speeds
+        self.vys[slots] = np.sin(radians) * speeds
+        self.ages[slots] = 0
+        self.lifetimes[slots] = self.lifetime * (
+            0.5 + self.rng.random(count) / 2
+        )
+        self.alphas[slots] = 1
+        self.is_alives[slots] = True
+
+    def get_alive_count(self) -> int:
+        return int(np.count_nonzero(self.is_alives))
+
+    def update(self, dt: int) -> None:
+        """
+        Update:
+        - velocity, position, age, alpha.
+        """
+
+        mask: np.ndarray = self.is_alives
+        seconds: float = dt / 1000
+
+        np.add(self.vys, self.gravity * seconds, out=self.vys, where=mask)
+        np.add(self.xs, self.vxs * seconds, out=self.xs, where=mask)
+        np.add(self.ys, self.vys * seconds, out=self.ys, where=mask)
+        np.add(self.ages, dt, out=self.ages, where=mask)
+
+        # Alpha fades linearly over lifetime.
+        np.divide(
+            self.ages,
+            self.lifetimes,
+            out=self.alphas,
+            where=mask,
+        )
+        np.subtract(1, self.alphas, out=self.alphas, where=mask)
+
+        # Past lifetime? Dead.
+        self.is_alives &= self.ages < self.lifetimes
+
+    def draw(self, surf: pg.Surface) -> None:
+        """
+        Draw:
+        - alive particles.
+        """
+
+        slots: np.ndarray = np.flatnonzero(self.is_alives)
+        if slots.size == 0:
+            return
+
+        xs: np.ndarray = self.xs[slots].astype(np.int32)
+        ys: np.ndarray = self.ys[slots].astype(np.int32)
+        alphas: np.ndarray = self.alphas[slots]
+
+        if self.draw_mode == self.BLITS:
+            steps: np.ndarray = np.clip(
+                (alphas * self.ALPHA_STEPS).astype(np.int32),
+                0,
+                self.ALPHA_STEPS - 1,
+            )
+            surf.blits(
+                [
+                    (self.alpha_surfs[step], (x, y))
+                    for step, x, y in zip(
+                        steps.tolist(), xs.tolist(), ys.tolist()
+                    )
+                ],
+                False,
+            )
+
+        elif self.draw_mode == self.PIXELS:
+            # Only particles inside surf.
+            width, height = surf.get_size()
+            is_insides: np.ndarray = (
+                (xs >= 0) & (xs < width) & (ys >= 0) & (ys < height)
+            )
+            xs = xs[is_insides]
+            ys = ys[is_insides]
+            alphas = alphas[is_insides, np.newaxis]
+
+            # Blend color into pixels, surf is locked while pixels lives.
+            pixels: np.ndarray = pg.surfarray.pixels3d(surf)
+            destinations: np.ndarray = pixels[xs, ys].astype(np.float32)
+            color: np.ndarray = np.array(
+                (self.color.r, self.color.g, self.color.b), np.float32
+            )
+            pixels[xs, ys] = (
+                destinations + (color - destinations) * alphas
+            ).astype(np.uint8)
+            del pixels
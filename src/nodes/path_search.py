@@ -0,0 +1,298 @@
+from heapq import heappop
+from heapq import heappush
+from math import sqrt
+from typing import Dict
+from typing import List
+from typing import Set
+from typing import Tuple
+from typing import Union
+
+from typeguard import typechecked
+
+# Diagonal step cost.
+SQRT_2: float = sqrt(2)
+
+
+@typechecked
+class PathSearch:
+    """
+    One A* search over a walkable grid, can pause and resume.
+    Moves in 8 directions, never cuts a blocked corner.
+    With is_jump, uses jump point search: straight runs are skipped in
+    one go, only cells where the path may turn get into the open heap.
+
+    Parameters:
+    - walkables: [row][col] bools, out of grid is not walkable.
+    - start: (col, row).
+    - goal: (col, row).
+    - is_jump: jump point search, else plain A*.
+
+    Properties:
+    - state: SEARCHING, FOUND or NOT_FOUND.
+    - path: FOUND waypoints from start to goal, straight between them.
+    - expanded_len: cells taken from the open heap so far.
+    """
+
+    # States.
+    SEARCHING: int = 0
+    FOUND: int = 1
+    NOT_FOUND: int = 2
+
+    # Every (dx, dy).
+    DIRECTIONS: List[Tuple[int, int]] = [
+        (1, 0),
+        (-1, 0),
+        (0, 1),
+        (0, -1),
+        (1, 1),
+        (1, -1),
+        (-1, 1),
+        (-1, -1),
+    ]
+
+    def __init__(
+        self,
+        walkables: List[List[bool]],
+        start: Tuple[int, int],
+        goal: Tuple[int, int],
+        is_jump: bool = True,
+    ):
+        self.walkables: List[List[bool]] = walkables
+        self.rows: int = len(walkables)
+        self.cols: int = len(walkables[0]) if walkables else 0
+        self.start: Tuple[int, int] = start
+        self.goal: Tuple[int, int] = goal
+        self.is_jump: bool = is_jump
+
+        self.state: int = self.SEARCHING
+        self.path: List[Tuple[int, int]] = []
+        self.expanded_len: int = 0
+
+        # (f, tie, cell) heap, tie keeps pops stable.
+        self.open_heap: List[Tuple[float, int, Tuple[int, int]]] = []
+        self.tie: int = 0
+        self.costs: Dict[Tuple[int, int], float] = {start: 0.0}
+        self.parents: Dict[Tuple[int, int], Tuple[int, int]] = {}
+        self.closed: Set[Tuple[int, int]] = set()
+
+        if not self.is_walkable(*start) or not self.is_walkable(*goal):
+            self.state = self.NOT_FOUND
+            return
+        self.push(start, 0.0)
+
+    def is_walkable(self, col: int, row: int) -> bool:
+        return (
+            0 <= col < self.cols
+            and 0 <= row < self.rows
+            and self.walkables[row][col]
+        )
+
+    def get_heuristic(self, cell: Tuple[int, int]) -> float:
+        """
+        Octile distance to goal.
+        """
+
+        dx: int = abs(cell[0] - self.goal[0])
+        dy: int = abs(cell[1] - self.goal[1])
+        return max(dx, dy) + (SQRT_2 - 1) * min(dx, dy)
+
+    def push(self, cell: Tuple[int, int], cost: float) -> None:
+        self.tie += 1
+        heappush(
+            self.open_heap, (cost + self.get_heuristic(cell), self.tie, cell)
+        )
+
+    def get_neighbors(self, cell: Tuple[int, int]) -> List[Tuple[int, int]]:
+        """
+        Cells to look at from cell.
+        Jump search prunes by the direction it came from.
+        """
+
+        col, row = cell
+        is_walkable = self.is_walkable
+        parent: Union[Tuple[int, int], None] = self.parents.get(cell)
+        if not self.is_jump or parent is None:
+            return [
+                (col + dx, row + dy)
+                for dx, dy in self.DIRECTIONS
+                if is_walkable(col + dx, row + dy)
+                and is_walkable(col + dx, row)
+                and is_walkable(col, row + dy)
+            ]
+
+        dx: int = (col > parent[0]) - (col < parent[0])
+        dy: int = (row > parent[1]) - (row < parent[1])
+        neighbors: List[Tuple[int, int]] = []
+
+        # Diagonal: keep going, or either straight part of it.
+        if dx != 0 and dy != 0:
+            is_x_walkable: bool = is_walkable(col + dx, row)
+            is_y_walkable: bool = is_walkable(col, row + dy)
+            if is_y_walkable:
+                neighbors.append((col, row + dy))
+            if is_x_walkable:
+                neighbors.append((col + dx, row))
+            if is_x_walkable and is_y_walkable:
+                neighbors.append((col + dx, row + dy))
+            return neighbors
+
+        # Straight: keep going, turn around corners that just opened.
+        if dx != 0:
+            is_next_walkable: bool = is_walkable(col + dx, row)
+            is_below_walkable: bool = is_walkable(col, row + 1)
+            is_above_walkable: bool = is_walkable(col, row - 1)
+            if is_next_walkable:
+                neighbors.append((col + dx, row))
+                if is_below_walkable:
+                    neighbors.append((col + dx, row + 1))
+                if is_above_walkable:
+                    neighbors.append((col + dx, row - 1))
+            if is_below_walkable:
+                neighbors.append((col, row + 1))
+            if is_above_walkable:
+                neighbors.append((col, row - 1))
+            return neighbors
+
+        is_next_walkable = is_walkable(col, row + dy)
+        is_right_walkable: bool = is_walkable(col + 1, row)
+        is_left_walkable: bool = is_walkable(col - 1, row)
+        if is_next_walkable:
+            neighbors.append((col, row + dy))
+            if is_right_walkable:
+                neighbors.append((col + 1, row + dy))
+            if is_left_walkable:
+                neighbors.append((col - 1, row + dy))
+        if is_right_walkable:
+            neighbors.append((col + 1, row))
+        if is_left_walkable:
+            neighbors.append((col - 1, row))
+        return neighbors
+
+    def jump_straight(
+        self, col: int, row: int, dx: int, dy: int
+    ) -> Union[Tuple[int, int], None]:
+        """
+        Run from col, row along one axis.
+        Returns the first jump point, None on a wall.
+        """
+
+        is_walkable = self.is_walkable
+        while is_walkable(col, row):
+            if (col, row) == self.goal:
+                return col, row
+
+            # Forced neighbor: a side opens right after a wall.
+            if dx != 0:
+                if (
+                    is_walkable(col, row - 1)
+                    and not is_walkable(col - dx, row - 1)
+                ) or (
+                    is_walkable(col, row + 1)
+                    and not is_walkable(col - dx, row + 1)
+                ):
+                    return col, row
+            elif (
+                is_walkable(col - 1, row)
+                and not is_walkable(col - 1, row - dy)
+            ) or (
+                is_walkable(col + 1, row)
+                and not is_walkable(col + 1, row - dy)
+            ):
+                return col, row
+
+            col += dx
+            row += dy
+        return None
+
+    def jump(
+        self, col: int, row: int, dx: int, dy: int
+    ) -> Union[Tuple[int, int], None]:
+        """
+        Run from col, row in a direction.
+        Returns the first jump point, None on a wall.
+        """
+
+        if dx == 0 or dy == 0:
+            return self.jump_straight(col, row, dx, dy)
+
+        is_walkable = self.is_walkable
+        while is_walkable(col, row):
+            if (col, row) == self.goal:
+                return col, row
+
+            # Diagonal stops where a straight run finds something.
+            if (
+                self.jump_straight(col + dx, row, dx, 0) is not None
+                or self.jump_straight(col, row + dy, 0, dy) is not None
+            ):
+                return col, row
+
+            # Never cut a corner.
+            if not is_walkable(col + dx, row) or not is_walkable(
+                col, row + dy
+            ):
+                return None
+
+            col += dx
+            row += dy
+        return None
+
+    def step(self, budget: int) -> int:
+        """
+        Expand up to budget cells.
+        Returns how many were expanded.
+        """
+
+        expanded_len: int = 0
+        while self.state == self.SEARCHING and expanded_len < budget:
+            if not self.open_heap:
+                self.state = self.NOT_FOUND
+                break
+
+            _, _, cell = heappop(self.open_heap)
+
+            # Pushed again with a lower cost? Old entry is stale.
+            if cell in self.closed:
+                continue
+            self.closed.add(cell)
+
+            expanded_len += 1
+            if cell == self.goal:
+                self.state = self.FOUND
+                self.path = self.get_path_to(cell)
+                break
+
+            cost: float = self.costs[cell]
+            for neighbor in self.get_neighbors(cell):
+                target: Tuple[int, int] = neighbor
+                if self.is_jump:
+                    jump_point: Union[Tuple[int, int], None] = self.jump(
+                        neighbor[0],
+                        neighbor[1],
+                        neighbor[0] - cell[0],
+                        neighbor[1] - cell[1],
+                    )
+                    if jump_point is None:
+                        continue
+                    target = jump_point
+
+                dx: int = abs(target[0] - cell[0])
+                dy: int = abs(target[1] - cell[1])
+                next_cost: float = (
+                    cost + max(dx, dy) + (SQRT_2 - 1) * min(dx, dy)
+                )
+                if next_cost < self.costs.get(target, float("inf")):
+                    self.costs[target] = next_cost
+                    self.parents[target] = cell
+                    self.push(target, next_cost)
+
+        self.expanded_len += expanded_len
+        return expanded_len
+
+    def get_path_to(self, cell: Tuple[int, int]) -> List[Tuple[int, int]]:
+        path: List[Tuple[int, int]] = [cell]
+        while cell in self.parents:
+            cell = self.parents[cell]
+            path.append(cell)
+        path.reverse()
+        return path
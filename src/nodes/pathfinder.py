@@ -0,0 +1,198 @@
+from collections import OrderedDict
+from typing import Dict
+from typing import List
+from typing import Tuple
+from typing import Union
+
+from constants import TILE_HEIGHT
+from constants import TILE_WIDTH
+from nodes.path_search import PathSearch
+from nodes.tile_grid import TileGrid
+from typeguard import typechecked
+
+
+@typechecked
+class Pathfinder:
+    """
+    Finds paths between tile cells for enemies in a room.
+    SOLID tiles block, every other tile kind is walkable.
+    Uses jump point search, see PathSearch.
+
+    Found paths go in an LRU cache keyed on start, goal, grid version.
+    Any tile change bumps the grid version, so the cache is dropped and
+    pending searches start over on the new tiles.
+
+    Searches can be time sliced: request a path, then the update call
+    spends at most node_budget expansions per frame over all requests.
+
+    Parameters:
+    - grid: room solidity.
+    - cache_size: max paths kept.
+    - node_budget: max expansions per update.
+
+    Update:
+    - drop cache if grid changed.
+    - step pending searches.
+    """
+
+    def __init__(
+        self, grid: TileGrid, cache_size: int = 64, node_budget: int = 200
+    ):
+        self.grid: TileGrid = grid
+        self.cache_size: int = cache_size
+        self.node_budget: int = node_budget
+
+        # (start, goal, version) to path, empty path is no path.
+        self.cache: OrderedDict[
+            Tuple[Tuple[int, int], Tuple[int, int], int],
+            List[Tuple[int, int]],
+        ] = OrderedDict()
+
+        # Requester key to search, oldest request first.
+        self.searches: Dict[int, PathSearch] = {}
+
+        # [row][col] walkables snapshot, remade on grid change.
+        self.walkables: List[List[bool]] = []
+        self.version: int = -1
+        self.sync_grid()
+
+        # Stats.
+        self.hits: int = 0
+        self.misses: int = 0
+
+    def sync_grid(self) -> None:
+        """
+        Grid changed? Remake walkables, drop cache, restart searches.
+        """
+
+        if self.version == self.grid.version:
+            return
+
+        self.version = self.grid.version
+        self.walkables = (self.grid.tiles != TileGrid.SOLID).tolist()
+        self.cache.clear()
+        self.searches = {
+            key: PathSearch(self.walkables, search.start, search.goal)
+            for key, search in self.searches.items()
+        }
+
+    @staticmethod
+    def get_cell(x: float, y: float) -> Tuple[int, int]:
+        """
+        Cell that contains a px point.
+        """
+
+        return int(x // TILE_WIDTH), int(y // TILE_HEIGHT)
+
+    def get_cached_path(
+        self, start: Tuple[int, int], goal: Tuple[int, int]
+    ) -> Union[List[Tuple[int, int]], None]:
+        """
+        Returns the cached path, None if not cached.
+        """
+
+        self.sync_grid()
+        cache_key: Tuple[Tuple[int, int], Tuple[int, int], int] = (
+            start,
+            goal,
+            self.version,
+        )
+        path: Union[List[Tuple[int, int]], None] = self.cache.get(cache_key)
+        if path is None:
+            self.misses += 1
+            return None
+
+        self.hits += 1
+        self.cache.move_to_end(cache_key)
+        return path
+
+    def set_cached_path(
+        self,
+        start: Tuple[int, int],
+        goal: Tuple[int, int],
+        path: List[Tuple[int, int]],
+    ) -> None:
+        self.cache[(start, goal, self.version)] = path
+        if len(self.cache) > self.cache_size:
+            self.cache.popitem(last=False)
+
+    def find_path(
+        self, start: Tuple[int, int], goal: Tuple[int, int]
+    ) -> List[Tuple[int, int]]:
+        """
+        Search until done, this frame.
+        Returns waypoint cells from start to goal, empty if no path.
+        """
+
+        path: Union[List[Tuple[int, int]], None] = self.get_cached_path(
+            start, goal
+        )
+        if path is not None:
+            return path
+
+        search: PathSearch = PathSearch(self.walkables, start, goal)
+        while search.state == PathSearch.SEARCHING:
+            search.step(self.node_budget)
+        self.set_cached_path(start, goal, search.path)
+        return search.path
+
+    def request_path(
+        self, key: int, start: Tuple[int, int], goal: Tuple[int, int]
+    ) -> Union[List[Tuple[int, int]], None]:
+        """
+        Time sliced find_path, key is the requester.
+        Returns the path if cached, else None and searches in update.
+        Poll again on later frames, a new goal replaces the old request.
+        """
+
+        # Same request still searching? Keep waiting.
+        search: Union[PathSearch, None] = self.searches.get(key)
+        if (
+            search is not None
+            and search.start == start
+            and search.goal == goal
+            and self.version == self.grid.version
+        ):
+            return None
+
+        path: Union[List[Tuple[int, int]], None] = self.get_cached_path(
+            start, goal
+        )
+        if path is not None:
+            self.searches.pop(key, None)
+            return path
+
+        self.searches.pop(key, None)
+        self.searches[key] = PathSearch(self.walkables, start, goal)
+        return None
+
+    def cancel_request(self, key: int) -> None:
+        self.searches.pop(key, None)
+
+    def update(self, dt: int) -> None:
+        """
+        Update:
+        - drop cache if grid changed.
+        - step pending searches.
+        """
+
+        self.sync_grid()
+
+        # Oldest requests first, the rest wait for the next frame.
+        budget: int = self.node_budget
+        for key in list(self.searches):
+            if budget <= 0:
+                break
+
+            search: PathSearch = self.searches[key]
+            budget -= search.step(budget)
+            if search.state != PathSearch.SEARCHING:
+                self.set_cached_path(search.start, search.goal, search.path)
+                del self.searches[key]
+
+    def get_debug_text(self) -> str:
+        return (
+            f"path cache {len(self.cache)}/{self.cache_size} "
+            f"hit {self.hits} miss {self.misses} "
+            f"pending {len(self.searches)}"
+        )
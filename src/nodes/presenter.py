@@ -0,0 +1,282 @@
+from queue import Queue
+from threading import Event
+from threading import Thread
+from time import perf_counter
+from typing import List
+from typing import Tuple
+from typing import Union
+
+from constants import NATIVE_SURF
+from constants import pg
+from nodes.profiler import Profiler
+from pygame._sdl2.video import Renderer
+from pygame._sdl2.video import Texture
+from typeguard import typechecked
+
+
+@typechecked
+class Presenter:
+    """
+    Owns the window, scales NATIVE_SURF into it and flips, per frame.
+    Native is scaled by an int scale, centered, black bars around it.
+
+    Backends:
+    - surface: CPU scale into the display surface.
+    - renderer: NATIVE_SURF is uploaded to a streaming texture, the SDL
+      renderer scales it. Uses the GPU if there is one, else SDL falls
+      back to its software renderer. Main thread only, is_threaded is
+      ignored.
+
+    Threaded surface, frames go through two native buffers. present
+    copies NATIVE_SURF into a free buffer and hands it to a present
+    thread, which scales and flips it while the main thread goes on to
+    update and draw the next frame. pygame lets go of the GIL in much
+    of its scale and blit C work, so with a spare core both run at once.
+    present only blocks when both buffers are still being presented.
+    Costs up to a frame of latency. SDL must allow flips off the main
+    thread, fine on Windows and X11, not macOS.
+
+    Vsync, set by FramePacer, makes the flip wait for the display. Does
+    nothing where SDL or the driver does not support it.
+
+    Profiler:
+    - "present": main thread ms, full present or copy and hand off.
+    - "present wait": main thread blocked on a busy buffer.
+    - "present latency" counter: ms from present call to flip done.
+
+    Parameters:
+    - profiler: game profiler.
+    - is_threaded: use the present thread.
+    - is_renderer: use the renderer backend.
+    """
+
+    BUFFERS_LEN: int = 2
+
+    def __init__(
+        self,
+        profiler: Profiler,
+        is_threaded: bool = False,
+        is_renderer: bool = False,
+    ):
+        self.profiler: Profiler = profiler
+        self.is_renderer: bool = is_renderer
+        self.is_threaded: bool = is_threaded and not is_renderer
+
+        # Last set_mode, to redo it when vsync changes.
+        self.size: Tuple[int, int] = (0, 0)
+        self.is_fullscreen: bool = False
+        self.is_vsync: bool = False
+
+        # Surface backend.
+        self.window_surf: Union[pg.Surface, None] = None
+
+        # Scaled native, reused while the scale stays the same.
+        self.scaled_surf: Union[pg.Surface, None] = None
+
+        # Renderer backend.
+        self.window: Union[pg.Window, None] = None
+        self.renderer: Union[Renderer, None] = None
+        self.texture: Union[Texture, None] = None
+
+        # Last frame ms from present call to flip done.
+        self.latency_ms: float = 0.0
+
+        self.buffers: List[pg.Surface] = []
+        self.buffer_frees: List[Event] = []
+        self.buffer_index: int = 0
+        self.frames: Queue = Queue()
+        self.thread: Union[Thread, None] = None
+        if self.is_threaded:
+            for _ in range(self.BUFFERS_LEN):
+                self.buffers.append(NATIVE_SURF.copy())
+                self.buffer_frees.append(Event())
+                self.buffer_frees[-1].set()
+            self.thread = Thread(target=self.run, daemon=True)
+            self.thread.start()
+
+    def set_mode(
+        self, size: Tuple[int, int], is_fullscreen: bool = False
+    ) -> Tuple[int, int]:
+        """
+        Open or resize the window, returns its real size.
+        """
+
+        # Present thread may still be drawing on the old window surf.
+        self.wait()
+
+        self.size = size
+        self.is_fullscreen = is_fullscreen
+
+        if not self.is_renderer:
+            self.window_surf = pg.display.set_mode(
+                size,
+                pg.FULLSCREEN if is_fullscreen else 0,
+                vsync=int(self.is_vsync),
+            )
+            return self.window_surf.get_size()
+
+        if self.window is None:
+            self.window = pg.Window(size=size)
+            self.make_renderer()
+        else:
+            self.window.set_windowed()
+            self.window.size = size
+        if is_fullscreen:
+            self.window.set_fullscreen()
+        return self.window.size
+
+    def make_renderer(self) -> None:
+        """
+        Renderer backend, (re)create renderer and texture on the window.
+        """
+
+        if self.window is None:
+            return
+
+        # One renderer per window, drop the old one first.
+        self.texture = None
+        self.renderer = None
+        try:
+            self.renderer = Renderer(self.window, vsync=self.is_vsync)
+        except pg.error:
+            # No usable GPU driver, ask for the software renderer.
+            self.renderer = Renderer(
+                self.window, accelerated=0, vsync=self.is_vsync
+            )
+        self.renderer.draw_color = pg.Color("black")
+        self.texture = Texture(
+            self.renderer, NATIVE_SURF.get_size(), streaming=True
+        )
+
+    def set_vsync(self, value: bool) -> None:
+        """
+        Wait for the display on flip or not, redoes the window mode.
+        """
+
+        if self.is_vsync == value:
+            return
+        self.is_vsync = value
+
+        # Window not open yet? set_mode reads is_vsync.
+        if self.window is not None:
+            self.make_renderer()
+        elif self.window_surf is not None:
+            self.set_mode(self.size, self.is_fullscreen)
+
+    def get_window_size(self) -> Tuple[int, int]:
+        if self.window is not None:
+            return self.window.size
+        if self.window_surf is not None:
+            return self.window_surf.get_size()
+        return (0, 0)
+
+    def get_dest_rect(self, scale: int) -> pg.Rect:
+        """
+        Where scaled native goes, centered in the window.
+        """
+
+        rect: pg.Rect = pg.Rect(
+            (0, 0),
+            (
+                NATIVE_SURF.get_width() * scale,
+                NATIVE_SURF.get_height() * scale,
+            ),
+        )
+        window_width, window_height = self.get_window_size()
+        rect.center = (window_width // 2, window_height // 2)
+        return rect
+
+    def get_scaled_surf(self, size: Tuple[int, int]) -> pg.Surface:
+        if self.scaled_surf is None or self.scaled_surf.get_size() != size:
+            self.scaled_surf = pg.Surface(size)
+        return self.scaled_surf
+
+    def flip(
+        self, native_surf: pg.Surface, window_surf: pg.Surface, scale: int
+    ) -> None:
+        """
+        Surface backend, scale native into window, then display update.
+        """
+
+        dest_rect: pg.Rect = self.get_dest_rect(scale)
+        scaled_surf: pg.Surface = self.get_scaled_surf(dest_rect.size)
+        pg.transform.scale(native_surf, dest_rect.size, scaled_surf)
+        window_surf.blit(scaled_surf, dest_rect)
+        pg.display.update()
+
+    def present(self, scale: int) -> None:
+        """
+        Show NATIVE_SURF, call after everything is drawn.
+        """
+
+        start: float = perf_counter()
+        self.profiler.begin("present")
+
+        if self.renderer is not None and self.texture is not None:
+            self.texture.update(NATIVE_SURF)
+            self.renderer.clear()
+            self.texture.draw(dstrect=self.get_dest_rect(scale))
+            self.renderer.present()
+            self.latency_ms = (perf_counter() - start) * 1000
+        elif self.window_surf is None:
+            # No window yet, nothing to show.
+            pass
+        elif not self.is_threaded:
+            self.flip(NATIVE_SURF, self.window_surf, scale)
+            self.latency_ms = (perf_counter() - start) * 1000
+        else:
+            buffer_free: Event = self.buffer_frees[self.buffer_index]
+            if not buffer_free.is_set():
+                self.profiler.begin("present wait")
+                buffer_free.wait()
+                self.profiler.end("present wait")
+            buffer_free.clear()
+
+            buffer: pg.Surface = self.buffers[self.buffer_index]
+            buffer.blit(NATIVE_SURF, (0, 0))
+            self.frames.put(
+                (self.buffer_index, self.window_surf, scale, start)
+            )
+            self.buffer_index = (self.buffer_index + 1) % self.BUFFERS_LEN
+
+        self.profiler.end("present")
+        self.profiler.set_counter("present latency", round(self.latency_ms, 2))
+
+    def run(self) -> None:
+        """
+        Present thread, flips handed off buffers in order.
+        None stops it.
+        """
+
+        while 1:
+            frame: Union[Tuple[int, pg.Surface, int, float], None] = (
+                self.frames.get()
+            )
+            if frame is None:
+                return
+            buffer_index, window_surf, scale, start = frame
+            try:
+                self.flip(self.buffers[buffer_index], window_surf, scale)
+            finally:
+                self.latency_ms = (perf_counter() - start) * 1000
+                self.buffer_frees[buffer_index].set()
+
+    def wait(self) -> None:
+        """
+        Block until every handed off frame is flipped.
+        """
+
+        for buffer_free in self.buffer_frees:
+            buffer_free.wait()
+
+    def stop(self) -> None:
+        """
+        Flip what is left, then end the present thread.
+        """
+
+        if self.thread is None:
+            return
+        self.wait()
+        self.frames.put(None)
+        self.thread.join()
+        self.thread = None
@@ -0,0 +1,94 @@
+from time import perf_counter
+from typing import Dict
+from typing import List
+
+from typeguard import typechecked
+
+
+@typechecked
+class Profiler:
+    """
+    Per frame timings of named sections, for the debug overlay.
+    Wrap a section in begin and end, same name may run many times a
+    frame, its times add up. Averages over the last SAMPLES_LEN frames.
+
+    Counters are plain values nodes report, like cache hit rates, shown
+    under the sections as last set.
+
+    Main loop calls end_frame once per frame.
+    """
+
+    # Frames to average over.
+    SAMPLES_LEN: int = 60
+
+    # Sections shown in the debug overlay, slowest first.
+    DEBUG_LINES_LEN: int = 6
+
+    def __init__(self) -> None:
+        # Section name to begin time.
+        self.starts: Dict[str, float] = {}
+
+        # Section name to ms, this frame.
+        self.frame_ms: Dict[str, float] = {}
+
+        # Section name to last SAMPLES_LEN frame ms, oldest first.
+        self.samples: Dict[str, List[float]] = {}
+
+        # Counter name to last value.
+        self.counters: Dict[str, float] = {}
+
+    def begin(self, name: str) -> None:
+        self.starts[name] = perf_counter()
+
+    def end(self, name: str) -> None:
+        start: float = self.starts.pop(name, perf_counter())
+        self.frame_ms[name] = self.frame_ms.get(name, 0.0) + (
+            (perf_counter() - start) * 1000
+        )
+
+    def end_frame(self) -> None:
+        """
+        Push this frame ms to the samples, sections that did not run get
+        0 ms.
+        """
+
+        for name in self.frame_ms:
+            if name not in self.samples:
+                self.samples[name] = []
+
+        for name, samples in self.samples.items():
+            samples.append(self.frame_ms.get(name, 0.0))
+            if len(samples) > self.SAMPLES_LEN:
+                del samples[0]
+
+        self.frame_ms = {}
+
+    def get_ms(self, name: str) -> float:
+        """
+        Average ms per frame, 0 if never ran.
+        """
+
+        samples: List[float] = self.samples.get(name, [])
+        if not samples:
+            return 0.0
+        return sum(samples) / len(samples)
+
+    def set_counter(self, name: str, value: float) -> None:
+        self.counters[name] = value
+
+    def forget(self, name: str) -> None:
+        """
+        Drop a section or counter, like a removed light.
+        """
+
+        self.samples.pop(name, None)
+        self.frame_ms.pop(name, None)
+        self.starts.pop(name, None)
+        self.counters.pop(name, None)
+
+    def get_debug_lines(self) -> List[str]:
+        names: List[str] = sorted(self.samples, key=self.get_ms, reverse=True)
+        return [
+            f"{name}: {self.get_ms(name):.2f} ms"
+            for name in names[: self.DEBUG_LINES_LEN]
+        ] + [f"{name}: {value:g}" for name, value in self.counters.items()]
@@ -0,0 +1,124 @@
+from typing import List
+from typing import Tuple
+from typing import Union
+
+from constants import MAX_QUADTREE_DEPTH
+from constants import pg
+from nodes.broadphase import Broadphase
+from typeguard import typechecked
+
+
+@typechecked
+class QuadTree(Broadphase):
+    """
+    Broadphase tree index for actor rects.
+    Each node keeps the items that do not fit in a single child.
+    Splits when it holds more than MAX_ITEMS, up to MAX_QUADTREE_DEPTH.
+
+    Parameters:
+    - bounds: area this node covers.
+    - depth: 0 for root.
+    """
+
+    # Items a node holds before it splits.
+    MAX_ITEMS: int = 8
+
+    def __init__(self, bounds: pg.Rect, depth: int = 0):
+        super().__init__(bounds)
+        self.depth: int = depth
+
+        # (key, rect) list.
+        self.items: List[Tuple[int, pg.Rect]] = []
+
+        # Empty or 4 children: topleft, topright, bottomleft, bottomright.
+        self.children: List["QuadTree"] = []
+
+    def clear(self) -> None:
+        self.items = []
+        self.children = []
+
+    def split(self) -> None:
+        """
+        Make 4 children, push down the items that fit in one.
+        """
+
+        half_width: int = self.bounds.width // 2
+        half_height: int = self.bounds.height // 2
+        self.children = [
+            QuadTree(
+                pg.Rect(x, y, half_width, half_height),
+                self.depth + 1,
+            )
+            for x, y in [
+                (self.bounds.x, self.bounds.y),
+                (self.bounds.x + half_width, self.bounds.y),
+                (self.bounds.x, self.bounds.y + half_height),
+                (self.bounds.x + half_width, self.bounds.y + half_height),
+            ]
+        ]
+
+        items: List[Tuple[int, pg.Rect]] = self.items
+        self.items = []
+        for key, rect in items:
+            self.insert(key, rect)
+
+    def get_child(self, rect: pg.Rect) -> Union["QuadTree", None]:
+        """
+        Returns the child that fully contains rect, None if none does.
+        """
+
+        for child in self.children:
+            if child.bounds.contains(rect):
+                return child
+        return None
+
+    def insert(self, key: int, rect: pg.Rect) -> None:
+        # Fits in one child? Go down.
+        if self.children:
+            child: Union["QuadTree", None] = self.get_child(rect)
+            if child is not None:
+                child.insert(key, rect)
+                return
+
+        self.items.append((key, rect))
+
+        # Too many and can still go deeper? Split.
+        if (
+            not self.children
+            and len(self.items) > self.MAX_ITEMS
+            and self.depth < MAX_QUADTREE_DEPTH
+        ):
+            self.split()
+
+    def remove(self, key: int, rect: pg.Rect) -> None:
+        # Same path insert took.
+        if self.children:
+            child: Union["QuadTree", None] = self.get_child(rect)
+            if child is not None:
+                child.remove(key, rect)
+                return
+
+        for index, (item_key, _) in enumerate(self.items):
+            if item_key == key:
+                del self.items[index]
+                return
+
+    def query(self, rect: pg.Rect) -> List[int]:
+        """
+        Returns keys of items whose rect overlaps given rect.
+        """
+
+        keys: List[int] = []
+        self.query_into(rect, keys)
+        return keys
+
+    def query_into(self, rect: pg.Rect, keys: List[int]) -> None:
+        if not self.bounds.colliderect(rect):
+            return
+
+        for key, item_rect in self.items:
+            if item_rect.colliderect(rect):
+                keys.append(key)
+
+        for child in self.children:
+            child.query_into(rect, keys)
@@ -0,0 +1,161 @@
+from json import dumps
+from typing import Any
+from typing import Callable
+from typing import Dict
+from typing import List
+
+import numpy as np
+from nodes.frame_pacer import FramePacer
+from nodes.profiler import Profiler
+from typeguard import typechecked
+
+
+@typechecked
+class QualityGovernor:
+    """
+    Trades looks for frame time on slow machines, instead of stutter.
+
+    Subsystems add knobs, a setter taking a level, 0 is best. Knobs are
+    lowered one level at a time in the order they were added, each to
+    its lowest before the next, so add the biggest saving first.
+    Raising undoes the last lowering first.
+
+    Fed FramePacer work_ms every frame, decides on the p95 of the last
+    SAMPLES_LEN frames against the frame budget:
+    - lower, p95 over DROP_FRACTION of budget. Small slack so frames
+      waiting on vsync, right at budget, do not count.
+    - raise, p95 under RAISE_FRACTION of budget for RAISE_FRAMES frames
+      in a row. Gap and wait are the hysteresis, no flip flopping.
+    Samples are cleared after every change, to judge the new level only.
+
+    Every change is added to log, Game.quit saves it with save_log, to
+    tune against.
+
+    Profiler:
+    - "quality drops" counter: knob levels lowered right now.
+
+    Parameters:
+    - frame_pacer: work ms and budget.
+    - profiler: game profiler.
+    """
+
+    # Frames to take p95 over.
+    SAMPLES_LEN: int = 60
+
+    # Budget fractions.
+    DROP_FRACTION: float = 1.05
+    RAISE_FRACTION: float = 0.7
+
+    # Frames p95 must stay under raise before raising.
+    RAISE_FRAMES: int = 180
+
+    def __init__(self, frame_pacer: FramePacer, profiler: Profiler):
+        self.frame_pacer: FramePacer = frame_pacer
+        self.profiler: Profiler = profiler
+
+        # Knob name to setter, levels len and level, in added order.
+        self.setters: Dict[str, Callable[[int], None]] = {}
+        self.levels_lens: Dict[str, int] = {}
+        self.levels: Dict[str, int] = {}
+
+        # Knob names lowered, last lowered last.
+        self.drops: List[str] = []
+
+        # Last SAMPLES_LEN work ms, oldest first.
+        self.samples: List[float] = []
+
+        # Frames in a row under raise.
+        self.under_frames: int = 0
+
+        # Frames fed so far, for the log.
+        self.frame: int = 0
+
+        # Every change, oldest first.
+        self.log: List[Dict[str, Any]] = []
+
+    def add_knob(
+        self, name: str, levels_len: int, setter: Callable[[int], None]
+    ) -> None:
+        """
+        Register a knob, set to its best level now.
+        """
+
+        self.setters[name] = setter
+        self.levels_lens[name] = levels_len
+        self.levels[name] = 0
+        setter(0)
+
+    def set_level(self, name: str, level: int, p95_ms: float) -> None:
+        """
+        Set a knob level, log it, start judging afresh.
+        """
+
+        self.log.append(
+            {
+                "frame": self.frame,
+                "knob": name,
+                "from_level": self.levels[name],
+                "to_level": level,
+                "p95_ms": round(p95_ms, 2),
+                "budget_ms": round(self.frame_pacer.get_budget_ms(), 2),
+            }
+        )
+        self.levels[name] = level
+        self.setters[name](level)
+        self.samples = []
+        self.under_frames = 0
+
+    def lower(self, p95_ms: float) -> None:
+        """
+        First knob not at its lowest goes down a level.
+        """
+
+        for name, level in self.levels.items():
+            if level < self.levels_lens[name] - 1:
+                self.drops.append(name)
+                self.set_level(name, level + 1, p95_ms)
+                return
+
+    def restore(self, p95_ms: float) -> None:
+        """
+        Undo the last lowering.
+        """
+
+        if not self.drops:
+            return
+        name: str = self.drops.pop()
+        self.set_level(name, self.levels[name] - 1, p95_ms)
+
+    def end_frame(self) -> None:
+        """
+        Feed last frame work ms, lower or raise quality.
+        """
+
+        self.frame += 1
+        self.samples.append(self.frame_pacer.work_ms)
+        if len(self.samples) > self.SAMPLES_LEN:
+            del self.samples[0]
+        self.profiler.set_counter("quality drops", len(self.drops))
+
+        if len(self.samples) < self.SAMPLES_LEN:
+            return
+
+        p95_ms: float = float(np.percentile(self.samples, 95))
+        budget_ms: float = self.frame_pacer.get_budget_ms()
+        if p95_ms > budget_ms * self.DROP_FRACTION:
+            self.lower(p95_ms)
+        elif p95_ms < budget_ms * self.RAISE_FRACTION:
+            self.under_frames += 1
+            if self.under_frames >= self.RAISE_FRAMES:
+                self.restore(p95_ms)
+        else:
+            self.under_frames = 0
+
+    def save_log(self, path: str) -> None:
+        """
+        Log as json lines, one change per line.
+        """
+
+        with open(path, "w") as log_jsonl:
+            for change in self.log:
+                log_jsonl.write(dumps(change) + "\n")
@@ -0,0 +1,362 @@
+from math import cos
+from math import floor
+from math import hypot
+from math import inf
+from math import radians
+from math import sin
+from math import tau
+from typing import Dict
+from typing import List
+from typing import Tuple
+from typing import Union
+
+import numpy as np
+from constants import TILE_HEIGHT
+from constants import TILE_WIDTH
+from nodes.tile_grid import TileGrid
+from typeguard import typechecked
+
+
+@typechecked
+class Raycaster:
+    """
+    Ray queries over room tiles, for AI vision, projectiles and light.
+    Walks a ray tile by tile (Amanatides Woo DDA), only the tiles it
+    crosses are checked. Only SOLID tiles stop rays.
+    Rays also stop when they leave the room.
+
+    Every ray returns (hit x, hit y, distance, hit col, hit row):
+    - hit col, hit row: -1 if no SOLID tile was hit.
+
+    Same queries in one frame are memoized, update forgets them.
+
+    Parameters:
+    - grid: room solidity.
+
+    Update:
+    - forget last frame rays.
+    """
+
+    def __init__(self, grid: TileGrid):
+        self.grid: TileGrid = grid
+
+        # Solids snapshot, remade on grid change.
+        # List for single rays. Array for many rays, with a solid border
+        # so leaving the room also stops them.
+        self.solids: List[List[bool]] = []
+        self.bordered_solids: np.ndarray = np.ones((2, 2), np.bool_)
+        self.version: int = -1
+
+        # This frame results.
+        self.ray_memo: Dict[
+            Tuple[float, float, float, float, float],
+            Tuple[float, float, float, int, int],
+        ] = {}
+        self.polygon_memo: Dict[
+            Tuple[float, float, int, float], List[Tuple[float, float]]
+        ] = {}
+
+        # Stats, this frame.
+        self.rays_len: int = 0
+        self.memo_hits: int = 0
+
+    def sync_grid(self) -> None:
+        """
+        Grid changed? Remake solids, forget rays.
+        """
+
+        if self.version == self.grid.version:
+            return
+
+        self.version = self.grid.version
+        solids: np.ndarray = self.grid.tiles == TileGrid.SOLID
+        self.solids = solids.tolist()
+        self.bordered_solids = np.pad(solids, 1, constant_values=True)
+        self.ray_memo.clear()
+        self.polygon_memo.clear()
+
+    def update(self, dt: int) -> None:
+        """
+        Update:
+        - forget last frame rays.
+        """
+
+        self.ray_memo.clear()
+        self.polygon_memo.clear()
+        self.rays_len = 0
+        self.memo_hits = 0
+
+    def cast_ray(
+        self,
+        x: float,
+        y: float,
+        direction_x: float,
+        direction_y: float,
+        max_distance: float,
+    ) -> Tuple[float, float, float, int, int]:
+        """
+        One ray from a px point, direction does not need to be unit.
+        """
+
+        self.sync_grid()
+        memo_key: Tuple[float, float, float, float, float] = (
+            x,
+            y,
+            direction_x,
+            direction_y,
+            max_distance,
+        )
+        result: Union[Tuple[float, float, float, int, int], None] = (
+            self.ray_memo.get(memo_key)
+        )
+        if result is not None:
+            self.memo_hits += 1
+            return result
+
+        self.rays_len += 1
+        result = self.walk_ray(x, y, direction_x, direction_y, max_distance)
+        self.ray_memo[memo_key] = result
+        return result
+
+    def cast_ray_at_angle(
+        self, x: float, y: float, angle: float, max_distance: float
+    ) -> Tuple[float, float, float, int, int]:
+        """
+        Angle in degrees, 0 is right, 90 is down.
+        """
+
+        return self.cast_ray(
+            x, y, cos(radians(angle)), sin(radians(angle)), max_distance
+        )
+
+    def walk_ray(
+        self,
+        x: float,
+        y: float,
+        direction_x: float,
+        direction_y: float,
+        max_distance: float,
+    ) -> Tuple[float, float, float, int, int]:
+        length: float = hypot(direction_x, direction_y)
+        if length == 0:
+            return x, y, 0.0, -1, -1
+        direction_x /= length
+        direction_y /= length
+
+        col: int = floor(x / TILE_WIDTH)
+        row: int = floor(y / TILE_HEIGHT)
+        solids: List[List[bool]] = self.solids
+        cols: int = self.grid.cols
+        rows: int = self.grid.rows
+
+        # Distance to the next col / row line, and between lines.
+        step_col: int = 1 if direction_x > 0 else -1
+        step_row: int = 1 if direction_y > 0 else -1
+        if direction_x != 0:
+            next_x: float = (col + (direction_x > 0)) * TILE_WIDTH
+            distance_x: float = (next_x - x) / direction_x
+            delta_x: float = TILE_WIDTH / abs(direction_x)
+        else:
+            distance_x = inf
+            delta_x = inf
+        if direction_y != 0:
+            next_y: float = (row + (direction_y > 0)) * TILE_HEIGHT
+            distance_y: float = (next_y - y) / direction_y
+            delta_y: float = TILE_HEIGHT / abs(direction_y)
+        else:
+            distance_y = inf
+            delta_y = inf
+
+        distance: float = 0.0
+        while True:
+            # Left the room?
+            if not (0 <= col < cols and 0 <= row < rows):
+                col = -1
+                row = -1
+                break
+
+            if solids[row][col]:
+                break
+
+            # Step to whichever line is closer.
+            if distance_x < distance_y:
+                distance = distance_x
+                distance_x += delta_x
+                col += step_col
+            else:
+                distance = distance_y
+                distance_y += delta_y
+                row += step_row
+
+            if distance >= max_distance:
+                distance = max_distance
+                col = -1
+                row = -1
+                break
+
+        return (
+            x + direction_x * distance,
+            y + direction_y * distance,
+            distance,
+            col,
+            row,
+        )
+
+    def has_line_of_sight(
+        self, x: float, y: float, target_x: float, target_y: float
+    ) -> bool:
+        """
+        True if no SOLID tile is between the 2 px points.
+        """
+
+        distance: float = hypot(target_x - x, target_y - y)
+        if distance == 0:
+            return True
+
+        _, _, _, col, row = self.cast_ray(
+            x, y, target_x - x, target_y - y, distance
+        )
+        return col == -1
+
+    @staticmethod
+    def get_line_distances(
+        start: float,
+        directions: np.ndarray,
+        size: int,
+        lines_len: int,
+    ) -> np.ndarray:
+        """
+        Distance along each ray to the next lines_len grid lines on one
+        axis, inf if the ray does not move on it.
+        """
+
+        is_movings: np.ndarray = directions != 0
+        safe_directions: np.ndarray = np.where(is_movings, directions, 1.0)
+        first_lines: np.ndarray = (
+            floor(start / size) + (directions > 0)
+        ) * size
+        firsts: np.ndarray = (first_lines - start) / safe_directions
+        deltas: np.ndarray = size / np.abs(safe_directions)
+        distances: np.ndarray = (
+            firsts[:, None] + np.arange(lines_len) * deltas[:, None]
+        )
+        distances[~is_movings] = inf
+        return distances
+
+    def cast_rays(
+        self,
+        x: float,
+        y: float,
+        angles: np.ndarray,
+        max_distance: float,
+    ) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Many rays from one px point at once, angles in radians.
+        Returns (hit xs, hit ys, distances, hit cols, hit rows) arrays.
+
+        No per step loop: every grid line a ray crosses within
+        max_distance is found at once, sorted, and the tile between 2
+        crossings is read at their midpoint. First SOLID or out of room
+        tile per ray is where it stops.
+        """
+
+        self.sync_grid()
+        self.rays_len += angles.size
+        direction_xs: np.ndarray = np.cos(angles)
+        direction_ys: np.ndarray = np.sin(angles)
+        grid_rows: int = self.grid.rows
+        grid_cols: int = self.grid.cols
+
+        # (rays, segments) segment start distances, first is the origin.
+        cols_len: int = int(max_distance // TILE_WIDTH) + 2
+        rows_len: int = int(max_distance // TILE_HEIGHT) + 2
+        starts: np.ndarray = np.concatenate(
+            (
+                np.zeros((angles.size, 1)),
+                self.get_line_distances(x, direction_xs, TILE_WIDTH, cols_len),
+                self.get_line_distances(
+                    y, direction_ys, TILE_HEIGHT, rows_len
+                ),
+            ),
+            axis=1,
+        )
+        starts.sort(axis=1)
+        np.minimum(starts, max_distance, out=starts)
+        ends: np.ndarray = np.empty_like(starts)
+        ends[:, :-1] = starts[:, 1:]
+        ends[:, -1] = max_distance
+
+        # Tile of each segment, read at its midpoint.
+        middles: np.ndarray = (starts + ends) / 2
+        cols: np.ndarray = np.floor(
+            (x + direction_xs[:, None] * middles) / TILE_WIDTH
+        ).astype(np.int64)
+        rows: np.ndarray = np.floor(
+            (y + direction_ys[:, None] * middles) / TILE_HEIGHT
+        ).astype(np.int64)
+
+        # One flat read, out of room lands on the solid border.
+        bordered_cols: np.ndarray = np.clip(cols + 1, 0, grid_cols + 1)
+        bordered_rows: np.ndarray = np.clip(rows + 1, 0, grid_rows + 1)
+        is_blockeds: np.ndarray = self.bordered_solids.ravel()[
+            bordered_rows * (grid_cols + 2) + bordered_cols
+        ]
+
+        # Corners make empty segments, skip them.
+        is_stops: np.ndarray = (ends > starts) & is_blockeds
+
+        ray_indexes: np.ndarray = np.arange(angles.size)
+        stop_indexes: np.ndarray = np.argmax(is_stops, axis=1)
+        is_stoppeds: np.ndarray = is_stops[ray_indexes, stop_indexes]
+        stop_cols: np.ndarray = cols[ray_indexes, stop_indexes]
+        stop_rows: np.ndarray = rows[ray_indexes, stop_indexes]
+        is_hits: np.ndarray = (
+            is_stoppeds
+            & (stop_cols >= 0)
+            & (stop_cols < grid_cols)
+            & (stop_rows >= 0)
+            & (stop_rows < grid_rows)
+        )
+        distances: np.ndarray = np.where(
+            is_stoppeds, starts[ray_indexes, stop_indexes], max_distance
+        )
+        hit_cols: np.ndarray = np.where(is_hits, stop_cols, -1)
+        hit_rows: np.ndarray = np.where(is_hits, stop_rows, -1)
+        return (
+            x + direction_xs * distances,
+            y + direction_ys * distances,
+            distances,
+            hit_cols,
+            hit_rows,
+        )
+
+    def get_visibility_polygon(
+        self, x: float, y: float, rays_len: int, max_distance: float
+    ) -> List[Tuple[float, float]]:
+        """
+        Px points around a px point, where evenly spread rays stop.
+        Clockwise from the right, for drawing light or vision.
+        """
+
+        self.sync_grid()
+        memo_key: Tuple[float, float, int, float] = (
+            x,
+            y,
+            rays_len,
+            max_distance,
+        )
+        polygon: Union[List[Tuple[float, float]], None] = (
+            self.polygon_memo.get(memo_key)
+        )
+        if polygon is not None:
+            self.memo_hits += 1
+            return polygon
+
+        angles: np.ndarray = np.linspace(0, tau, rays_len, endpoint=False)
+        hit_xs, hit_ys, _, _, _ = self.cast_rays(x, y, angles, max_distance)
+        polygon = list(zip(hit_xs.tolist(), hit_ys.tolist()))
+        self.polygon_memo[memo_key] = polygon
+        return polygon
+
+    def get_debug_text(self) -> str:
+        return f"rays {self.rays_len} memo hit {self.memo_hits}"
@@ -0,0 +1,201 @@
+from io import BytesIO
+from json import dumps
+from json import loads
+from mmap import ACCESS_READ
+from mmap import mmap
+from os.path import splitext
+from struct import calcsize
+from struct import pack
+from struct import unpack_from
+from typing import Any
+from typing import BinaryIO
+from typing import Dict
+from typing import List
+from typing import Tuple
+from typing import Union
+from zlib import compress
+from zlib import decompress
+
+from constants import pg
+from constants import RESOURCE_PACK_PATH
+from typeguard import typechecked
+
+
+@typechecked
+class ResourcePack:
+    """
+    Optional single file asset pack, read through mmap.
+    Everyone loads assets through its load functions, by the same paths
+    the paths dicts hold. Paths in the pack are read from it, the rest,
+    or every path when there is no pack, from their loose files.
+
+    Raw entries are memoryview slices of the map, no copy until the
+    loader reads them. Zlib entries are decompressed on read.
+
+    File:
+    - MAGIC, then HEADER: version, index json length.
+    - index json: path to [offset, length, codec], offset from file start.
+    - entry bytes.
+
+    Run src/build_pack.py to make it.
+    """
+
+    MAGIC: bytes = b"GPAK"
+    VERSION: int = 1
+
+    # Version, index json length, little endian.
+    HEADER: str = "<II"
+
+    # Entry codecs.
+    RAW: int = 0
+    ZLIB: int = 1
+
+    # Open pack, None if not opened yet, empty index if no pack.
+    pack_map: Union[mmap, None] = None
+    entries: Union[Dict[str, List[int]], None] = None
+
+    @classmethod
+    def open(cls, pack_path: str = RESOURCE_PACK_PATH) -> None:
+        """
+        Map the pack and read its index, no pack means all loose.
+        Opening again closes the old map first.
+        """
+
+        cls.close()
+        cls.entries = {}
+        try:
+            with open(pack_path, "rb") as pack_file:
+                cls.pack_map = mmap(pack_file.fileno(), 0, access=ACCESS_READ)
+        except FileNotFoundError:
+            return
+
+        if cls.pack_map[: len(cls.MAGIC)] != cls.MAGIC:
+            raise ValueError(f"{pack_path} is not a resource pack")
+        version, index_len = unpack_from(
+            cls.HEADER, cls.pack_map, len(cls.MAGIC)
+        )
+        if version != cls.VERSION:
+            raise ValueError(f"{pack_path} version {version} unsupported")
+        index_start: int = len(cls.MAGIC) + calcsize(cls.HEADER)
+        index_end: int = index_start + index_len
+        cls.entries = loads(bytes(cls.pack_map[index_start:index_end]))
+
+    @classmethod
+    def close(cls) -> None:
+        if cls.pack_map is not None:
+            cls.pack_map.close()
+        cls.pack_map = None
+        cls.entries = None
+
+    @staticmethod
+    def get_key(path: str) -> str:
+        """
+        Same key for a path on every OS.
+        """
+
+        return path.replace("\\", "/")
+
+    @classmethod
+    def get_entry(cls, path: str) -> Union[List[int], None]:
+        if cls.entries is None:
+            cls.open()
+        return (cls.entries or {}).get(cls.get_key(path))
+
+    @classmethod
+    def get_bytes(cls, path: str) -> Union[bytes, memoryview]:
+        """
+        Entry bytes, a view of the map if raw, else from the loose file.
+        """
+
+        entry: Union[List[int], None] = cls.get_entry(path)
+        if entry is None or cls.pack_map is None:
+            with open(path, "rb") as loose_file:
+                return loose_file.read()
+
+        offset, length, codec = entry
+        end: int = offset + length
+        view: memoryview = memoryview(cls.pack_map)[offset:end]
+        if codec == cls.ZLIB:
+            return decompress(view)
+        return view
+
+    @classmethod
+    def get_file(cls, path: str) -> Union[BinaryIO, str]:
+        """
+        File object for loaders that take one, loose path if not packed.
+        """
+
+        if cls.get_entry(path) is None:
+            return path
+        return BytesIO(cls.get_bytes(path))
+
+    @classmethod
+    def load_image(cls, path: str) -> pg.Surface:
+        return pg.image.load(cls.get_file(path), path)
+
+    @classmethod
+    def load_sound(cls, path: str) -> pg.mixer.Sound:
+        """
+        Sound buffer= wants raw samples, not a file, so a file object.
+        """
+
+        return pg.mixer.Sound(file=cls.get_file(path))
+
+    @classmethod
+    def load_music(cls, path: str) -> None:
+        """
+        Streamed, so the file object stays with the mixer until unload.
+        """
+
+        pg.mixer.music.load(cls.get_file(path), splitext(path)[1][1:])
+
+    @classmethod
+    def load_json(cls, path: str) -> Any:
+        return loads(bytes(cls.get_bytes(path)))
+
+    @classmethod
+    def build(
+        cls, paths: List[str], pack_path: str, is_zlib: bool = False
+    ) -> Dict[str, Tuple[int, int]]:
+        """
+        Write every loose file into one pack.
+        Zlib entries that do not shrink are stored raw.
+        Returns path to (loose length, packed length).
+        """
+
+        blobs: Dict[str, Tuple[bytes, int]] = {}
+        sizes: Dict[str, Tuple[int, int]] = {}
+        for path in paths:
+            with open(path, "rb") as loose_file:
+                blob: bytes = loose_file.read()
+            codec: int = cls.RAW
+            loose_len: int = len(blob)
+            if is_zlib:
+                compressed: bytes = compress(blob, 9)
+                if len(compressed) < loose_len:
+                    blob, codec = compressed, cls.ZLIB
+            blobs[cls.get_key(path)] = (blob, codec)
+            sizes[path] = (loose_len, len(blob))
+
+        # Offsets depend on the index length and the other way around,
+        # so reserve room for the offset digits, then pad to it.
+        entries: Dict[str, List[int]] = {
+            path: [0, len(blob), codec]
+            for path, (blob, codec) in blobs.items()
+        }
+        index_start: int = len(cls.MAGIC) + calcsize(cls.HEADER)
+        index_len: int = len(dumps(entries)) + 16 * len(entries) + 16
+        offset: int = index_start + index_len
+        for path, (blob, _) in blobs.items():
+            entries[path][0] = offset
+            offset += len(blob)
+        index: bytes = dumps(entries).encode()
+        index += b" " * (index_len - len(index))
+
+        with open(pack_path, "wb") as pack_file:
+            pack_file.write(cls.MAGIC)
+            pack_file.write(pack(cls.HEADER, cls.VERSION, index_len))
+            pack_file.write(index)
+            for blob, _ in blobs.values():
+                pack_file.write(blob)
+        return sizes
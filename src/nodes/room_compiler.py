@@ -0,0 +1,188 @@
+from hashlib import sha256
+from json import dump
+from json import load
+from os import listdir
+from os import makedirs
+from os import remove
+from os import replace
+from os import stat
+from os.path import join
+from os.path import splitext
+from time import time_ns
+from typing import Any
+from typing import Dict
+from typing import List
+from typing import Union
+
+import numpy as np
+from nodes.room_data import RoomData
+from typeguard import typechecked
+
+
+@typechecked
+class RoomCompiler:
+    """
+    Compiles room jsons into a binary cache next to them, loads that.
+    Parsing big tile lists from json is slow and memory hungry, npy
+    arrays open with mmap instantly and only touched pages are read.
+
+    Cache, jsons/rooms/<name>.cache/:
+    - tiles_<arrays id>.npy, layer_<layer name>_<arrays id>.npy, new
+      names every compile. Nothing is written over a file a RoomData
+      may have mapped, Windows cannot replace or delete mapped files.
+      Old ones are deleted after, those still mapped on the next one.
+    - header.json, written last, so a half written cache is never used:
+        - version.
+        - source_mtime_ns, source_size, source_sha256.
+        - arrays_id: which npy files are current.
+        - layers: layer names.
+        - actors, neighbors: as in the room json.
+
+    Valid if version and source mtime and size match. Mtime changed but
+    same hash, like a fresh checkout, is still valid, mtime is updated.
+    Else the json is compiled again.
+    """
+
+    VERSION: int = 2
+
+    @staticmethod
+    def get_cache_dir(name: str) -> str:
+        return splitext(RoomData.get_path(name))[0] + ".cache"
+
+    @staticmethod
+    def get_sha256(path: str) -> str:
+        with open(path, "rb") as source_file:
+            return sha256(source_file.read()).hexdigest()
+
+    @classmethod
+    def read_header(cls, name: str) -> Union[Dict[str, Any], None]:
+        """
+        Cache header if still valid for the source json, else None.
+        """
+
+        try:
+            with open(
+                join(cls.get_cache_dir(name), "header.json"), "r"
+            ) as header_json:
+                header: Dict[str, Any] = load(header_json)
+        except FileNotFoundError:
+            return None
+
+        if header["version"] != cls.VERSION:
+            return None
+
+        source_path: str = RoomData.get_path(name)
+        source_stat: Any = stat(source_path)
+        if header["source_size"] != source_stat.st_size:
+            return None
+        if header["source_mtime_ns"] == source_stat.st_mtime_ns:
+            return header
+
+        # Touched, not changed? Keep it, remember the new mtime.
+        if header["source_sha256"] != cls.get_sha256(source_path):
+            return None
+        header["source_mtime_ns"] = source_stat.st_mtime_ns
+        cls.write_header(name, header)
+        return header
+
+    @classmethod
+    def write_header(cls, name: str, header: Dict[str, Any]) -> None:
+        """
+        Write then rename, readers see the old or the new header, whole.
+        """
+
+        header_path: str = join(cls.get_cache_dir(name), "header.json")
+        with open(header_path + ".tmp", "w") as header_json:
+            dump(header, header_json)
+        replace(header_path + ".tmp", header_path)
+
+    @staticmethod
+    def get_array_paths(
+        cache_dir: str, header: Dict[str, Any]
+    ) -> Dict[str, str]:
+        """
+        Array name, tiles or layer_<layer name>, to its npy path.
+        """
+
+        names: List[str] = ["tiles"] + [
+            f"layer_{layer_name}" for layer_name in header["layers"]
+        ]
+        return {
+            name: join(cache_dir, f"{name}_{header['arrays_id']}.npy")
+            for name in names
+        }
+
+    @staticmethod
+    def remove_old_arrays(cache_dir: str, keep_paths: List[str]) -> None:
+        """
+        Delete npy files of older compiles. Still mapped on Windows?
+        Left for the next compile.
+        """
+
+        for file_name in listdir(cache_dir):
+            path: str = join(cache_dir, file_name)
+            if not file_name.endswith(".npy") or path in keep_paths:
+                continue
+            try:
+                remove(path)
+            except OSError:
+                pass
+
+    @classmethod
+    def compile(cls, name: str) -> Dict[str, Any]:
+        """
+        Room json to cache, returns the header.
+        """
+
+        source_path: str = RoomData.get_path(name)
+        source_stat: Any = stat(source_path)
+        room: RoomData = RoomData.load(name)
+
+        cache_dir: str = cls.get_cache_dir(name)
+        makedirs(cache_dir, exist_ok=True)
+
+        header: Dict[str, Any] = {
+            "version": cls.VERSION,
+            "source_mtime_ns": source_stat.st_mtime_ns,
+            "source_size": source_stat.st_size,
+            "source_sha256": cls.get_sha256(source_path),
+            "arrays_id": f"{time_ns():x}",
+            "layers": list(room.layers),
+            "actors": room.actors,
+            "neighbors": room.neighbors,
+        }
+        array_paths: Dict[str, str] = cls.get_array_paths(cache_dir, header)
+        np.save(array_paths["tiles"], room.tiles)
+        for layer_name, layer in room.layers.items():
+            np.save(array_paths[f"layer_{layer_name}"], layer)
+
+        cls.write_header(name, header)
+        cls.remove_old_arrays(cache_dir, list(array_paths.values()))
+        return header
+
+    @classmethod
+    def load(cls, name: str) -> RoomData:
+        """
+        Room from its cache, compiled first if missing or stale.
+        Arrays are read only mmaps, copy before editing.
+        """
+
+        header: Union[Dict[str, Any], None] = cls.read_header(name)
+        if header is None:
+            header = cls.compile(name)
+
+        array_paths: Dict[str, str] = cls.get_array_paths(
+            cls.get_cache_dir(name), header
+        )
+        return RoomData(
+            name,
+            np.load(array_paths["tiles"], mmap_mode="r"),
+            {
+                layer_name: np.load(
+                    array_paths[f"layer_{layer_name}"], mmap_mode="r"
+                )
+                for layer_name in header["layers"]
+            },
+            header["actors"],
+            header["neighbors"],
+        )
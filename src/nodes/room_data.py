@@ -0,0 +1,78 @@
+from json import load
+from os.path import join
+from typing import Any
+from typing import Dict
+from typing import List
+
+import numpy as np
+from constants import ROOMS_DIR_PATH
+from typeguard import typechecked
+
+
+@typechecked
+class RoomData:
+    """
+    Everything a room needs, decoded, no surfs, safe off the main thread.
+
+    Json, under jsons/rooms/<name>.json:
+    - cols, rows: room size in tiles.
+    - tiles: TileGrid kinds, rows lists of cols ints.
+    - layers: draw layer name to tile index rows, -1 is no tile.
+    - actors: list of {"name", "x", "y"}, actors dict key and px.
+    - neighbors: side to room name, like {"right": "forest_1"}.
+
+    Parameters:
+    - name: room name.
+    - tiles: [row, col] uint8 TileGrid kinds.
+    - layers: draw layer name to [row, col] int16 tile indexes.
+    - actors: actor spawns.
+    - neighbors: side to room name.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        tiles: np.ndarray,
+        layers: Dict[str, np.ndarray],
+        actors: List[Dict[str, Any]],
+        neighbors: Dict[str, str],
+    ):
+        self.name: str = name
+        self.tiles: np.ndarray = tiles
+        self.layers: Dict[str, np.ndarray] = layers
+        self.actors: List[Dict[str, Any]] = actors
+        self.neighbors: Dict[str, str] = neighbors
+
+    @staticmethod
+    def get_path(name: str) -> str:
+        return join(ROOMS_DIR_PATH, f"{name}.json")
+
+    @classmethod
+    def load(cls, name: str) -> "RoomData":
+        """
+        Read and decode a room json, blocking.
+        """
+
+        with open(cls.get_path(name), "r") as room_json:
+            data: Dict[str, Any] = load(room_json)
+
+        shape: tuple[int, int] = (data["rows"], data["cols"])
+        return cls(
+            name,
+            np.array(data["tiles"], np.uint8).reshape(shape),
+            {
+                layer_name: np.array(layer, np.int16).reshape(shape)
+                for layer_name, layer in data.get("layers", {}).items()
+            },
+            data.get("actors", []),
+            data.get("neighbors", {}),
+        )
+
+    def get_bytes(self) -> int:
+        """
+        Decoded array memory, for the streamer budget and stats.
+        """
+
+        return self.tiles.nbytes + sum(
+            layer.nbytes for layer in self.layers.values()
+        )
@@ -0,0 +1,127 @@
+from collections import OrderedDict
+from concurrent.futures import Future
+from concurrent.futures import ThreadPoolExecutor
+from typing import List
+from typing import Set
+from typing import Union
+
+from nodes.profiler import Profiler
+from nodes.room_compiler import RoomCompiler
+from nodes.room_data import RoomData
+from typeguard import typechecked
+
+
+@typechecked
+class RoomStreamer:
+    """
+    Loads rooms on a worker thread before the player gets there.
+    Entering a room prefetches its neighbors, so walking into one is a
+    swap of ready RoomData, not a blocking load.
+    Rooms load through RoomCompiler, so the thread mostly maps npy files.
+
+    Rooms, loaded or loading, are kept in a least recently used cache of
+    cache_size. The current room and its neighbors are never evicted.
+
+    Profiler:
+    - "room wait": main thread blocked on a room not ready yet, should
+      stay 0 when prefetch keeps up.
+    - "rooms cached", "room kb", "room misses" counters, end_frame.
+
+    Parameters:
+    - profiler: game profiler.
+    - cache_size: rooms kept, at least current plus its neighbors.
+    - workers_len: loader threads.
+    """
+
+    def __init__(
+        self, profiler: Profiler, cache_size: int = 8, workers_len: int = 1
+    ):
+        self.profiler: Profiler = profiler
+        self.cache_size: int = cache_size
+        self.executor: ThreadPoolExecutor = ThreadPoolExecutor(workers_len)
+
+        # Room name to its load, least recently used first.
+        self.rooms: OrderedDict[str, Future] = OrderedDict()
+
+        self.current_name: Union[str, None] = None
+
+        # Stats, rooms that were not ready when asked.
+        self.misses: int = 0
+
+    def prefetch(self, name: str) -> None:
+        """
+        Start loading a room if not cached, never blocks.
+        """
+
+        if name in self.rooms:
+            self.rooms.move_to_end(name)
+            return
+        self.rooms[name] = self.executor.submit(RoomCompiler.load, name)
+
+    def is_ready(self, name: str) -> bool:
+        room: Union[Future, None] = self.rooms.get(name)
+        return room is not None and room.done()
+
+    def get_room(self, name: str) -> RoomData:
+        """
+        Room data, blocks if not ready, load errors raise here.
+        """
+
+        self.prefetch(name)
+        room: Future = self.rooms[name]
+        if not room.done():
+            self.misses += 1
+            self.profiler.begin("room wait")
+            room.result()
+            self.profiler.end("room wait")
+        return room.result()
+
+    def set_current(self, name: str) -> RoomData:
+        """
+        Enter a room: get it, prefetch its neighbors, evict far rooms.
+        """
+
+        room: RoomData = self.get_room(name)
+        self.current_name = name
+        for neighbor_name in room.neighbors.values():
+            self.prefetch(neighbor_name)
+        self.rooms.move_to_end(name)
+        self.evict(set(room.neighbors.values()) | {name})
+        return room
+
+    def evict(self, keep_names: Set[str]) -> None:
+        """
+        Drop least recently used rooms past cache_size, not keep_names.
+        """
+
+        names: List[str] = [
+            name for name in self.rooms if name not in keep_names
+        ]
+        excess: int = len(self.rooms) - self.cache_size
+        for name in names[: max(excess, 0)]:
+            # Still loading? Let it finish, it is just not kept.
+            self.rooms.pop(name).cancel()
+
+    def close(self) -> None:
+        """
+        Cancel queued loads, end the worker threads, drop every room so
+        their npy maps close.
+        """
+
+        self.executor.shutdown(wait=True, cancel_futures=True)
+        self.rooms.clear()
+        self.current_name = None
+
+    def end_frame(self) -> None:
+        """
+        Report cache counters to the profiler.
+        """
+
+        loaded_bytes: int = sum(
+            room.result().get_bytes()
+            for room in self.rooms.values()
+            if room.done() and not room.cancelled() and not room.exception()
+        )
+        self.profiler.set_counter("rooms cached", len(self.rooms))
+        self.profiler.set_counter("room kb", round(loaded_bytes / 1024))
+        self.profiler.set_counter("room misses", self.misses)
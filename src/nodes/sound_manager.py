@@ -1,28 +1,310 @@
+from time import perf_counter
+from typing import Dict
+from typing import List
+from typing import Set
 from typing import Union
 
+from constants import MIXER_CHANNELS
+from constants import MIXER_FREQUENCY
+from constants import MIXER_SIZE
 from constants import pg
+from nodes.resource_pack import ResourcePack
 from typeguard import typechecked
 
 
 @typechecked
 class SoundManager:
+    """
+    Plays loaded sounds on fixed channel pools.
+
+    Categories:
+    - SFX.
+    - UI.
+    - MUSIC.
+
+    Each sound has:
+    - category: which channel pool it plays on.
+    - priority: higher steals channels from lower when pool is full.
+    - max_voices: how many of this sound can play at once.
+
+    Same sound triggered twice in one frame only plays once.
+    Main loop calls end_frame to clear this frame triggers.
+
+    Sounds are decoded and converted to the mixer format (set by
+    pre_init in constants) once at load, never during play.
+
+    If the mixer is not initialized (no audio device), every method
+    is a no op. Use SDL_AUDIODRIVER=dummy to run it without speakers.
+    """
+
+    # Categories.
+    SFX: int = 0
+    UI: int = 1
+    MUSIC: int = 2
+
+    # For get_stats keys and debug draw, kept in build.
+    category_names: List[str] = [
+        "sfx",
+        "ui",
+        "music",
+    ]
+
+    # How many channels each category owns.
+    CHANNEL_POOL_SIZES: Dict[int, int] = {
+        SFX: 12,
+        UI: 4,
+        MUSIC: 2,
+    }
+
     def __init__(self) -> None:
+        # No audio device? Then everything is a no op.
+        self.is_mixer_ready: bool = pg.mixer.get_init() is not None
+
+        # Loaded sounds and their play rules, name to value.
         self.sounds: dict[str, pg.mixer.Sound] = {}
+        self.sound_categories: Dict[str, int] = {}
+        self.sound_priorities: Dict[str, int] = {}
+        self.sound_max_voices: Dict[str, int] = {}
+        self.sound_bytes: Dict[str, int] = {}
+
+        # Category to channel indexes, each pool is a fixed slice.
+        self.pools: Dict[int, List[int]] = {}
+        channels_len: int = 0
+        for category, pool_size in self.CHANNEL_POOL_SIZES.items():
+            self.pools[category] = list(
+                range(channels_len, channels_len + pool_size)
+            )
+            channels_len += pool_size
+        self.channels_len: int = channels_len
+
+        # What each channel is playing, index to value.
+        self.channel_names: List[Union[str, None]] = [None] * channels_len
+        self.channel_priorities: List[int] = [0] * channels_len
+        self.channel_start_ticks: List[int] = [0] * channels_len
+
+        # Names triggered this frame, for same frame de duplication.
+        self.this_frame_names: Set[str] = set()
+
+        # Counters for get_stats.
+        self.steal_count: int = 0
+        self.drop_count: int = 0
+        self.dedupe_count: int = 0
+        self.this_frame_play_ms: float = 0.0
+        self.last_frame_play_ms: float = 0.0
+
+        if self.is_mixer_ready:
+            # Own every channel, reserve them all so Sound.play never
+            # picks one of our pool channels behind our back.
+            pg.mixer.set_num_channels(self.channels_len)
+            pg.mixer.set_reserved(self.channels_len)
+
+    def load_sound(
+        self,
+        name: str,
+        path: str,
+        category: int = SFX,
+        priority: int = 0,
+        max_voices: int = 2,
+    ) -> None:
+        """
+        Decode sound once, converted to mixer format.
+        Registers its category, priority and max voices.
+        """
+
+        if not self.is_mixer_ready:
+            return
+
+        self.add_sound(
+            name, ResourcePack.load_sound(path), category, priority, max_voices
+        )
+
+    def add_sound(
+        self,
+        name: str,
+        sound: pg.mixer.Sound,
+        category: int = SFX,
+        priority: int = 0,
+        max_voices: int = 2,
+    ) -> None:
+        """
+        Register a sound decoded elsewhere, like on the asset loader pool.
+        """
+
+        if not self.is_mixer_ready:
+            return
 
-    def load_sound(self, name: str, path: str) -> None:
-        sound: pg.mixer.Sound = pg.mixer.Sound(path)
         self.sounds[name] = sound
+        self.sound_categories[name] = category
+        self.sound_priorities[name] = priority
+        self.sound_max_voices[name] = max_voices
+
+        # Decoded size in mixer format.
+        self.sound_bytes[name] = (
+            int(sound.get_length() * MIXER_FREQUENCY)
+            * MIXER_CHANNELS
+            * (abs(MIXER_SIZE) // 8)
+        )
 
     def play_sound(self, name: str, loop: int = 0) -> None:
-        if name in self.sounds:
-            self.sounds[name].play(loop)
+        """
+        Play sound on its category pool.
+        - Same frame duplicate? Ignore.
+        - Reached max voices? Restart its oldest voice.
+        - Pool full? Steal lowest priority, oldest voice.
+        - Nothing to steal? Drop it.
+        """
+
+        if name not in self.sounds:
+            return
+
+        # Played this frame already? Ignore.
+        if name in self.this_frame_names:
+            self.dedupe_count += 1
+            return
+        self.this_frame_names.add(name)
+
+        start: float = perf_counter()
+
+        pool: List[int] = self.pools[self.sound_categories[name]]
+        priority: int = self.sound_priorities[name]
+
+        # Find my voices that are still playing.
+        my_voices: List[int] = [
+            index
+            for index in pool
+            if self.channel_names[index] == name
+            and pg.mixer.Channel(index).get_busy()
+        ]
+
+        channel_index: Union[int, None] = None
+
+        # Reached max voices? Reuse my oldest voice.
+        if len(my_voices) >= self.sound_max_voices[name]:
+            channel_index = min(
+                my_voices, key=lambda index: self.channel_start_ticks[index]
+            )
+        else:
+            channel_index = self.get_free_channel(pool)
+
+            # Pool full? Steal.
+            if channel_index is None:
+                channel_index = self.get_stealable_channel(pool, priority)
+                if channel_index is None:
+                    self.drop_count += 1
+                    self.this_frame_play_ms += (perf_counter() - start) * 1000
+                    return
+                self.steal_count += 1
+
+        pg.mixer.Channel(channel_index).play(self.sounds[name], loop)
+        self.channel_names[channel_index] = name
+        self.channel_priorities[channel_index] = priority
+        self.channel_start_ticks[channel_index] = pg.time.get_ticks()
+
+        self.this_frame_play_ms += (perf_counter() - start) * 1000
+
+    def get_free_channel(self, pool: List[int]) -> Union[int, None]:
+        """
+        Returns first idle channel index in pool, none if all busy.
+        """
+
+        for index in pool:
+            if not pg.mixer.Channel(index).get_busy():
+                return index
+        return None
+
+    def get_stealable_channel(
+        self, pool: List[int], priority: int
+    ) -> Union[int, None]:
+        """
+        Returns the lowest priority, oldest channel index in pool.
+        Only channels with priority lower or equal to given priority.
+        None if there is nothing to steal.
+        """
+
+        candidates: List[int] = [
+            index
+            for index in pool
+            if self.channel_priorities[index] <= priority
+        ]
+        if not candidates:
+            return None
+        return min(
+            candidates,
+            key=lambda index: (
+                self.channel_priorities[index],
+                self.channel_start_ticks[index],
+            ),
+        )
+
+    def end_frame(self) -> None:
+        """
+        Called by main.py at the end of loop.
+        Clears same frame triggers, rolls the play time counter.
+        """
+
+        self.this_frame_names.clear()
+        self.last_frame_play_ms = self.this_frame_play_ms
+        self.this_frame_play_ms = 0.0
+
+    def get_stats(self) -> Dict[str, float]:
+        """
+        Returns channel usage per category and mixer counters.
+        - <category>_busy: playing channels in that pool.
+        - <category>_size: channels in that pool.
+        - play_ms: time spent in play_sound last frame.
+        - loaded_bytes: decoded sound memory.
+        - steals, drops, dedupes: totals since start.
+        """
+
+        stats: Dict[str, float] = {}
+        for category, pool in self.pools.items():
+            category_name: str = self.category_names[category]
+            busy: int = 0
+            if self.is_mixer_ready:
+                busy = len(
+                    [
+                        index
+                        for index in pool
+                        if pg.mixer.Channel(index).get_busy()
+                    ]
+                )
+            stats[f"{category_name}_busy"] = busy
+            stats[f"{category_name}_size"] = len(pool)
+        stats["play_ms"] = self.last_frame_play_ms
+        stats["loaded_bytes"] = sum(self.sound_bytes.values())
+        stats["steals"] = self.steal_count
+        stats["drops"] = self.drop_count
+        stats["dedupes"] = self.dedupe_count
+        return stats
+
+    # REMOVE IN BUILD
+    def get_debug_text(self) -> str:
+        """
+        One line summary of get_stats for debug draw.
+        """
+
+        stats: Dict[str, float] = self.get_stats()
+        pools_text: str = " ".join(
+            [
+                f"{name} {int(stats[f'{name}_busy'])}/"
+                f"{int(stats[f'{name}_size'])}"
+                for name in self.category_names
+            ]
+        )
+        return (
+            f"sound: {pools_text} "
+            f"play ms: {stats['play_ms']:.2f} "
+            f"steals: {int(stats['steals'])} "
+            f"drops: {int(stats['drops'])}"
+        )
 
     def stop_sound(self, name: str) -> None:
         if name in self.sounds:
             self.sounds[name].stop()
 
     def stop_all_sounds(self) -> None:
-        pg.mixer.stop()
+        if self.is_mixer_ready:
+            pg.mixer.stop()
 
     def set_volume(self, name: str, volume: float) -> None:
         if name in self.sounds:
@@ -34,4 +316,12 @@ class SoundManager:
         return None
 
     def reset_sounds(self) -> None:
+        self.stop_all_sounds()
         self.sounds = {}
+        self.sound_categories = {}
+        self.sound_priorities = {}
+        self.sound_max_voices = {}
+        self.sound_bytes = {}
+        self.channel_names = [None] * self.channels_len
+        self.channel_priorities = [0] * self.channels_len
+        self.channel_start_ticks = [0] * self.channels_len
@@ -0,0 +1,179 @@
+from typing import Dict
+from typing import List
+from typing import Set
+from typing import Tuple
+
+import numpy as np
+from constants import pg
+from constants import TILE_HEIGHT
+from constants import TILE_WIDTH
+from nodes.broadphase import Broadphase
+from typeguard import typechecked
+
+
+@typechecked
+class SpatialHash(Broadphase):
+    """
+    Broadphase uniform grid index for actor rects.
+    Cells are tile sized multiples, each cell lists keys touching it.
+    Beats the QuadTree for many evenly spread actors, nothing to split.
+    Rects outside bounds go in the edge cells.
+
+    Parameters:
+    - bounds: area the room covers.
+    - cell_width: px, TILE_WIDTH multiple.
+    - cell_height: px, TILE_HEIGHT multiple.
+    """
+
+    def __init__(
+        self,
+        bounds: pg.Rect,
+        cell_width: int = TILE_WIDTH * 2,
+        cell_height: int = TILE_HEIGHT * 2,
+    ):
+        super().__init__(bounds)
+        self.cell_width: int = cell_width
+        self.cell_height: int = cell_height
+        self.cols: int = max(-(-bounds.width // cell_width), 1)
+        self.rows: int = max(-(-bounds.height // cell_height), 1)
+
+        # Flat cells, index is row * cols + col.
+        self.cells: List[List[int]] = []
+
+        # Key to rect, for exact query checks.
+        self.rects: Dict[int, pg.Rect] = {}
+
+        self.clear()
+
+    def clear(self) -> None:
+        self.cells = [[] for _ in range(self.cols * self.rows)]
+        self.rects = {}
+
+    def get_cell_range(self, rect: pg.Rect) -> Tuple[int, int, int, int]:
+        """
+        Returns first col, last col, first row, last row rect touches.
+        Clamped to bounds.
+        """
+
+        first_col: int = (rect.left - self.bounds.x) // self.cell_width
+        last_col: int = (rect.right - 1 - self.bounds.x) // self.cell_width
+        first_row: int = (rect.top - self.bounds.y) // self.cell_height
+        last_row: int = (rect.bottom - 1 - self.bounds.y) // self.cell_height
+        first_col = min(max(first_col, 0), self.cols - 1)
+        last_col = min(max(last_col, first_col), self.cols - 1)
+        first_row = min(max(first_row, 0), self.rows - 1)
+        last_row = min(max(last_row, first_row), self.rows - 1)
+        return first_col, last_col, first_row, last_row
+
+    def get_cell_indexes(self, rect: pg.Rect) -> List[int]:
+        """
+        Returns flat indexes of cells rect touches.
+        """
+
+        first_col, last_col, first_row, last_row = self.get_cell_range(rect)
+        return [
+            row * self.cols + col
+            for row in range(first_row, last_row + 1)
+            for col in range(first_col, last_col + 1)
+        ]
+
+    def insert(self, key: int, rect: pg.Rect) -> None:
+        self.rects[key] = rect
+        for index in self.get_cell_indexes(rect):
+            self.cells[index].append(key)
+
+    def remove(self, key: int, rect: pg.Rect) -> None:
+        for index in self.get_cell_indexes(rect):
+            cell: List[int] = self.cells[index]
+            if key in cell:
+                cell.remove(key)
+        self.rects.pop(key, None)
+
+    def update(self, key: int, old_rect: pg.Rect, new_rect: pg.Rect) -> None:
+        # Still in the same cells? Only swap the rect.
+        if self.get_cell_range(old_rect) == self.get_cell_range(new_rect):
+            self.rects[key] = new_rect
+            return
+
+        self.remove(key, old_rect)
+        self.insert(key, new_rect)
+
+    def query(self, rect: pg.Rect) -> List[int]:
+        indexes: List[int] = self.get_cell_indexes(rect)
+
+        # One cell? No key can show up twice.
+        if len(indexes) == 1:
+            return [
+                key
+                for key in self.cells[indexes[0]]
+                if self.rects[key].colliderect(rect)
+            ]
+
+        seen: Set[int] = set()
+        keys: List[int] = []
+        for index in indexes:
+            for key in self.cells[index]:
+                if key in seen:
+                    continue
+                seen.add(key)
+                if self.rects[key].colliderect(rect):
+                    keys.append(key)
+        return keys
+
+    def rebuild(self, rects: np.ndarray) -> None:
+        """
+        Clear then insert every rect at once.
+        Rects is a (n, 4) array of x, y, width, height, key is row index.
+        Cells are found in NumPy, rects in one cell are grouped by sort.
+        """
+
+        self.clear()
+        if rects.shape[0] == 0:
+            return
+
+        xs: np.ndarray = rects[:, 0].astype(np.int64) - self.bounds.x
+        ys: np.ndarray = rects[:, 1].astype(np.int64) - self.bounds.y
+        rights: np.ndarray = xs + rects[:, 2].astype(np.int64) - 1
+        bottoms: np.ndarray = ys + rects[:, 3].astype(np.int64) - 1
+        first_cols: np.ndarray = np.clip(
+            xs // self.cell_width, 0, self.cols - 1
+        )
+        last_cols: np.ndarray = np.clip(
+            rights // self.cell_width, first_cols, self.cols - 1
+        )
+        first_rows: np.ndarray = np.clip(
+            ys // self.cell_height, 0, self.rows - 1
+        )
+        last_rows: np.ndarray = np.clip(
+            bottoms // self.cell_height, first_rows, self.rows - 1
+        )
+
+        self.rects = {
+            key: pg.Rect(x, y, width, height)
+            for key, (x, y, width, height) in enumerate(rects.tolist())
+        }
+
+        # Rects in one cell, most of them: group by cell index.
+        is_singles: np.ndarray = (first_cols == last_cols) & (
+            first_rows == last_rows
+        )
+        single_keys: np.ndarray = np.flatnonzero(is_singles)
+        single_indexes: np.ndarray = (
+            first_rows[single_keys] * self.cols + first_cols[single_keys]
+        )
+        order: np.ndarray = np.argsort(single_indexes, kind="stable")
+        sorted_keys: np.ndarray = single_keys[order]
+        indexes, starts = np.unique(single_indexes[order], return_index=True)
+        ends: np.ndarray = np.append(starts[1:], sorted_keys.size)
+        for index, start, end in zip(
+            indexes.tolist(), starts.tolist(), ends.tolist()
+        ):
+            self.cells[index] = sorted_keys[start:end].tolist()
+
+        # Rects across cells: few, plain python.
+        for key in np.flatnonzero(~is_singles).tolist():
+            for row in range(int(first_rows[key]), int(last_rows[key]) + 1):
+                for col in range(
+                    int(first_cols[key]), int(last_cols[key]) + 1
+                ):
+                    self.cells[row * self.cols + col].append(key)
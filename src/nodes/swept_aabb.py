@@ -0,0 +1,384 @@
+from math import ceil
+from math import floor
+from math import inf
+from typing import Dict
+from typing import List
+from typing import Tuple
+from typing import Union
+
+import numpy as np
+from constants import pg
+from constants import TILE_HEIGHT
+from constants import TILE_WIDTH
+from nodes.broadphase import Broadphase
+from nodes.tile_grid import TileGrid
+from typeguard import typechecked
+
+
+@typechecked
+class SweptAabb:
+    """
+    Continuous collision for fast actors.
+    A moving rect is swept along its whole move, so it cannot skip
+    over a 16 px tile on a big dt.
+
+    Every sweep returns (time of impact, normal x, normal y, ...):
+    - time of impact: 0 - 1 fraction of the move, 1 if nothing is hit.
+    - normal: which side was hit, (0, 0) if nothing is hit.
+
+    Tiles: only the blocking tiles inside the swept rect are checked.
+    Actors: a Broadphase is queried with the swept rect,
+    only the rects it returns are checked.
+    Many candidates are tested all at once with NumPy.
+    """
+
+    # Nothing hit.
+    NO_HIT: Tuple[float, float, float, int] = (1.0, 0.0, 0.0, -1)
+
+    # Px, touching within this counts as touching, not overlapping.
+    # Also how far move keeps the rect away from what it hit.
+    EPSILON: float = 0.001
+
+    # Up to this many boxes are swept in plain python, more in NumPy.
+    SCALAR_LIMIT: int = 16
+
+    @staticmethod
+    def get_swept_rect(
+        x: float, y: float, width: float, height: float, dx: float, dy: float
+    ) -> pg.Rect:
+        """
+        Returns the int rect covering the rect at start and end of move.
+        """
+
+        left: int = floor(min(x, x + dx))
+        top: int = floor(min(y, y + dy))
+        right: int = ceil(max(x, x + dx) + width)
+        bottom: int = ceil(max(y, y + dy) + height)
+        return pg.Rect(left, top, right - left, bottom - top)
+
+    @staticmethod
+    def sweep_box(
+        x: float,
+        y: float,
+        width: float,
+        height: float,
+        dx: float,
+        dy: float,
+        box: Tuple[float, float, float, float],
+    ) -> Tuple[float, float, float]:
+        """
+        Sweep a moving rect against one still box.
+        Box is left, top, right, bottom.
+        Same rules as sweep_boxes, plain python is faster for few boxes.
+        """
+
+        if dx == 0 and dy == 0:
+            return 1.0, 0.0, 0.0
+
+        left, top, right, bottom = box
+
+        # Entry and exit time per axis.
+        if dx > 0:
+            x_entry: float = (left - (x + width)) / dx
+            x_exit: float = (right - x) / dx
+        elif dx < 0:
+            x_entry = (right - x) / dx
+            x_exit = (left - (x + width)) / dx
+        elif x < right and x + width > left:
+            x_entry = -inf
+            x_exit = inf
+        else:
+            return 1.0, 0.0, 0.0
+
+        if dy > 0:
+            y_entry: float = (top - (y + height)) / dy
+            y_exit: float = (bottom - y) / dy
+        elif dy < 0:
+            y_entry = (bottom - y) / dy
+            y_exit = (top - (y + height)) / dy
+        elif y < bottom and y + height > top:
+            y_entry = -inf
+            y_exit = inf
+        else:
+            return 1.0, 0.0, 0.0
+
+        entry: float = max(x_entry, y_entry)
+        exit: float = min(x_exit, y_exit)
+
+        # Touching within EPSILON px counts as entering now.
+        tolerance: float = SweptAabb.EPSILON / max(abs(dx), abs(dy))
+        if entry >= exit or entry < -tolerance or entry > 1:
+            return 1.0, 0.0, 0.0
+
+        # Last axis to enter is the side that was hit.
+        if x_entry > y_entry:
+            return max(entry, 0.0), -1.0 if dx > 0 else 1.0, 0.0
+        return max(entry, 0.0), 0.0, -1.0 if dy > 0 else 1.0
+
+    @staticmethod
+    def get_axis_times(
+        start: float,
+        size: float,
+        delta: float,
+        mins: np.ndarray,
+        maxs: np.ndarray,
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Entry and exit time on one axis, for every box.
+        Not moving on this axis? Always inside or never inside.
+        """
+
+        if delta > 0:
+            return (mins - (start + size)) / delta, (maxs - start) / delta
+        if delta < 0:
+            return (maxs - start) / delta, (mins - (start + size)) / delta
+
+        is_insides: np.ndarray = (start < maxs) & (start + size > mins)
+        return (
+            np.where(is_insides, -inf, inf),
+            np.where(is_insides, inf, -inf),
+        )
+
+    @staticmethod
+    def sweep_boxes(
+        x: float,
+        y: float,
+        width: float,
+        height: float,
+        dx: float,
+        dy: float,
+        boxes: np.ndarray,
+        is_top_onlys: Union[np.ndarray, None] = None,
+    ) -> Tuple[float, float, float, int]:
+        """
+        Sweep a moving rect against still boxes.
+        Boxes is a (n, 4) array of left, top, right, bottom.
+        Returns the earliest hit and its box index, -1 if nothing is hit.
+        Boxes that already overlap at start are not hit.
+        is_top_onlys marks boxes only hit from above, like ONE_WAY tiles.
+        """
+
+        if boxes.shape[0] == 0 or (dx == 0 and dy == 0):
+            return SweptAabb.NO_HIT
+
+        x_entries, x_exits = SweptAabb.get_axis_times(
+            x, width, dx, boxes[:, 0], boxes[:, 2]
+        )
+        y_entries, y_exits = SweptAabb.get_axis_times(
+            y, height, dy, boxes[:, 1], boxes[:, 3]
+        )
+        entries: np.ndarray = np.maximum(x_entries, y_entries)
+        exits: np.ndarray = np.minimum(x_exits, y_exits)
+
+        # Touching within EPSILON px counts as entering now.
+        tolerance: float = SweptAabb.EPSILON / max(abs(dx), abs(dy))
+        is_hits: np.ndarray = (
+            (entries < exits) & (entries >= -tolerance) & (entries <= 1)
+        )
+
+        # Top only boxes hit on their side or bottom are not hit.
+        if is_top_onlys is not None:
+            is_from_aboves: np.ndarray = x_entries <= y_entries
+            if dy <= 0:
+                is_from_aboves[:] = False
+            is_hits &= ~is_top_onlys | is_from_aboves
+        if not is_hits.any():
+            return SweptAabb.NO_HIT
+
+        index: int = int(np.argmin(np.where(is_hits, entries, inf)))
+        time: float = max(float(entries[index]), 0.0)
+
+        # Last axis to enter is the side that was hit.
+        if x_entries[index] > y_entries[index]:
+            return time, -1.0 if dx > 0 else 1.0, 0.0, index
+        return time, 0.0, -1.0 if dy > 0 else 1.0, index
+
+    @staticmethod
+    def sweep_rects(
+        x: float,
+        y: float,
+        width: float,
+        height: float,
+        dx: float,
+        dy: float,
+        targets: List[pg.Rect],
+    ) -> Tuple[float, float, float, int]:
+        """
+        Sweep against a few rects, like what a broadphase returns.
+        Returns the earliest hit and its index, -1 if nothing is hit.
+        """
+
+        result: Tuple[float, float, float, int] = SweptAabb.NO_HIT
+        for index, target in enumerate(targets):
+            time, normal_x, normal_y = SweptAabb.sweep_box(
+                x,
+                y,
+                width,
+                height,
+                dx,
+                dy,
+                (target.left, target.top, target.right, target.bottom),
+            )
+            if time < result[0]:
+                result = (time, normal_x, normal_y, index)
+        return result
+
+    @staticmethod
+    def sweep_tiles(
+        grid: TileGrid,
+        x: float,
+        y: float,
+        width: float,
+        height: float,
+        dx: float,
+        dy: float,
+    ) -> Tuple[float, float, float]:
+        """
+        Sweep against the grid SOLID tiles, and ONE_WAY tiles when
+        falling onto them from above. Slopes are not hit.
+        """
+
+        swept_rect: pg.Rect = SweptAabb.get_swept_rect(
+            x, y, width, height, dx, dy
+        )
+        first_col, last_col = grid.get_col_range(
+            swept_rect.x, swept_rect.width
+        )
+        first_row, last_row = grid.get_row_range(
+            swept_rect.y, swept_rect.height
+        )
+        first_col = max(first_col, 0)
+        first_row = max(first_row, 0)
+        cols_slice: slice = slice(first_col, max(last_col + 1, 0))
+        rows_slice: slice = slice(first_row, max(last_row + 1, 0))
+        tiles: np.ndarray = grid.tiles[rows_slice, cols_slice]
+
+        # ONE_WAY only blocks if rect bottom is above it and falling.
+        is_blockings: np.ndarray = tiles == TileGrid.SOLID
+        if dy > 0:
+            tops: np.ndarray = (
+                np.arange(tiles.shape[0]) + first_row
+            ) * TILE_HEIGHT
+            is_aboves: np.ndarray = y + height <= tops + SweptAabb.EPSILON
+            is_blockings |= (tiles == TileGrid.ONE_WAY) & is_aboves[:, None]
+
+        rows, cols = np.nonzero(is_blockings)
+        rows += first_row
+        cols += first_col
+
+        # Few tiles? Plain python is faster than NumPy setup.
+        if rows.size <= SweptAabb.SCALAR_LIMIT:
+            result: Tuple[float, float, float] = (1.0, 0.0, 0.0)
+            for row, col in zip(rows.tolist(), cols.tolist()):
+                left: int = col * TILE_WIDTH
+                top: int = row * TILE_HEIGHT
+                hit: Tuple[float, float, float] = SweptAabb.sweep_box(
+                    x,
+                    y,
+                    width,
+                    height,
+                    dx,
+                    dy,
+                    (left, top, left + TILE_WIDTH, top + TILE_HEIGHT),
+                )
+                if hit[0] >= result[0]:
+                    continue
+
+                # ONE_WAY hit from the side? Ignore it.
+                if hit[2] != -1.0 and grid.tiles[row, col] == TileGrid.ONE_WAY:
+                    continue
+
+                result = hit
+            return result
+
+        lefts: np.ndarray = cols * TILE_WIDTH
+        tops = rows * TILE_HEIGHT
+        boxes: np.ndarray = np.stack(
+            (lefts, tops, lefts + TILE_WIDTH, tops + TILE_HEIGHT), axis=1
+        ).astype(np.float64)
+
+        # ONE_WAY hit from the side? Ignore it.
+        time, normal_x, normal_y, _ = SweptAabb.sweep_boxes(
+            x,
+            y,
+            width,
+            height,
+            dx,
+            dy,
+            boxes,
+            grid.tiles[rows, cols] == TileGrid.ONE_WAY,
+        )
+        return time, normal_x, normal_y
+
+    @staticmethod
+    def sweep_actors(
+        broadphase: Broadphase,
+        rects: Dict[int, pg.Rect],
+        self_key: int,
+        x: float,
+        y: float,
+        width: float,
+        height: float,
+        dx: float,
+        dy: float,
+    ) -> Tuple[float, float, float, int]:
+        """
+        Sweep against other actor rects.
+        Broadphase holds rects by key, self_key is skipped.
+        Returns the earliest hit and its key, key is -1 if nothing is hit.
+        """
+
+        keys: List[int] = [
+            key
+            for key in broadphase.query(
+                SweptAabb.get_swept_rect(x, y, width, height, dx, dy)
+            )
+            if key != self_key
+        ]
+        time, normal_x, normal_y, index = SweptAabb.sweep_rects(
+            x, y, width, height, dx, dy, [rects[key] for key in keys]
+        )
+        return time, normal_x, normal_y, keys[index] if index >= 0 else -1
+
+    @staticmethod
+    def move(
+        grid: TileGrid,
+        x: float,
+        y: float,
+        width: float,
+        height: float,
+        dx: float,
+        dy: float,
+        max_slides: int = 3,
+    ) -> Tuple[float, float, float, float]:
+        """
+        Move a rect against the grid tiles without tunneling.
+        Stops at the hit, then slides the rest of the move along it.
+        Returns new x, new y and the last hit normal.
+        """
+
+        normal_x: float = 0.0
+        normal_y: float = 0.0
+        for _ in range(max_slides):
+            if dx == 0 and dy == 0:
+                break
+
+            time, hit_x, hit_y = SweptAabb.sweep_tiles(
+                grid, x, y, width, height, dx, dy
+            )
+            x += dx * time
+            y += dy * time
+            if time == 1.0:
+                break
+
+            normal_x, normal_y = hit_x, hit_y
+
+            # Keep a tiny gap, so float error never starts inside.
+            x += hit_x * SweptAabb.EPSILON
+            y += hit_y * SweptAabb.EPSILON
+
+            # Slide, drop the part of the move that goes into the hit.
+            remaining: float = 1.0 - time
+            dx = 0.0 if hit_x != 0 else dx * remaining
+            dy = 0.0 if hit_y != 0 else dy * remaining
+        return x, y, normal_x, normal_y
@@ -0,0 +1,241 @@
+from math import floor
+from typing import Tuple
+
+import numpy as np
+from constants import TILE_HEIGHT
+from constants import TILE_WIDTH
+from typeguard import typechecked
+
+
+@typechecked
+class TileGrid:
+    """
+    Room solidity, one uint8 per tile in a NumPy grid.
+    Queries only look at the tiles a rect touches, never the whole room.
+
+    Tile kinds:
+    - EMPTY.
+    - SOLID: blocks from every side.
+    - ONE_WAY: only blocks falling actors that were above it.
+    - SLOPE_UP_RIGHT: floor rises from left to right, like /.
+    - SLOPE_UP_LEFT: floor rises from right to left, like \\.
+
+    Out of the grid is EMPTY, so actors can walk out of the room.
+
+    Parameters:
+    - cols: room width in tiles.
+    - rows: room height in tiles.
+
+    Properties:
+    - tiles: [row, col] grid.
+    - version: goes up on every tile change, caches compare it.
+    """
+
+    # Tile kinds.
+    EMPTY: int = 0
+    SOLID: int = 1
+    ONE_WAY: int = 2
+    SLOPE_UP_RIGHT: int = 3
+    SLOPE_UP_LEFT: int = 4
+
+    # To not count touching edges as overlapping.
+    EPSILON: float = 0.001
+
+    def __init__(self, cols: int, rows: int):
+        self.cols: int = cols
+        self.rows: int = rows
+        self.tiles: np.ndarray = np.zeros((rows, cols), np.uint8)
+        self.version: int = 0
+
+    def set_tile(self, col: int, row: int, kind: int) -> None:
+        self.tiles[row, col] = kind
+        self.version += 1
+
+    def set_tiles(self, tiles: np.ndarray) -> None:
+        """
+        Replace the whole grid, takes a [row, col] array.
+        """
+
+        self.tiles = tiles.astype(np.uint8)
+        self.rows, self.cols = self.tiles.shape
+        self.version += 1
+
+    def get_tile(self, col: int, row: int) -> int:
+        if 0 <= col < self.cols and 0 <= row < self.rows:
+            return int(self.tiles[row, col])
+        return self.EMPTY
+
+    def get_col_range(self, x: float, width: float) -> Tuple[int, int]:
+        """
+        First and last col a span touches, not clipped to grid.
+        """
+
+        return (
+            floor(x / TILE_WIDTH),
+            floor((x + width - self.EPSILON) / TILE_WIDTH),
+        )
+
+    def get_row_range(self, y: float, height: float) -> Tuple[int, int]:
+        """
+        First and last row a span touches, not clipped to grid.
+        """
+
+        return (
+            floor(y / TILE_HEIGHT),
+            floor((y + height - self.EPSILON) / TILE_HEIGHT),
+        )
+
+    def get_tiles_in_rect(
+        self, x: float, y: float, width: float, height: float
+    ) -> np.ndarray:
+        """
+        Returns a view of the tiles a rect touches, clipped to grid.
+        """
+
+        first_col, last_col = self.get_col_range(x, width)
+        first_row, last_row = self.get_row_range(y, height)
+        cols: slice = slice(max(first_col, 0), max(last_col + 1, 0))
+        rows: slice = slice(max(first_row, 0), max(last_row + 1, 0))
+        return self.tiles[rows, cols]
+
+    def is_rect_solid(
+        self, x: float, y: float, width: float, height: float
+    ) -> bool:
+        """
+        True if the rect touches any SOLID tile.
+        """
+
+        return bool(
+            np.any(self.get_tiles_in_rect(x, y, width, height) == self.SOLID)
+        )
+
+    def get_slope_floor_y(self, col: int, row: int, x: float) -> float:
+        """
+        Returns the slope surface y at world x, inside given slope tile.
+        """
+
+        local_x: float = min(max(x - col * TILE_WIDTH, 0), TILE_WIDTH)
+        height: float = local_x * TILE_HEIGHT / TILE_WIDTH
+        if self.get_tile(col, row) == self.SLOPE_UP_LEFT:
+            height = TILE_HEIGHT - height
+        return (row + 1) * TILE_HEIGHT - height
+
+    def move_x(
+        self,
+        x: float,
+        y: float,
+        width: float,
+        height: float,
+        dx: float,
+        step_height: float = 0,
+    ) -> Tuple[float, bool]:
+        """
+        Moves a rect along x, stops at the first SOLID col it sweeps.
+        SOLID tiles whose top is within step_height of the rect bottom
+        are stepped over, move_y then lifts the rect on top of them.
+        Returns new x and true if it hit a wall.
+        """
+
+        if dx == 0:
+            return x, False
+
+        first_row, last_row = self.get_row_range(y, height)
+        bottom: float = y + height
+
+        if dx > 0:
+            first_col: int = floor((x + width) / TILE_WIDTH)
+            last_col: int = floor((x + width + dx - self.EPSILON) / TILE_WIDTH)
+            step: int = 1
+        else:
+            first_col = floor((x - self.EPSILON) / TILE_WIDTH)
+            last_col = floor((x + dx) / TILE_WIDTH)
+            step = -1
+
+        for col in range(first_col, last_col + step, step):
+            for row in range(first_row, last_row + 1):
+                if self.get_tile(col, row) != self.SOLID:
+                    continue
+
+                # Low enough to step on? Not a wall.
+                if row * TILE_HEIGHT >= bottom - step_height:
+                    continue
+
+                if dx > 0:
+                    return col * TILE_WIDTH - width, True
+                return (col + 1) * TILE_WIDTH, True
+
+        return x + dx, False
+
+    def move_y(
+        self,
+        x: float,
+        y: float,
+        width: float,
+        height: float,
+        dy: float,
+    ) -> Tuple[float, bool]:
+        """
+        Moves a rect along y.
+        Going up stops at SOLID.
+        Going down stops at SOLID, ONE_WAY it was above and slopes
+        under the rect bottom center.
+        Returns new y and true if it hit something.
+        """
+
+        if dy == 0:
+            return y, False
+
+        first_col, last_col = self.get_col_range(x, width)
+
+        # Going up, only SOLID blocks.
+        if dy < 0:
+            first_row: int = floor((y - self.EPSILON) / TILE_HEIGHT)
+            last_row: int = floor((y + dy) / TILE_HEIGHT)
+            for row in range(first_row, last_row - 1, -1):
+                for col in range(first_col, last_col + 1):
+                    if self.get_tile(col, row) == self.SOLID:
+                        return (row + 1) * TILE_HEIGHT, True
+            return y + dy, False
+
+        # Going down.
+        bottom: float = y + height
+        new_bottom: float = bottom + dy
+        center_x: float = x + width / 2
+        center_col: int = floor(center_x / TILE_WIDTH)
+
+        # Start from the row my bottom is in, to catch slopes and tiles
+        # stepped onto by move_x.
+        first_row = floor((bottom - self.EPSILON) / TILE_HEIGHT)
+        last_row = floor((new_bottom - self.EPSILON) / TILE_HEIGHT)
+
+        for row in range(first_row, last_row + 1):
+            row_top: float = row * TILE_HEIGHT
+            floor_y: float = new_bottom
+            is_hit: bool = False
+
+            for col in range(first_col, last_col + 1):
+                kind: int = self.get_tile(col, row)
+
+                # ONE_WAY only if I was above it.
+                if kind == self.SOLID or (
+                    kind == self.ONE_WAY and bottom <= row_top + self.EPSILON
+                ):
+                    floor_y = min(floor_y, row_top)
+                    is_hit = True
+
+            # Slopes only count under the rect bottom center.
+            if self.get_tile(center_col, row) in [
+                self.SLOPE_UP_RIGHT,
+                self.SLOPE_UP_LEFT,
+            ]:
+                slope_y: float = self.get_slope_floor_y(
+                    center_col, row, center_x
+                )
+                if slope_y <= floor_y:
+                    floor_y = slope_y
+                    is_hit = True
+
+            if is_hit:
+                return floor_y - height, True
+
+        return y + dy, False
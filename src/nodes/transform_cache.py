@@ -0,0 +1,189 @@
+from collections import OrderedDict
+from typing import List
+from typing import Tuple
+from typing import Union
+
+from constants import pg
+from nodes.profiler import Profiler
+from typeguard import typechecked
+
+
+@typechecked
+class TransformCache:
+    """
+    Memoized flipped, rotated and scaled copies of sprites.
+    pg.transform makes a new surf every call, so a sprite facing left or
+    a spinning projectile would allocate every frame without this.
+
+    Angle is snapped to ANGLE_STEP degrees and scale to SCALE_STEP, so
+    nearby values share one copy.
+    Least recently used copies are dropped past max_bytes.
+    Hit rate and resident bytes go to the profiler on end_frame.
+
+    Parameters:
+    - profiler: game profiler.
+    - max_bytes: resident copies limit.
+    """
+
+    # Degrees.
+    ANGLE_STEP: float = 5.0
+
+    SCALE_STEP: float = 0.05
+
+    def __init__(self, profiler: Profiler, max_bytes: int = 8 * 1024 * 1024):
+        self.profiler: Profiler = profiler
+        self.max_bytes: int = max_bytes
+
+        # (source id, flip x, flip y, angle, scale) to (source, copy).
+        # Source is kept so its id is never reused while cached.
+        self.copies: OrderedDict[
+            Tuple[int, bool, bool, float, float],
+            Tuple[pg.Surface, pg.Surface],
+        ] = OrderedDict()
+        self.resident_bytes: int = 0
+
+        # Stats, this frame.
+        self.hits: int = 0
+        self.misses: int = 0
+
+    @staticmethod
+    def get_bytes(surf: pg.Surface) -> int:
+        return surf.get_pitch() * surf.get_height()
+
+    def get_key(
+        self,
+        surf: pg.Surface,
+        is_flip_x: bool,
+        is_flip_y: bool,
+        angle: float,
+        scale: float,
+    ) -> Tuple[int, bool, bool, float, float]:
+        """
+        Snapped angle and scale, so nearby values share one copy.
+        """
+
+        return (
+            id(surf),
+            is_flip_x,
+            is_flip_y,
+            round(angle / self.ANGLE_STEP) * self.ANGLE_STEP % 360,
+            round(scale / self.SCALE_STEP) * self.SCALE_STEP,
+        )
+
+    def get(
+        self,
+        surf: pg.Surface,
+        is_flip_x: bool = False,
+        is_flip_y: bool = False,
+        angle: float = 0.0,
+        scale: float = 1.0,
+    ) -> pg.Surface:
+        """
+        Flip, then scale, then rotate counter clockwise in degrees.
+        Returns the cached copy, do not draw on it.
+        """
+
+        copy_key: Tuple[int, bool, bool, float, float] = self.get_key(
+            surf, is_flip_x, is_flip_y, angle, scale
+        )
+        _, _, _, snapped_angle, snapped_scale = copy_key
+
+        # Nothing to do? No copy.
+        if (
+            not is_flip_x
+            and not is_flip_y
+            and snapped_angle == 0
+            and snapped_scale == 1
+        ):
+            return surf
+
+        cached: Union[Tuple[pg.Surface, pg.Surface], None] = self.copies.get(
+            copy_key
+        )
+        if cached is not None:
+            self.hits += 1
+            self.copies.move_to_end(copy_key)
+            return cached[1]
+
+        self.misses += 1
+        return self.add(copy_key, surf)
+
+    def add(
+        self,
+        copy_key: Tuple[int, bool, bool, float, float],
+        surf: pg.Surface,
+    ) -> pg.Surface:
+        """
+        Make a copy, then drop old ones past max_bytes.
+        """
+
+        _, is_flip_x, is_flip_y, angle, scale = copy_key
+        copy_surf: pg.Surface = surf
+        if is_flip_x or is_flip_y:
+            copy_surf = pg.transform.flip(copy_surf, is_flip_x, is_flip_y)
+        if scale != 1:
+            copy_surf = pg.transform.scale_by(copy_surf, scale)
+        if angle != 0:
+            copy_surf = pg.transform.rotate(copy_surf, angle)
+
+        self.copies[copy_key] = (surf, copy_surf)
+        self.resident_bytes += self.get_bytes(copy_surf)
+        while self.resident_bytes > self.max_bytes and len(self.copies) > 1:
+            _, (_, old_surf) = self.copies.popitem(last=False)
+            self.resident_bytes -= self.get_bytes(old_surf)
+        return copy_surf
+
+    def prebake(
+        self,
+        surf: pg.Surface,
+        flips: Union[List[Tuple[bool, bool]], None] = None,
+        angles: Union[List[float], None] = None,
+        scales: Union[List[float], None] = None,
+    ) -> None:
+        """
+        Make every combination now, at asset load, not mid game.
+        Missing lists mean no flip, 0 degrees, scale 1.
+        Does not count as hits or misses.
+        """
+
+        for is_flip_x, is_flip_y in flips or [(False, False)]:
+            for angle in angles or [0.0]:
+                for scale in scales or [1.0]:
+                    copy_key: Tuple[int, bool, bool, float, float] = (
+                        self.get_key(surf, is_flip_x, is_flip_y, angle, scale)
+                    )
+                    if (
+                        copy_key[1:] == (False, False, 0, 1)
+                        or copy_key in self.copies
+                    ):
+                        continue
+                    self.add(copy_key, surf)
+
+    def forget(self, surf: pg.Surface) -> None:
+        """
+        Drop every copy of a sprite, like on room change.
+        """
+
+        for copy_key in [
+            copy_key
+            for copy_key, (source, _) in self.copies.items()
+            if source is surf
+        ]:
+            _, copy_surf = self.copies.pop(copy_key)
+            self.resident_bytes -= self.get_bytes(copy_surf)
+
+    def end_frame(self) -> None:
+        """
+        Report this frame hit rate and resident bytes to the profiler.
+        """
+
+        lookups: int = self.hits + self.misses
+        self.profiler.set_counter(
+            "transform hit %",
+            round(self.hits / lookups * 100) if lookups else 100,
+        )
+        self.profiler.set_counter(
+            "transform kb", round(self.resident_bytes / 1024)
+        )
+        self.hits = 0
+        self.misses = 0
@@ -0,0 +1,59 @@
+from os import environ
+
+# Dummy SDL drivers before constants runs pg.init, workers inherit them.
+environ.setdefault("SDL_VIDEODRIVER", "dummy")
+environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+from argparse import ArgumentParser  # noqa: E402
+from json import dump  # noqa: E402
+from typing import Any  # noqa: E402
+from typing import Dict  # noqa: E402
+from typing import List  # noqa: E402
+
+from nodes.headless_runner import HeadlessRunner  # noqa: E402
+
+# REMOVE IN BUILD
+# Runs many headless sessions across a process pool, prints a summary.
+# Default script presses enter every enter_every frames, through the
+# splash screens into the menus.
+# Run from repo root:
+# python src/run_headless.py --sessions 8 --frames 1200 --report out.json
+
+parser: ArgumentParser = ArgumentParser()
+parser.add_argument("--sessions", type=int, default=8)
+parser.add_argument("--frames", type=int, default=1200)
+parser.add_argument("--workers", type=int, default=None)
+parser.add_argument("--scene", default="CreatedBySplashScreen")
+parser.add_argument("--enter-every", type=int, default=90)
+parser.add_argument("--report", default=None, help="full report json path")
+
+if __name__ == "__main__":
+    args: Any = parser.parse_args()
+    sessions: List[Dict[str, Any]] = []
+    for index in range(args.sessions):
+        inputs: List[List[Any]] = []
+        # Offset each session a bit, so they do not all do the same.
+        for frame in range(index, args.frames, args.enter_every):
+            inputs.append([frame, "down", "enter"])
+            inputs.append([frame + 1, "up", "enter"])
+        sessions.append(
+            {
+                "initial_scene": args.scene,
+                "frames": args.frames,
+                "inputs": inputs,
+            }
+        )
+
+    report: Dict[str, Any] = HeadlessRunner(args.workers).run(sessions)
+    print(
+        f"{report['sessions_len']} sessions, {report['failed_len']} failed, "
+        f"{report['workers_len']} workers, {report['frames']} frames in "
+        f"{report['seconds']:.1f} s, {report['frames_per_second']:.0f} fps"
+    )
+    for run in report["runs"]:
+        if run["error"] is not None:
+            print(run["error"])
+
+    if args.report is not None:
+        with open(args.report, "w") as report_json:
+            dump(report, report_json, indent=2)
@@ -0,0 +1,188 @@
+from typing import List
+from typing import TYPE_CHECKING
+
+from constants import FONT
+from constants import NATIVE_HEIGHT
+from constants import NATIVE_RECT
+from constants import NATIVE_SURF
+from constants import NATIVE_WIDTH
+from constants import pg
+from constants import PNGS_PATHS_DICT
+from constants import WAVS_PATHS_DICT
+from nodes.curtain import Curtain
+from typeguard import typechecked
+
+
+if TYPE_CHECKING:
+    from nodes.game import Game
+
+
+@typechecked
+class LoadingScreen:
+    """
+    Decodes every png and wav on the asset loader pool, shows progress.
+    Fades out to the title screen when done.
+
+    States:
+    - LOADING.
+    - GOING_TO_OPAQUE.
+    - REACHED_OPAQUE.
+
+    Parameters:
+    - game:
+        - asset loader.
+        - set scene.
+        - debug draw.
+
+    Update:
+    - state machine.
+
+    Draw:
+    - clear NATIVE_SURF.
+    - progress text.
+    - progress bar.
+    - curtain.
+    """
+
+    LOADING: int = 0
+    GOING_TO_OPAQUE: int = 1
+    REACHED_OPAQUE: int = 2
+
+    # REMOVE IN BUILD
+    state_names: List = [
+        "LOADING",
+        "GOING_TO_OPAQUE",
+        "REACHED_OPAQUE",
+    ]
+
+    def __init__(self, game: "Game"):
+        self.game = game
+
+        self.initial_state: int = self.LOADING
+
+        self.native_clear_color: str = "#000000"
+        self.font_color: str = "#ffffff"
+
+        self.curtain_duration: float = 500.0
+        self.curtain_start: int = Curtain.INVISIBLE
+        self.curtain_max_alpha: int = 255
+        self.curtain_is_invisible: bool = False
+        self.curtain: Curtain = Curtain(
+            self.curtain_duration,
+            self.curtain_start,
+            self.curtain_max_alpha,
+            (NATIVE_WIDTH, NATIVE_HEIGHT),
+            self.curtain_is_invisible,
+            self.native_clear_color,
+        )
+        self.curtain.add_event_listener(
+            self.on_curtain_opaque, Curtain.OPAQUE_END
+        )
+
+        self.progress_text: str = "loading 0%"
+        self.progress_rect: pg.Rect = FONT.get_rect("loading 100%")
+        self.progress_rect.center = NATIVE_RECT.center
+        self.progress_rect.y -= 4
+
+        self.bar_rect: pg.Rect = pg.Rect(0, 0, 96, 3)
+        self.bar_rect.center = NATIVE_RECT.center
+        self.bar_rect.y += 4
+        self.bar_fill_rect: pg.Rect = self.bar_rect.copy()
+        self.bar_fill_rect.width = 0
+
+        for png_name in PNGS_PATHS_DICT:
+            self.game.asset_loader.add_png(png_name)
+        for wav_name in WAVS_PATHS_DICT:
+            self.game.asset_loader.add_wav(wav_name)
+        self.game.asset_loader.start()
+
+        self.state: int = self.initial_state
+
+    # Callbacks.
+    def on_curtain_opaque(self) -> None:
+        self.set_state(self.REACHED_OPAQUE)
+
+    def draw(self) -> None:
+        """
+        Draw:
+        - clear NATIVE_SURF.
+        - progress text.
+        - progress bar.
+        - curtain.
+        """
+
+        NATIVE_SURF.fill(self.native_clear_color)
+        FONT.render_to(
+            NATIVE_SURF,
+            self.progress_rect,
+            self.progress_text,
+            self.font_color,
+        )
+        pg.draw.rect(NATIVE_SURF, self.font_color, self.bar_rect, 1)
+        pg.draw.rect(NATIVE_SURF, self.font_color, self.bar_fill_rect)
+        self.curtain.draw(NATIVE_SURF, 0)
+
+    def update(self, dt: int) -> None:
+        """
+        Update:
+        - state machine.
+        """
+
+        # REMOVE IN BUILD
+        self.game.debug_draw.add(
+            {
+                "type": "text",
+                "layer": 6,
+                "x": 0,
+                "y": 6,
+                "text": (
+                    f"loading screen state "
+                    f"state: {self.state_names[self.state]}"
+                ),
+            }
+        )
+
+        if self.state == self.LOADING:
+            """
+            - Finalizes finished decodes.
+            - Updates progress.
+            - All done? Exit to GOING_TO_OPAQUE state.
+            """
+
+            self.game.asset_loader.update(dt)
+            progress: float = self.game.asset_loader.get_progress()
+            self.progress_text = f"loading {int(progress * 100)}%"
+            self.bar_fill_rect.width = int(self.bar_rect.width * progress)
+
+            if self.game.asset_loader.is_done():
+                self.set_state(self.GOING_TO_OPAQUE)
+
+        elif self.state == self.GOING_TO_OPAQUE:
+            """
+            - Updates curtain alpha.
+            """
+
+            self.curtain.update(dt)
+
+        elif self.state == self.REACHED_OPAQUE:
+            """
+            - Goes to title screen.
+            """
+
+            self.game.set_scene("TitleScreen")
+
+    def set_state(self, value: int) -> None:
+        old_state: int = self.state
+        self.state = value
+
+        # From LOADING.
+        if old_state == self.LOADING:
+            # To GOING_TO_OPAQUE.
+            if self.state == self.GOING_TO_OPAQUE:
+                self.curtain.go_to_opaque()
+
+        # From GOING_TO_OPAQUE.
+        elif old_state == self.GOING_TO_OPAQUE:
+            # To REACHED_OPAQUE.
+            if self.state == self.REACHED_OPAQUE:
+                NATIVE_SURF.fill("black")
@@ -99,7 +99,7 @@ class MadeWithSplashScreen:
         self.set_state(self.GOING_TO_INVISIBLE)
 
     def on_exit_delay_timer_end(self) -> None:
-        self.game.set_scene("TitleScreen")
+        self.game.set_scene("LoadingScreen")
 
     def on_screen_time_timer_end(self) -> None:
         self.set_state(self.GOING_TO_OPAQUE)
@@ -5,9 +5,10 @@ from constants import NATIVE_HEIGHT
 from constants import NATIVE_SURF
 from constants import NATIVE_WIDTH
 from constants import pg
-from constants import PNGS_PATHS_DICT
+from nodes.atlas import Atlas
 from nodes.button import Button
 from nodes.button_container import ButtonContainer
+from nodes.cached_layer import CachedLayer
 from nodes.curtain import Curtain
 from nodes.timer import Timer
 from typeguard import typechecked
@@ -78,10 +79,17 @@ class MainMenu:
             self.on_exit_delay_timer_end, Timer.END
         )
 
-        self.background_surf: pg.Surface = pg.image.load(
-            PNGS_PATHS_DICT["main_menu_background.png"]
+        self.background_surf: pg.Surface = Atlas.get_surf(
+            "main_menu_background.png"
         )
 
+        # Background as an opaque copy, the atlas surf has per pixel
+        # alpha, slow to blit full screen every frame.
+        self.background_layer: CachedLayer = CachedLayer(
+            (NATIVE_WIDTH, NATIVE_HEIGHT), False, self.native_clear_color
+        )
+        self.background_layer.add_child(self.draw_background)
+
         self.new_game_button: Button = Button(
             (48, 9), (30, 94), "new game", (4, 2), "start a new game"
         )
@@ -156,8 +164,11 @@ class MainMenu:
         elif self.exit_button == self.selected_button:
             self.set_state(self.GOING_TO_OPAQUE)
 
+    def draw_background(self, surf: pg.Surface) -> None:
+        surf.blit(self.background_surf, (0, 0))
+
     def draw(self) -> None:
-        NATIVE_SURF.blit(self.background_surf, (0, 0))
+        self.background_layer.draw(NATIVE_SURF)
         self.button_container.draw(NATIVE_SURF)
         self.curtain.draw(NATIVE_SURF, 0)
 
@@ -7,7 +7,7 @@ from constants import NATIVE_RECT
 from constants import NATIVE_SURF
 from constants import NATIVE_WIDTH
 from constants import pg
-from constants import PNGS_PATHS_DICT
+from nodes.atlas import Atlas
 from nodes.curtain import Curtain
 from nodes.timer import Timer
 from typeguard import typechecked
@@ -80,8 +80,8 @@ class TitleScreen:
             self.on_exit_delay_timer_end, Timer.END
         )
 
-        self.gestalt_illusion_logo_surf: pg.Surface = pg.image.load(
-            PNGS_PATHS_DICT["gestalt_illusion_logo.png"]
+        self.gestalt_illusion_logo_surf: pg.Surface = Atlas.get_surf(
+            "gestalt_illusion_logo.png"
         )
         self.gestalt_illusion_logo_rect: pg.Rect = (
             self.gestalt_illusion_logo_surf.get_rect()
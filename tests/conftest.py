@@ -0,0 +1,11 @@
+from os import environ
+from os.path import dirname
+from os.path import join
+from sys import path
+
+# Dummy SDL drivers before constants runs pg.init, no window or audio.
+environ.setdefault("SDL_VIDEODRIVER", "dummy")
+environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+# Modules import each other from src, like main.py does.
+path.insert(0, join(dirname(dirname(__file__)), "src"))
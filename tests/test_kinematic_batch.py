@@ -0,0 +1,132 @@
+from typing import List
+
+import numpy as np
+from constants import TILE_HEIGHT
+from constants import TILE_WIDTH
+from nodes.kinematic_batch import KinematicBatch
+from nodes.kinematic_body import KinematicBody
+from nodes.tile_grid import TileGrid
+
+# KinematicBatch vectorizes TileGrid.move_x, move_y and the
+# KinematicBody update by hand, these keep them equal.
+# Run from repo root: python -m pytest tests.
+
+COLS: int = 40
+ROWS: int = 20
+BODY_SIZE: tuple[int, int] = (12, 14)
+ENVS_LEN: int = 64
+FRAMES_LEN: int = 600
+MOVES_LEN: int = 2000
+
+
+def make_tiles(rng: np.random.Generator) -> np.ndarray:
+    """
+    Floor, slopes, a one way platform, walls and steps, shuffled a bit.
+    """
+
+    tiles: np.ndarray = np.zeros((ROWS, COLS), np.uint8)
+    tiles[15:] = TileGrid.SOLID
+    shift: int = int(rng.integers(0, 4))
+    up_rights: slice = slice(5 + shift, 10 + shift)
+    up_lefts: slice = slice(20 - shift, 25 - shift)
+    tiles[14, up_rights] = TileGrid.SLOPE_UP_RIGHT
+    tiles[14, up_lefts] = TileGrid.SLOPE_UP_LEFT
+    tiles[10, 12:18] = TileGrid.ONE_WAY
+    tiles[12:15, 30 + shift] = TileGrid.SOLID
+    tiles[14, 34] = TileGrid.SOLID
+    tiles[8, 0:COLS:7] = TileGrid.SOLID
+    return tiles
+
+
+def make_bodies(tiles: np.ndarray) -> List[KinematicBody]:
+    bodies: List[KinematicBody] = []
+    for env_tiles in tiles:
+        grid: TileGrid = TileGrid(COLS, ROWS)
+        grid.set_tiles(env_tiles)
+        bodies.append(KinematicBody(grid, (100.0, 150.0), BODY_SIZE))
+    return bodies
+
+
+def make_batch(rng: np.random.Generator) -> KinematicBatch:
+    """
+    ENVS_LEN envs at random spots, each on its own random tiles.
+    """
+
+    tiles: np.ndarray = np.stack([make_tiles(rng) for _ in range(ENVS_LEN)])
+    batch: KinematicBatch = KinematicBatch(
+        make_bodies(tiles[:1])[0], ENVS_LEN, tiles
+    )
+    batch.xs = rng.uniform(-TILE_WIDTH, (COLS + 1) * TILE_WIDTH, ENVS_LEN)
+    batch.ys = rng.uniform(-TILE_HEIGHT, (ROWS + 1) * TILE_HEIGHT, ENVS_LEN)
+    return batch
+
+
+def test_move_x_matches_tile_grid() -> None:
+    rng: np.random.Generator = np.random.default_rng(0)
+    for _ in range(MOVES_LEN // ENVS_LEN):
+        batch: KinematicBatch = make_batch(rng)
+        dxs: np.ndarray = rng.uniform(-2, 2, ENVS_LEN) * TILE_WIDTH
+        dxs[::8] = 0
+        step_heights: np.ndarray = rng.choice(
+            [0.0, batch.step_height], ENVS_LEN
+        )
+        new_xs, is_hits = batch.move_x(dxs, step_heights)
+        for env, body in enumerate(make_bodies(batch.tiles)):
+            assert body.grid.move_x(
+                float(batch.xs[env]),
+                float(batch.ys[env]),
+                batch.width,
+                batch.height,
+                float(dxs[env]),
+                float(step_heights[env]),
+            ) == (new_xs[env], is_hits[env])
+
+
+def test_move_y_matches_tile_grid() -> None:
+    rng: np.random.Generator = np.random.default_rng(1)
+    for _ in range(MOVES_LEN // ENVS_LEN):
+        batch: KinematicBatch = make_batch(rng)
+        dys: np.ndarray = rng.uniform(-2, 2, ENVS_LEN) * TILE_HEIGHT
+        dys[::8] = 0
+        new_ys, is_hits = batch.move_y(dys)
+        for env, body in enumerate(make_bodies(batch.tiles)):
+            assert body.grid.move_y(
+                float(batch.xs[env]),
+                float(batch.ys[env]),
+                batch.width,
+                batch.height,
+                float(dys[env]),
+            ) == (new_ys[env], is_hits[env])
+
+
+def test_step_matches_bodies() -> None:
+    rng: np.random.Generator = np.random.default_rng(2)
+    tiles: np.ndarray = np.stack([make_tiles(rng) for _ in range(ENVS_LEN)])
+    bodies: List[KinematicBody] = make_bodies(tiles)
+    batch: KinematicBatch = KinematicBatch(bodies[0], ENVS_LEN, tiles)
+    for _ in range(FRAMES_LEN):
+        actions: np.ndarray = rng.integers(0, 16, ENVS_LEN)
+        for body, action in zip(bodies, actions.tolist()):
+            body.direction = bool(action & KinematicBatch.RIGHT) - bool(
+                action & KinematicBatch.LEFT
+            )
+            body.is_jump_just_pressed = bool(
+                action & KinematicBatch.JUMP_PRESS
+            )
+            body.is_jump_just_released = bool(
+                action & KinematicBatch.JUMP_RELEASE
+            )
+            body.update(16)
+        batch.step(actions)
+
+        assert np.array_equal(batch.xs, [body.x for body in bodies])
+        assert np.array_equal(batch.ys, [body.y for body in bodies])
+        assert np.array_equal(
+            batch.is_on_floors, [body.is_on_floor for body in bodies]
+        )
+        assert np.array_equal(
+            batch.is_on_walls, [body.is_on_wall for body in bodies]
+        )
+        assert np.array_equal(
+            batch.is_on_ceilings, [body.is_on_ceiling for body in bodies]
+        )
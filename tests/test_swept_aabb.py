@@ -0,0 +1,67 @@
+from typing import List
+from typing import Tuple
+
+import numpy as np
+import pytest
+from nodes.swept_aabb import SweptAabb
+from nodes.tile_grid import TileGrid
+
+# SweptAabb.sweep_tiles sweeps few tiles in plain python and many in
+# NumPy, these keep both paths equal.
+# Run from repo root: python -m pytest tests.
+
+COLS: int = 60
+ROWS: int = 20
+SWEEPS_LEN: int = 2000
+
+
+def sweep_both(
+    grid: TileGrid,
+    monkeypatch: pytest.MonkeyPatch,
+    move: Tuple[float, float, float, float, float, float],
+) -> Tuple[Tuple[float, float, float], Tuple[float, float, float]]:
+    """
+    Returns the scalar path hit, then the NumPy path hit.
+    """
+
+    monkeypatch.setattr(SweptAabb, "SCALAR_LIMIT", COLS * ROWS)
+    scalar: Tuple[float, float, float] = SweptAabb.sweep_tiles(grid, *move)
+    monkeypatch.setattr(SweptAabb, "SCALAR_LIMIT", -1)
+    vector: Tuple[float, float, float] = SweptAabb.sweep_tiles(grid, *move)
+    return scalar, vector
+
+
+def test_one_way_row_from_below(monkeypatch: pytest.MonkeyPatch) -> None:
+    # Many ONE_WAY tiles hit on their side, none of them block.
+    grid: TileGrid = TileGrid(COLS, ROWS)
+    grid.tiles[5, 10:41] = TileGrid.ONE_WAY
+
+    scalar, vector = sweep_both(grid, monkeypatch, (60, 71, 8, 8, 400, 40))
+    assert scalar == (1.0, 0.0, 0.0)
+    assert vector == scalar
+
+
+def test_random_grids(monkeypatch: pytest.MonkeyPatch) -> None:
+    rng: np.random.Generator = np.random.default_rng(0)
+    grid: TileGrid = TileGrid(COLS, ROWS)
+    kinds: List[int] = [
+        TileGrid.EMPTY,
+        TileGrid.SOLID,
+        TileGrid.ONE_WAY,
+    ]
+
+    for _ in range(SWEEPS_LEN):
+        grid.tiles[:] = rng.choice(
+            kinds, (ROWS, COLS), p=[0.7, 0.15, 0.15]
+        ).astype(np.uint8)
+        move: Tuple[float, float, float, float, float, float] = (
+            float(rng.uniform(0, COLS * 16)),
+            float(rng.uniform(0, ROWS * 16)),
+            float(rng.integers(4, 17)),
+            float(rng.integers(4, 17)),
+            float(rng.uniform(-300, 300)),
+            float(rng.uniform(-300, 300)),
+        )
+        scalar, vector = sweep_both(grid, monkeypatch, move)
+        assert vector[0] == pytest.approx(scalar[0]), move
+        assert vector[1:] == scalar[1:], move